@@ -0,0 +1,67 @@
+"""review list indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op  # 导入Alembic操作
+import sqlalchemy as sa  # 导入SQLAlchemy
+
+# revision identifiers, used by Alembic.
+revision = '002'  # 修订ID
+down_revision = '001'  # 前一个修订ID
+branch_labels = None  # 分支标签
+depends_on = None  # 依赖关系
+
+# 评价列表查询使用的复合索引（名称, 表名, 建索引语句）
+# merchant_reviews、review_replies由Supabase管理，不在本迁移链中创建，表不存在时跳过对应索引
+REVIEW_LIST_INDEXES = [
+    # 商户评价列表：按商户+状态过滤、按创建时间倒序分页，INCLUDE评分以便评分过滤直接走索引
+    ('idx_merchant_reviews_merchant_created', 'merchant_reviews',
+     'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_merchant_reviews_merchant_created '
+     'ON merchant_reviews (merchant_id, status, created_at DESC) INCLUDE (rating)'),
+    # 商户评价列表：按评分过滤
+    ('idx_merchant_reviews_merchant_rating', 'merchant_reviews',
+     'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_merchant_reviews_merchant_rating '
+     'ON merchant_reviews (merchant_id, rating, created_at DESC)'),
+    # 评价回复：按评价ID批量查询回复
+    ('idx_review_replies_review_created', 'review_replies',
+     'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_review_replies_review_created '
+     'ON review_replies (review_id, created_at)'),
+    # 内容评价列表：按目标实体+状态过滤、按创建时间倒序分页
+    ('idx_contents_target_status_created', 'contents',
+     'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contents_target_status_created '
+     'ON contents (target_entity_type, target_entity_id, status, created_at DESC)'),
+    # 内容评价列表：按作者+状态过滤
+    ('idx_contents_author_status_created', 'contents',
+     'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contents_author_status_created '
+     'ON contents (author_id, status, created_at DESC)'),
+    # 内容评价列表：按评分范围过滤和排序
+    ('idx_reviews_overall_rating', 'reviews',
+     'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reviews_overall_rating '
+     'ON reviews (overall_rating)'),
+]
+
+
+def _table_exists(table_name: str) -> bool:
+    """检查表是否存在"""
+    return op.get_bind().execute(
+        sa.text("SELECT to_regclass(:table_name)"), {"table_name": table_name}
+    ).scalar() is not None
+
+
+def upgrade() -> None:
+    """升级数据库 - 创建评价列表查询索引"""
+    # CONCURRENTLY不能在事务中执行，使用自动提交块避免建索引期间锁表
+    with op.get_context().autocommit_block():
+        for _, table_name, statement in REVIEW_LIST_INDEXES:
+            if _table_exists(table_name):
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    """降级数据库 - 删除评价列表查询索引"""
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in reversed(REVIEW_LIST_INDEXES):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}')
@@ -1,6 +1,7 @@
 商家板块5数据分析
 from datetime import date, timedelta
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.core.logging import logger
 from app.core.exceptions import NotFoundException
@@ -11,9 +12,9 @@ from app.schemas.analytics import (
 )
 from app.api.dependencies import get_analytics_service, get_authenticated_user
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)  # 使用orjson序列化响应
 
-@router.get("/alerts", response_model=AlertSummaryResponse)
+@router.get("/alerts", response_model=AlertSummaryResponse, response_model_exclude_none=True)
 async def get_alerts(
     business_date: Optional[date] = Query(None, description="业务日期，默认为今天"),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
@@ -33,7 +34,7 @@ async def get_alerts(
         logger.error(f"Failed to fetch alerts: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/snapshot", response_model=BusinessSnapshotResponse)
+@router.get("/snapshot", response_model=BusinessSnapshotResponse, response_model_exclude_none=True)
 async def get_business_snapshot(
     business_date: Optional[date] = Query(None, description="业务日期，默认为今天"),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
@@ -53,7 +54,7 @@ async def get_business_snapshot(
         logger.error(f"Failed to fetch business snapshot: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/competitors", response_model=CompetitorAnalysisResponse)
+@router.get("/competitors", response_model=CompetitorAnalysisResponse, response_model_exclude_none=True)
 async def get_competitor_analysis(
     business_date: Optional[date] = Query(None, description="业务日期，默认为今天"),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
@@ -73,7 +74,7 @@ async def get_competitor_analysis(
         logger.error(f"Failed to fetch competitor analysis: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/marketing/roi", response_model=MarketingROIResponse)
+@router.get("/marketing/roi", response_model=MarketingROIResponse, response_model_exclude_none=True)
 async def get_marketing_roi(
     days: int = Query(30, description="分析天数", ge=1, le=365),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
@@ -88,7 +89,7 @@ async def get_marketing_roi(
         logger.error(f"Failed to fetch marketing ROI: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/revenue/trends", response_model=RevenueAnalysisResponse)
+@router.get("/revenue/trends", response_model=RevenueAnalysisResponse, response_model_exclude_none=True)
 async def get_revenue_trends(
     start_date: date = Query(..., description="开始日期"),
     end_date: date = Query(..., description="结束日期"),
@@ -110,7 +111,7 @@ async def get_revenue_trends(
         logger.error(f"Failed to fetch revenue trends: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/reviews/summary", response_model=ReviewSummaryResponse)
+@router.get("/reviews/summary", response_model=ReviewSummaryResponse, response_model_exclude_none=True)
 async def get_review_summary(
     start_date: Optional[date] = Query(None, description="开始日期"),
     end_date: Optional[date] = Query(None, description="结束日期"),
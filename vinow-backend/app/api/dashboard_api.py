@@ -98,6 +98,7 @@ async def export_orders_data(
     商家板块5数据分析
     from datetime import date
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.core.logging import logger
 from app.core.exceptions import NotFoundException
@@ -105,9 +106,9 @@ from app.services.analytics import AnalyticsService
 from app.schemas.analytics import DashboardResponse
 from app.api.dependencies import get_analytics_service, get_authenticated_user
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)  # 使用orjson序列化响应
 
-@router.get("/dashboard", response_model=DashboardResponse)
+@router.get("/dashboard", response_model=DashboardResponse, response_model_exclude_none=True)
 async def get_dashboard(
     business_date: Optional[date] = Query(None, description="业务日期，默认为今天"),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
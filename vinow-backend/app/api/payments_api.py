@@ -1,10 +1,13 @@
 交易系统
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Request, BackgroundTasks
 from typing import Optional, Dict, Any
 from datetime import datetime
 import json
 from app.schemas.payment_schemas import PaymentCreate, PaymentResponse, PaymentCallback
+from app.schemas.payment_examples import (
+    PAYMENT_CREATE_EXAMPLES, PAYMENT_CALLBACK_EXAMPLES, PAYMENT_RESPONSE_EXAMPLE
+)
 from app.services.payment_service import PaymentService
 from app.services.order_service import OrderService
 from app.auth.middleware_auth import JWTBearer
@@ -54,7 +57,7 @@ rate_limiter.set_route_limit("/api/v1/payments/callback", 500, 60)  # 回调每
     }
 )
 async def create_payment(
-    payment_data: PaymentCreate,
+    payment_data: PaymentCreate = Body(..., openapi_examples=PAYMENT_CREATE_EXAMPLES),
     user_info: dict = Depends(JWTBearer()),
     background_tasks: BackgroundTasks = None,
     request: Request = None
@@ -153,8 +156,8 @@ async def create_payment(
 )
 async def payment_callback(
     gateway: str,  # 支付网关标识（如momo, zalopay, vnpay）
-    callback_data: PaymentCallback,
     request: Request,
+    callback_data: PaymentCallback = Body(..., openapi_examples=PAYMENT_CALLBACK_EXAMPLES),
     background_tasks: BackgroundTasks = None
 ):
     """
@@ -265,7 +268,10 @@ async def payment_callback(
     summary="获取支付详情",
     description="根据支付ID获取支付记录的详细信息",
     responses={
-        200: {"description": "获取支付详情成功"},
+        200: {
+            "description": "获取支付详情成功",
+            "content": {"application/json": {"example": PAYMENT_RESPONSE_EXAMPLE}}
+        },
         401: {"description": "未授权访问"},
         404: {"description": "支付记录不存在"},
         500: {"description": "服务器内部错误"}
@@ -347,7 +353,10 @@ async def get_payment(
     summary="根据订单ID获取支付信息",
     description="根据订单ID获取对应的支付记录信息",
     responses={
-        200: {"description": "获取支付信息成功"},
+        200: {
+            "description": "获取支付信息成功",
+            "content": {"application/json": {"example": PAYMENT_RESPONSE_EXAMPLE}}
+        },
         401: {"description": "未授权访问"},
         404: {"description": "支付记录不存在"},
         500: {"description": "服务器内部错误"}
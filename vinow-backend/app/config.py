@@ -116,6 +116,9 @@ class Settings(BaseSettings):
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
     DB_POOL_SIZE: int = Field(20, env="DB_POOL_SIZE")
     DB_MAX_OVERFLOW: int = Field(10, env="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT: int = Field(30, env="DB_POOL_TIMEOUT")  # 等待空闲连接的超时时间(秒)
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")  # 连接回收周期(秒)
+    DB_USE_PGBOUNCER: bool = Field(False, env="DB_USE_PGBOUNCER")  # 是否经由PgBouncer事务池连接
     
     # 安全配置
     SECRET_KEY: str = Field(..., env="SECRET_KEY")
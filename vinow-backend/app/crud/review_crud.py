@@ -9,12 +9,20 @@
 - 评价状态更新
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from supabase import Client
 from app.schemas.review import ReviewCreate, ReviewUpdate
 import math
 
+# 时间范围过滤对应的回溯时长（today按当天0点计算，未知取值默认最近一年）
+DATE_RANGE_DELTAS = {
+    "week": timedelta(days=7),     # 最近一周
+    "month": timedelta(days=30),   # 最近一个月
+}
+DEFAULT_DATE_RANGE_DELTA = timedelta(days=365)
+
 class ReviewCRUD:
     """
     评价数据访问层类
@@ -38,7 +46,8 @@ class ReviewCRUD:
         limit: int = 20,
         rating: Optional[int] = None,
         date_range: Optional[str] = None,
-        has_reply: Optional[bool] = None
+        has_reply: Optional[bool] = None,
+        include_total: bool = True
     ) -> Dict[str, Any]:
         """
         获取商户的评价列表，支持多种过滤条件和分页
@@ -50,12 +59,13 @@ class ReviewCRUD:
             rating (Optional[int]): 评分过滤条件（1-5星）
             date_range (Optional[str]): 时间范围过滤（today/week/month/year）
             has_reply (Optional[bool]): 是否有回复过滤条件
+            include_total (bool): 是否统计总记录数，为False时跳过计数，total返回None
             
         Returns:
             Dict[str, Any]: 包含评价列表和分页信息的字典
         """
-        # 构建基础查询条件：指定商户且状态为活跃的评价
-        query = self.db.table("merchant_reviews").select("*")
+        # 构建基础查询条件：指定商户且状态为活跃的评价（需要时由数据库随分页结果一并返回总数）
+        query = self.db.table("merchant_reviews").select("*", count="exact" if include_total else None)
         query = query.eq("merchant_id", merchant_id).eq("status", "active")
         
         # 应用评分过滤器
@@ -71,24 +81,13 @@ class ReviewCRUD:
             if date_range == "today":
                 # 今天：当天0点开始
                 start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif date_range == "week":
-                # 最近一周
-                start_date = end_date - timedelta(days=7)
-            elif date_range == "month":
-                # 最近一个月
-                start_date = end_date - timedelta(days=30)
             else:
-                # 默认：最近一年
-                start_date = end_date - timedelta(days=365)
+                # 查表获取回溯时长
+                start_date = end_date - DATE_RANGE_DELTAS.get(date_range, DEFAULT_DATE_RANGE_DELTA)
             
             # 应用时间范围查询条件
             query = query.gte("created_at", start_date.isoformat()).lte("created_at", end_date.isoformat())
         
-        # 获取符合条件的总记录数
-        count_query = query
-        count_result = count_query.execute()
-        total = len(count_result.data) if count_result.data else 0
-        
         # 应用分页：计算起始索引并设置查询范围
         start_index = (page - 1) * limit
         query = query.range(start_index, start_index + limit - 1)
@@ -96,23 +95,34 @@ class ReviewCRUD:
         # 按创建时间倒序排列（最新的在前）
         query = query.order("created_at", desc=True)
         
-        # 执行查询获取评价数据
-        result = query.execute()
+        # 执行查询获取评价数据（分页在数据库端完成，不再拉取全部记录）
+        # Supabase客户端为同步调用，放到线程中执行，避免阻塞事件循环
+        result = await asyncio.to_thread(query.execute)
         reviews = result.data if result.data else []
+        total = None
+        if include_total:
+            total = result.count if result.count is not None else len(reviews)
+        
+        # 一次查询取回本页所有评价的回复，按评价ID建立索引（避免逐条查询）
+        replies_by_review: Dict[Any, Dict[str, Any]] = {}
+        if reviews:
+            review_ids = [review["id"] for review in reviews]
+            reply_result = await asyncio.to_thread(self.db.table("review_replies").select(
+                "review_id, content, created_at"
+            ).in_("review_id", review_ids).order("created_at").execute)
+            for reply in reply_result.data or []:
+                # 每条评价只保留第一条回复
+                replies_by_review.setdefault(reply["review_id"], reply)
         
         # 处理每条评论的回复信息
         reviews_with_reply = []
         for review in reviews:
-            # 查询该评价是否有回复
-            reply_result = self.db.table("review_replies").select("*").eq("review_id", review["id"]).execute()
-            has_reply_flag = len(reply_result.data) > 0 if reply_result.data else False
+            reply = replies_by_review.get(review["id"])
+            has_reply_flag = reply is not None
             
             # 如果有回复，获取第一条回复的内容和创建时间
-            reply_content = None
-            reply_created_at = None
-            if has_reply_flag and reply_result.data:
-                reply_content = reply_result.data[0].get("content")
-                reply_created_at = reply_result.data[0].get("created_at")
+            reply_content = reply.get("content") if reply else None
+            reply_created_at = reply.get("created_at") if reply else None
             
             # 检查是否满足has_reply过滤条件，不满足则跳过该评价
             if has_reply is not None:
@@ -122,7 +132,6 @@ class ReviewCRUD:
             # 构造包含回复信息的评价数据
             review_data = {
                 **review,
-                "has_reply": has_reply_flag,
                 "reply_content": reply_content,
                 "reply_created_at": reply_created_at
             }
@@ -166,29 +175,34 @@ class ReviewCRUD:
         """
         # 计算今日评价数：从今天0点开始的评价
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_result = self.db.table("merchant_reviews").select(
+        # Supabase客户端为同步调用，各查询放到线程中执行，避免阻塞事件循环
+        today_result = await asyncio.to_thread(self.db.table("merchant_reviews").select(
             "id", count="exact"
         ).eq("merchant_id", merchant_id).eq("status", "active").gte(
             "created_at", today_start.isoformat()
-        ).execute()
+        ).execute)
         
         today_reviews = len(today_result.data) if today_result.data else 0
         
         # 计算待回复评价数：查找没有回复的活跃评价
-        pending_result = self.db.table("merchant_reviews").select(
+        pending_result = await asyncio.to_thread(self.db.table("merchant_reviews").select(
             "id"
-        ).eq("merchant_id", merchant_id).eq("status", "active").execute()
+        ).eq("merchant_id", merchant_id).eq("status", "active").execute)
         
         pending_count = 0
         if pending_result.data:
             for review in pending_result.data:
                 # 检查该评价是否有回复
-                reply_result = self.db.table("review_replies").select("id").eq("review_id", review["id"]).execute()
+                reply_result = await asyncio.to_thread(
+                    self.db.table("review_replies").select("id").eq("review_id", review["id"]).execute
+                )
                 if not reply_result.data:
                     pending_count += 1
         
         # 获取评价统计信息：平均评分、回复率、周趋势等
-        stats_result = self.db.table("review_statistics").select("*").eq("merchant_id", merchant_id).execute()
+        stats_result = await asyncio.to_thread(
+            self.db.table("review_statistics").select("*").eq("merchant_id", merchant_id).execute
+        )
         if stats_result.data:
             stats = stats_result.data[0]
             average_rating = stats.get("average_rating", 0.0)
@@ -221,10 +235,12 @@ class ReviewCRUD:
         Returns:
             bool: 更新成功返回True，否则返回False
         """
-        # 执行更新操作，同时更新状态和更新时间
+        # 单条UPDATE完成归属校验和更新，只返回受影响行数，不回传整行数据
         result = self.db.table("merchant_reviews").update(
-            {"status": status, "updated_at": datetime.utcnow().isoformat()}
+            {"status": status, "updated_at": datetime.utcnow().isoformat()},
+            count="exact",
+            returning="minimal"
         ).eq("id", review_id).eq("merchant_id", merchant_id).execute()
         
-        # 根据更新结果判断是否成功
-        return len(result.data) > 0 if result.data else False
\ No newline at end of file
+        # 根据受影响行数判断是否成功
+        return bool(result.count)
\ No newline at end of file
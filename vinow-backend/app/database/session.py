@@ -0,0 +1,112 @@
+"""
+数据库会话模块
+
+本模块提供SQLAlchemy ORM的声明基类和数据库会话，包括：
+1. 同步引擎、SessionLocal会话工厂及get_db依赖（转码后台任务、健康检查等同步代码使用）
+2. 基于asyncpg的异步引擎、AsyncSessionLocal会话工厂及get_async_db依赖（异步路由使用）
+
+异步会话在等待数据库往返时让出事件循环，单个worker即可同时处理大量并发请求，
+并发上限由连接池决定，而不再受线程数限制。两个引擎均使用常驻的QueuePool连接池，
+请求复用已建立的连接，不再为每个请求重新建立TCP/TLS连接。前置PgBouncer事务池时
+（DB_USE_PGBOUNCER），异步驱动关闭预编译语句缓存并为预编译语句使用唯一名称，避免语句落到其他后端连接上失效或重名。
+"""
+
+import logging
+from typing import AsyncGenerator, Generator
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'Base',
+    'engine',
+    'SessionLocal',
+    'get_db',
+    'async_engine',
+    'AsyncSessionLocal',
+    'get_async_db'
+]
+
+# ORM模型声明基类
+Base = declarative_base()
+
+
+def _with_driver(url: str, driver: str) -> URL:
+    """
+    将PostgreSQL连接串切换为指定驱动
+
+    DATABASE_URL可能以同步或异步驱动的形式给出，同步引擎和异步引擎各自使用对应的驱动
+
+    Args:
+        url: 数据库连接串
+        driver: 驱动名称，如psycopg2、asyncpg
+
+    Returns:
+        使用指定驱动的连接URL
+    """
+    return make_url(url).set(drivername=f"postgresql+{driver}")
+
+
+# 连接池参数（同步、异步引擎共用）
+_POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": True
+}
+
+# 同步引擎和会话工厂
+engine = create_engine(_with_driver(settings.DATABASE_URL, "psycopg2"), **_POOL_OPTIONS)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 异步引擎和会话工厂
+_async_url = _with_driver(settings.DATABASE_URL, "asyncpg")
+_async_connect_args = {}
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer事务池模式下同一会话的语句可能落到不同后端连接，关闭asyncpg和SQLAlchemy两级预编译语句缓存；
+    # 方言仍会创建命名预编译语句，默认的__asyncpg_stmt_N__名称在不同后端连接间会冲突，改用唯一名称
+    _async_url = _async_url.update_query_dict({"prepared_statement_cache_size": "0"})
+    _async_connect_args["statement_cache_size"] = 0
+    _async_connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+async_engine = create_async_engine(_async_url, connect_args=_async_connect_args, **_POOL_OPTIONS)
+# 提交后不使对象过期，避免在异步上下文中访问属性时触发隐式查询
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+def get_db() -> Generator[Session, None, None]:
+    """
+    获取同步数据库会话依赖
+
+    Yields:
+        数据库会话对象
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    获取异步数据库会话依赖
+
+    Yields:
+        异步数据库会话对象
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"数据库会话异常: {str(e)}")
+            await db.rollback()
+            raise
@@ -1,4 +1,7 @@
 内容模块-健康检查
+import logging
+import time
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -8,47 +11,41 @@ from app.utils.cache import cache_redis
 from app.schemas.response_schemas import HealthCheckResponse
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check(db: Session = Depends(get_db)):
     """综合健康检查"""
-    services_status = {}
+    database_ok = True
+    cache_status = {"status": "healthy", "message": "Redis连接正常"}
     
     # 检查数据库连接
     try:
         db.execute(text("SELECT 1"))
-        services_status["database"] = "healthy"
     except Exception as e:
-        services_status["database"] = f"unhealthy: {str(e)}"
+        database_ok = False
+        logger.error(f"Database health check failed: {str(e)}")
     
     # 检查Redis连接
     try:
-        if await cache_redis.ping():
-            services_status["redis"] = "healthy"
-        else:
-            services_status["redis"] = "unhealthy"
-    except Exception as e:
-        services_status["redis"] = f"unhealthy: {str(e)}"
-    
-    # 检查存储服务
-    try:
-        # 这里可以添加存储服务的健康检查
-        services_status["storage"] = "healthy"
+        if not await cache_redis.ping():
+            cache_status = {"status": "unhealthy", "message": "Redis ping失败"}
     except Exception as e:
-        services_status["storage"] = f"unhealthy: {str(e)}"
+        cache_status = {"status": "unhealthy", "message": str(e)}
     
     # 确定整体状态
-    overall_status = "healthy" if all(
-        status == "healthy" for status in services_status.values()
-    ) else "unhealthy"
+    overall_status = "healthy" if database_ok and cache_status["status"] == "healthy" else "unhealthy"
     
     return HealthCheckResponse(
         status=overall_status,
-        timestamp=datetime.utcnow(),
-        services=services_status,
-        version=settings.APP_VERSION
+        timestamp=time.time(),
+        version=settings.APP_VERSION,
+        environment=settings.ENVIRONMENT,
+        database={"sqlalchemy": database_ok},
+        cache=cache_status
     )
 
 
@@ -286,7 +286,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
   import logging
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple, Tuple
 import time
 
 from app.utils.security import verify_token
@@ -296,6 +296,14 @@ from app.utils.exceptions import AuthenticationException, AuthorizationException
 logger = logging.getLogger(__name__)
 
 
+class AuthUser(NamedTuple):
+    """已认证用户（按属性访问，避免在每个处理函数中反复按键取值）"""
+    user_id: str
+    role: str = "user"
+    email: Optional[str] = None
+    permissions: Tuple[str, ...] = ()
+
+
 class JWTBearer(HTTPBearer):
     """JWT Bearer认证"""
     
@@ -361,7 +369,7 @@ class JWTBearer(HTTPBearer):
             return False
 
 
-async def get_current_user(request: Request) -> Dict[str, Any]:
+async def get_current_user(request: Request) -> AuthUser:
     """获取当前用户"""
     auth_header = request.headers.get("Authorization")
     
@@ -383,12 +391,12 @@ async def get_current_user(request: Request) -> Dict[str, Any]:
     if user_status != "active":
         raise AuthorizationException("用户账户不可用")
     
-    return {
-        "user_id": user_id,
-        "role": payload.get("role", "user"),
-        "email": payload.get("email"),
-        "permissions": payload.get("permissions", [])
-    }
+    return AuthUser(
+        user_id=user_id,
+        role=payload.get("role", "user"),
+        email=payload.get("email"),
+        permissions=tuple(payload.get("permissions", ()))
+    )
 
 
 async def get_user_status(user_id: str) -> str:
@@ -404,15 +412,12 @@ async def get_user_status(user_id: str) -> str:
 
 async def require_permission(required_permission: str):
     """权限检查装饰器"""
-    async def permission_dependency(current_user: Dict[str, Any] = Depends(get_current_user)):
-        user_permissions = current_user.get("permissions", [])
-        user_role = current_user.get("role")
-        
+    async def permission_dependency(current_user: AuthUser = Depends(get_current_user)):
         # 管理员拥有所有权限
-        if user_role == "admin":
+        if current_user.role == "admin":
             return current_user
         
-        if required_permission not in user_permissions:
+        if required_permission not in current_user.permissions:
             raise AuthorizationException(f"缺少所需权限: {required_permission}")
         
         return current_user
@@ -422,10 +427,8 @@ async def require_permission(required_permission: str):
 
 async def require_role(required_role: str):
     """角色检查装饰器"""
-    async def role_dependency(current_user: Dict[str, Any] = Depends(get_current_user)):
-        user_role = current_user.get("role")
-        
-        if user_role != required_role:
+    async def role_dependency(current_user: AuthUser = Depends(get_current_user)):
+        if current_user.role != required_role:
             raise AuthorizationException(f"需要{required_role}角色")
         
         return current_user
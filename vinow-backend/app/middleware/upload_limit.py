@@ -0,0 +1,109 @@
+"""
+上传大小限制中间件模块
+
+本模块在读取请求体之前检查媒体上传接口的 Content-Length 请求头，
+超出限制的请求直接返回413，避免将超大请求体读入内存后才失败。
+"""
+
+from typing import Callable, Optional, Dict
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+import logging
+import os
+
+# 获取日志记录器
+logger = logging.getLogger(__name__)
+
+__all__ = ['UploadSizeLimitMiddleware', 'MAX_UPLOAD_BYTES', 'MAX_CHUNK_UPLOAD_BYTES']
+
+# 单文件上传的最大请求体大小（默认5GB）
+MAX_UPLOAD_BYTES = int(os.getenv("MEDIA_MAX_UPLOAD_BYTES", str(5 * 1024 * 1024 * 1024)))
+# 单个分片上传的最大请求体大小（默认33MB：32MB分片 + 表单字段开销）
+MAX_CHUNK_UPLOAD_BYTES = int(os.getenv("MEDIA_MAX_CHUNK_UPLOAD_BYTES", str(33 * 1024 * 1024)))
+
+
+class UploadSizeLimitMiddleware(BaseHTTPMiddleware):
+    """
+    上传大小限制中间件 - 按请求头提前拒绝超大上传
+    """
+
+    def __init__(self, app, limits: Optional[Dict[str, int]] = None):
+        """
+        初始化上传大小限制中间件
+
+        Args:
+            app: FastAPI应用实例
+            limits: 路径后缀到最大请求体字节数的映射
+        """
+        # 调用父类初始化
+        super().__init__(app)
+        # 设置默认限制配置
+        self.limits = limits or {
+            "/media/upload": MAX_UPLOAD_BYTES,  # 单文件上传
+            "/media/upload-chunk": MAX_CHUNK_UPLOAD_BYTES,  # 分片上传
+        }
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        """
+        处理请求分发
+
+        Args:
+            request: 请求对象
+            call_next: 下一个中间件或路由处理函数
+
+        Returns:
+            HTTP响应
+        """
+        # 只检查配置了限制的上传接口
+        max_bytes = self._get_limit(request.url.path)
+        if max_bytes is None:
+            return await call_next(request)
+
+        # 读取请求头中的内容长度（分块传输时没有该请求头，交由存储服务校验）
+        content_length = request.headers.get("content-length")
+        try:
+            size = int(content_length) if content_length else 0
+        except ValueError:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={
+                    "success": False,
+                    "message": "无效的Content-Length请求头",
+                    "error": {"code": "INVALID_CONTENT_LENGTH", "details": content_length},
+                    "data": None
+                }
+            )
+
+        if size > max_bytes:
+            # 记录被拒绝的超大上传
+            logger.warning(f"上传请求体超过限制: {request.url.path}, 大小: {size}字节, 限制: {max_bytes}字节")
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={
+                    "success": False,
+                    "message": "上传文件过大",
+                    "error": {
+                        "code": "PAYLOAD_TOO_LARGE",
+                        "details": f"请求体大小不能超过 {max_bytes} 字节"
+                    },
+                    "data": None
+                }
+            )
+
+        return await call_next(request)
+
+    def _get_limit(self, path: str) -> Optional[int]:
+        """
+        获取请求路径对应的大小限制
+
+        Args:
+            path: 请求路径
+
+        Returns:
+            最大请求体字节数，路径无需限制时返回None
+        """
+        for suffix, max_bytes in self.limits.items():
+            if path.endswith(suffix):
+                return max_bytes
+        return None
@@ -133,19 +133,16 @@ db = SupabaseClient()
 
 from datetime import datetime
 from typing import Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class BaseModelMixin(BaseModel):
+    # Pydantic v2默认将datetime序列化为ISO 8601格式，无需json_encoders
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str = Field(..., description="唯一标识")
     created_at: datetime = Field(default_factory=datetime.now, description="创建时间")
     updated_at: datetime = Field(default_factory=datetime.now, description="更新时间")
     is_deleted: bool = Field(default=False, description="软删除标志")
-    
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 class PaginatedResponse(BaseModel):
     items: list[Any] = Field(..., description="数据列表")
@@ -353,7 +353,7 @@ class ContentInteractionCreate(BaseModel):
     from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from uuid import UUID, uuid4
 
 class ContentType(str, Enum):
@@ -403,6 +403,8 @@ class ContentUpdate(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 class ContentInDB(ContentBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID = Field(default_factory=uuid4)
     creator_id: UUID
     status: ContentStatus = ContentStatus.DRAFT
@@ -417,9 +419,6 @@ class ContentInDB(ContentBase):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     published_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 class ContentResponse(ContentInDB):
     creator_info: Optional[Dict[str, Any]] = None
     quality_score: Optional[float] = None
@@ -1,7 +1,7 @@
 # app/models/order.py
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 class OrderStatus(str, Enum):
@@ -55,17 +55,18 @@ class OrderUpdate(BaseModel):
 
 class OrderInDB(OrderBase):
     """数据库中的订单模型"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str = Field(..., description="订单ID")
     created_at: datetime = Field(..., description="创建时间")
     updated_at: datetime = Field(..., description="更新时间")
     verified_at: Optional[datetime] = Field(None, description="核销时间")
     refunded_at: Optional[datetime] = Field(None, description="退款时间")
-    
-    class Config:
-        from_attributes = True
 
 class OrderListItem(BaseModel):
     """订单列表项模型"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     order_number: str
     user_name: str
@@ -78,9 +79,7 @@ class OrderListItem(BaseModel):
     payment_method: PaymentMethod
     created_at: datetime
     verified_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True"""商家系统 - order_models"""
+"""商家系统 - order_models"""
 
 # TODO: 实现商家系统相关功能
 
@@ -253,7 +253,7 @@ class ProductSearchParams(BaseModel):
     category_id: Optional[str] = Field(None, description="分类ID")
     tag_id: Optional[str] = Field(None, description="标签ID")
     product_type: Optional[ProductType] = Field(None, description="商品类型")
-    status: Optional[ProductStatus] = Field(None, description="商品状态")
+    status: Optional[ProductStatus] = Field(ProductStatus.ACTIVE, description="商品状态")  # 默认只显示上架商品
     min_price: Optional[Decimal] = Field(None, ge=0, description="最低价格")
     max_price: Optional[Decimal] = Field(None, ge=0, description="最高价格")
     in_stock_only: bool = Field(False, description="仅显示有库存")
@@ -16,7 +16,8 @@ from app.schemas.content_schemas import (
     ContentCreateSchema, 
     ContentUpdateSchema, 
     ContentResponseSchema,
-    ContentListResponseSchema
+    ContentListResponseSchema,
+    ContentStandardResponse
 )
 from app.schemas.response_schemas import (
     StandardResponse, 
@@ -40,7 +41,7 @@ logger = logging.getLogger(__name__)
 __all__ = ['router']
 
 
-@router.post("/", response_model=StandardResponse[ContentResponseSchema], status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=ContentStandardResponse, status_code=status.HTTP_201_CREATED)
 async def create_content(
     content_data: ContentCreateSchema,
     background_tasks: BackgroundTasks,
@@ -100,7 +101,7 @@ async def create_content(
         )
 
 
-@router.get("/{content_id}", response_model=StandardResponse[ContentResponseSchema])
+@router.get("/{content_id}", response_model=ContentStandardResponse)
 async def get_content(
     content_id: str,
     current_user: Optional[Dict[str, Any]] = Depends(get_current_user_optional),
@@ -154,7 +155,7 @@ async def get_content(
         )
 
 
-@router.put("/{content_id}", response_model=StandardResponse[ContentResponseSchema])
+@router.put("/{content_id}", response_model=ContentStandardResponse)
 async def update_content(
     content_id: str,
     update_data: ContentUpdateSchema,
@@ -1,11 +1,12 @@
 内容系统
 from typing import List, Optional, Dict, Any  # 导入类型注解
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Request  # 导入FastAPI相关依赖
-from app.schemas.media_schemas import MediaUploadResponseSchema, ChunkedUploadResponseSchema  # 导入媒体上传数据模式
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Request, Response  # 导入FastAPI相关依赖
+from app.schemas.media_schemas import MediaUploadResponseSchema, ChunkedUploadResponseSchema, PresignedUrlRequestSchema  # 导入媒体上传数据模式
 from app.schemas.response_schemas import StandardResponse, create_success_response  # 导入响应模式
 from app.services.storage_service import storage_service  # 导入存储服务
 from app.utils.security import get_current_user  # 导入安全工具
 import logging  # 导入日志模块
+import os  # 导入操作系统模块（读取环境变量）
 import uuid  # 导入UUID生成模块
 
 # 创建媒体上传路由的APIRouter实例
@@ -14,6 +15,48 @@ router = APIRouter(prefix="/media", tags=["media"])
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 存储服务接受的单个分片上限（32MiB）
+MEDIA_MAX_CHUNK_SIZE_BYTES = 32 * 1024 * 1024
+
+# 分片大小环境变量覆盖（0 表示按文件大小自动分档；否则必须是2的幂且不超过32MiB）
+MEDIA_CHUNK_SIZE_BYTES = int(os.getenv("MEDIA_CHUNK_SIZE_BYTES", "0"))
+if (
+    MEDIA_CHUNK_SIZE_BYTES < 0
+    or MEDIA_CHUNK_SIZE_BYTES & (MEDIA_CHUNK_SIZE_BYTES - 1)  # 非2的幂
+    or MEDIA_CHUNK_SIZE_BYTES > MEDIA_MAX_CHUNK_SIZE_BYTES
+):
+    raise ValueError(
+        f"MEDIA_CHUNK_SIZE_BYTES必须为0或不超过{MEDIA_MAX_CHUNK_SIZE_BYTES}的2的幂，当前值: {MEDIA_CHUNK_SIZE_BYTES}"
+    )
+
+# 通用错误提示（异常对象每次抛出时新建，不在并发请求间共享）
+_ERR_UPLOAD_FAIL_DETAIL = "文件上传失败，请稍后重试"
+_ERR_CHUNK_UPLOAD_FAIL_DETAIL = "文件分片上传失败，请稍后重试"
+_ERR_DELETE_FAIL_DETAIL = "文件删除失败，请稍后重试"
+_ERR_PRESIGN_FAIL_DETAIL = "生成访问URL失败，请稍后重试"
+_ERR_INIT_UPLOAD_FAIL_DETAIL = "初始化上传失败，请稍后重试"
+
+
+def _pick_chunk_shift(file_size: int) -> int:
+    """
+    根据文件总大小选择分片大小的位移量（分片大小 = 1 << 位移量）
+    
+    分片大小固定为2的幂，总分片数可以用位移完成向上取整除法；大文件使用更大的分片以减少HTTP请求次数。
+    
+    Args:
+        file_size: 文件大小（字节）
+        
+    Returns:
+        分片大小的位移量
+    """
+    if MEDIA_CHUNK_SIZE_BYTES > 0:
+        return MEDIA_CHUNK_SIZE_BYTES.bit_length() - 1
+    if file_size <= 100 * 1024 * 1024:  # 100MB以内：4MiB
+        return 22
+    if file_size <= 5 * 1024 * 1024 * 1024:  # 5GB以内：8MiB
+        return 23
+    return 25  # 超过5GB：32MiB
+
 @router.post("/upload", response_model=StandardResponse[MediaUploadResponseSchema])
 async def upload_media(
     file: UploadFile = File(..., description="上传的媒体文件"),  # 文件上传参数
@@ -63,10 +106,7 @@ async def upload_media(
         # 记录错误日志
         logger.error(f"媒体文件上传异常: {str(e)}", exc_info=True)
         # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="文件上传失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_UPLOAD_FAIL_DETAIL) from None
 
 @router.post("/upload-chunk", response_model=StandardResponse[ChunkedUploadResponseSchema])
 async def upload_chunked_media(
@@ -123,12 +163,9 @@ async def upload_chunked_media(
         # 记录错误日志
         logger.error(f"文件分片上传异常: {str(e)}", exc_info=True)
         # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="文件分片上传失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_CHUNK_UPLOAD_FAIL_DETAIL) from None
 
-@router.delete("/{file_path:path}", response_model=StandardResponse[bool])
+@router.delete("/{file_path:path}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_media(
     file_path: str,  # 文件路径参数
     current_user: Dict[str, Any] = Depends(get_current_user),  # 当前用户依赖注入
@@ -143,7 +180,7 @@ async def delete_media(
         request: HTTP请求对象
         
     Returns:
-        删除操作结果
+        204 空响应
     """
     try:
         # 从当前用户信息中提取用户ID
@@ -163,11 +200,8 @@ async def delete_media(
         # 记录成功日志
         logger.info(f"媒体文件删除成功: {file_path}, 用户: {user_id}")
         
-        # 返回成功响应
-        return create_success_response(
-            data=True,
-            message="文件删除成功"
-        )
+        # 返回204空响应，无需序列化响应体
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
         
     except HTTPException as e:
         # 重新抛出HTTP异常
@@ -176,15 +210,12 @@ async def delete_media(
         # 记录错误日志
         logger.error(f"删除媒体文件异常: {str(e)}", exc_info=True)
         # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="文件删除失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_DELETE_FAIL_DETAIL) from None
 
 @router.get("/presigned-url/{file_path:path}", response_model=StandardResponse[Dict[str, str]])
 async def generate_presigned_url(
     file_path: str,  # 文件路径参数
-    expires_in: int = Query(3600, ge=60, le=86400, description="URL过期时间（秒）"),  # 过期时间查询参数
+    params: PresignedUrlRequestSchema = Depends(),  # 预签名URL查询参数
     current_user: Dict[str, Any] = Depends(get_current_user),  # 当前用户依赖注入
     request: Request = None  # 请求对象
 ):
@@ -193,7 +224,7 @@ async def generate_presigned_url(
     
     Args:
         file_path: 文件路径
-        expires_in: URL过期时间（秒）
+        params: 预签名URL查询参数（包含过期时间）
         current_user: 当前用户信息
         request: HTTP请求对象
         
@@ -203,6 +234,7 @@ async def generate_presigned_url(
     try:
         # 从当前用户信息中提取用户ID
         user_id = current_user.get("user_id")
+        expires_in = params.expires_in
         
         # 调用存储服务生成预签名URL
         presigned_url = await storage_service.generate_presigned_url(file_path, expires_in)
@@ -231,10 +263,7 @@ async def generate_presigned_url(
         # 记录错误日志
         logger.error(f"生成预签名URL异常: {str(e)}", exc_info=True)
         # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="生成访问URL失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_PRESIGN_FAIL_DETAIL) from None
 
 @router.post("/initiate-upload", response_model=StandardResponse[Dict[str, str]])
 async def initiate_chunked_upload(
@@ -262,12 +291,13 @@ async def initiate_chunked_upload(
         user_id = current_user.get("user_id")
         
         # 生成唯一的上传会话ID
-        upload_id = str(uuid.uuid4())
+        upload_id = uuid.uuid4().hex
         
-        # 计算建议的分片大小（默认为5MB）
-        chunk_size = 5 * 1024 * 1024  # 5MB
-        # 计算总分片数
-        total_chunks = (file_size + chunk_size - 1) // chunk_size
+        # 根据文件大小计算建议的分片大小
+        chunk_shift = _pick_chunk_shift(file_size)
+        chunk_size = 1 << chunk_shift
+        # 计算总分片数（位移实现的向上取整除法）
+        total_chunks = -(-file_size >> chunk_shift)
         
         # 记录初始化日志
         logger.info(f"分片上传初始化: 文件{file_name}, 大小{file_size}字节, 总分片{total_chunks}, 上传ID: {upload_id}, 用户: {user_id}")
@@ -288,7 +318,4 @@ async def initiate_chunked_upload(
         # 记录错误日志
         logger.error(f"初始化分片上传异常: {str(e)}", exc_info=True)
         # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="初始化上传失败，请稍后重试"
-        )
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_INIT_UPLOAD_FAIL_DETAIL) from None
\ No newline at end of file
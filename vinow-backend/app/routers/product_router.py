@@ -3,7 +3,6 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from typing import List, Optional
-from decimal import Decimal
 import logging
 
 from app.services.product_service import ProductService
@@ -20,6 +19,18 @@ router = APIRouter()
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 通用错误提示（异常对象每次抛出时新建，不在并发请求间共享）
+_ERR_CREATE_FAIL_DETAIL = "创建商品失败，请稍后重试"
+_ERR_GET_FAIL_DETAIL = "获取商品失败，请稍后重试"
+_ERR_UPDATE_FAIL_DETAIL = "更新商品失败，请稍后重试"
+_ERR_DELETE_FAIL_DETAIL = "删除商品失败，请稍后重试"
+_ERR_LIST_FAIL_DETAIL = "获取商品列表失败，请稍后重试"
+_ERR_SEARCH_FAIL_DETAIL = "搜索商品失败，请稍后重试"
+_ERR_BULK_STATUS_FAIL_DETAIL = "批量更新状态失败，请稍后重试"
+_ERR_STOCK_FAIL_DETAIL = "更新库存失败，请稍后重试"
+_ERR_PUBLISH_FAIL_DETAIL = "上架商品失败，请稍后重试"
+_ERR_UNPUBLISH_FAIL_DETAIL = "下架商品失败，请稍后重试"
+
 def get_product_service(supabase=Depends(get_supabase_client)) -> ProductService:
     """获取商品服务实例"""
     return ProductService(supabase)
@@ -53,10 +64,7 @@ async def create_product(
         )
     except Exception as e:
         logger.error(f"创建商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="创建商品失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_CREATE_FAIL_DETAIL) from None
 
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(
@@ -79,10 +87,7 @@ async def get_product(
         raise
     except Exception as e:
         logger.error(f"获取商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="获取商品失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_GET_FAIL_DETAIL) from None
 
 @router.put("/{product_id}", response_model=ProductResponse)
 async def update_product(
@@ -119,10 +124,7 @@ async def update_product(
         )
     except Exception as e:
         logger.error(f"更新商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="更新商品失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_UPDATE_FAIL_DETAIL) from None
 
 @router.delete("/{product_id}")
 async def delete_product(
@@ -149,10 +151,7 @@ async def delete_product(
         )
     except Exception as e:
         logger.error(f"删除商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="删除商品失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_DELETE_FAIL_DETAIL) from None
 
 @router.get("/merchant/{merchant_id}", response_model=ProductListResponse)
 async def list_merchant_products(
@@ -191,26 +190,11 @@ async def list_merchant_products(
         raise
     except Exception as e:
         logger.error(f"获取商家商品列表失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="获取商品列表失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_LIST_FAIL_DETAIL) from None
 
 @router.get("/search/public", response_model=ProductListResponse)
 async def search_products(
-    query: Optional[str] = Query(None, description="搜索关键词"),
-    merchant_id: Optional[str] = Query(None, description="商家ID"),
-    category_id: Optional[str] = Query(None, description="分类ID"),
-    product_type: Optional[ProductType] = Query(None, description="商品类型"),
-    status: Optional[ProductStatus] = Query(ProductStatus.ACTIVE, description="商品状态"),  # 修正：默认只显示上架商品
-    min_price: Optional[Decimal] = Query(None, ge=0, description="最低价格"),
-    max_price: Optional[Decimal] = Query(None, ge=0, description="最高价格"),
-    in_stock_only: bool = Query(False, description="仅显示有库存"),
-    is_featured: Optional[bool] = Query(None, description="是否推荐商品"),
-    sort_by: str = Query("created_at", description="排序字段"),
-    sort_order: str = Query("desc", description="排序方向"),
-    page: int = Query(1, ge=1, description="页码"),
-    page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    search_params: ProductSearchParams = Depends(),
     product_service: ProductService = Depends(get_product_service)
 ):
     """
@@ -230,28 +214,10 @@ async def search_products(
     - **page_size**: 每页数量
     """
     try:
-        search_params = ProductSearchParams(
-            query=query,
-            merchant_id=merchant_id,
-            category_id=category_id,
-            product_type=product_type,
-            status=status,
-            min_price=min_price,
-            max_price=max_price,
-            in_stock_only=in_stock_only,
-            is_featured=is_featured,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            page=page,
-            page_size=page_size
-        )
         return await product_service.search_products(search_params)
     except Exception as e:
         logger.error(f"搜索商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="搜索商品失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_SEARCH_FAIL_DETAIL) from None
 
 @router.post("/bulk/status", status_code=status.HTTP_200_OK)
 async def bulk_update_product_status(
@@ -295,10 +261,7 @@ async def bulk_update_product_status(
         )
     except Exception as e:
         logger.error(f"批量更新商品状态失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="批量更新状态失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_BULK_STATUS_FAIL_DETAIL) from None
 
 @router.put("/{product_id}/stock", status_code=status.HTTP_200_OK)
 async def update_product_stock(
@@ -336,10 +299,7 @@ async def update_product_stock(
         )
     except Exception as e:
         logger.error(f"更新商品库存失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="更新库存失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_STOCK_FAIL_DETAIL) from None
 
 @router.post("/{product_id}/publish", response_model=ProductResponse)
 async def publish_product(
@@ -389,10 +349,7 @@ async def publish_product(
         raise
     except Exception as e:
         logger.error(f"上架商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="上架商品失败，请稍后重试"
-        )
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_PUBLISH_FAIL_DETAIL) from None
 
 @router.post("/{product_id}/unpublish", response_model=ProductResponse)
 async def unpublish_product(
@@ -442,7 +399,4 @@ async def unpublish_product(
         raise
     except Exception as e:
         logger.error(f"下架商品失败: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="下架商品失败，请稍后重试"
-        )
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=_ERR_UNPUBLISH_FAIL_DETAIL) from None
\ No newline at end of file
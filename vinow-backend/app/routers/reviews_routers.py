@@ -5,33 +5,67 @@
 本模块定义了商户评价相关的RESTful API接口，包括：
 - 获取评价列表及筛选
 - 获取评价统计概览
+- 获取评价管理首页数据（列表+概览）
 - 创建评价回复
 - 获取回复模板推荐
 - 更新评价状态
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
 from typing import Optional, List
 from app.services.review_service import ReviewService
 from app.services.reply_template_service import ReplyTemplateService
-from app.schemas.review import ReviewListResponse, ReviewSummaryResponse
+from app.schemas.review import ReviewListResponse, ReviewSummaryResponse, ReviewQueryParams
 from app.schemas.reply import ReplyCreate, ReplyResponse
+from app.utils.etag_utils import build_merchant_etag, is_not_modified, not_modified_response, with_cache_headers
+from app.utils.json_response_utils import ModelJSONResponse
 
 # 创建API路由实例，设置路径前缀和标签
-router = APIRouter(prefix="/api/v1/merchants/{merchant_id}/reviews", tags=["reviews"])
+router = APIRouter(
+    prefix="/api/v1/merchants/{merchant_id}/reviews",
+    tags=["reviews"],
+    default_response_class=ORJSONResponse  # 使用orjson序列化响应
+)
+
+# 初始化服务层实例（进程内单例，通过依赖注入提供给路由，便于测试时覆盖）
+_review_service = ReviewService()          # 评价业务服务
+_template_service = ReplyTemplateService() # 回复模板服务
+
+
+def get_review_service() -> ReviewService:
+    """获取评价服务实例"""
+    return _review_service
+
+
+def get_template_service() -> ReplyTemplateService:
+    """获取回复模板服务实例"""
+    return _template_service
 
-# 初始化服务层实例
-review_service = ReviewService()          # 评价业务服务
-template_service = ReplyTemplateService() # 回复模板服务
+
+def _render(model: BaseModel):
+    """
+    输出响应模型
+    
+    服务层构建的模型已经过校验，直接序列化返回；路由仍声明response_model用于OpenAPI文档，
+    返回响应对象时FastAPI不再按response_model二次校验。
+    模型的JSON序列化器在类定义时已编译，ModelJSONResponse由序列化器一次生成字节，不再经过中间字典。
+    
+    Args:
+        model: 响应模型实例
+        
+    Returns:
+        已序列化的JSON响应
+    """
+    return ModelJSONResponse(model)
 
 @router.get("/", response_model=ReviewListResponse)
 async def get_reviews(
     merchant_id: int = Path(..., description="商家ID"),
-    page: int = Query(1, ge=1, description="页码"),
-    limit: int = Query(20, ge=1, le=100, description="每页数量"),
-    rating: Optional[int] = Query(None, ge=1, le=5, description="评分过滤"),
-    date_range: Optional[str] = Query(None, description="时间范围: today/week/month"),
-    has_reply: Optional[bool] = Query(None, description="是否已回复")
+    params: ReviewQueryParams = Depends(),
+    review_service: ReviewService = Depends(get_review_service)
 ):
     """
     获取商户评价列表
@@ -40,11 +74,8 @@ async def get_reviews(
     
     Args:
         merchant_id (int): 商户ID，路径参数
-        page (int): 页码，默认为1，最小值为1
-        limit (int): 每页数量，默认为20，范围1-100
-        rating (Optional[int]): 评分过滤条件，范围1-5星
-        date_range (Optional[str]): 时间范围过滤，可选值: today/week/month
-        has_reply (Optional[bool]): 是否已回复过滤条件
+        params (ReviewQueryParams): 查询参数（页码、每页数量、评分、时间范围、是否已回复、是否返回总数）
+        review_service (ReviewService): 评价业务服务，依赖注入
         
     Returns:
         ReviewListResponse: 包含评价列表和分页信息的响应数据
@@ -56,33 +87,41 @@ async def get_reviews(
         # 调用服务层获取评价列表
         result = await review_service.get_review_list(
             merchant_id=merchant_id,
-            page=page,
-            limit=limit,
-            rating=rating,
-            date_range=date_range,
-            has_reply=has_reply
+            **params.model_dump()
         )
         
-        # 使用响应模型创建标准化响应
-        return ReviewListResponse.create_response(
-            reviews=result["reviews"],
-            total=result["total"],
-            page=result["page"],
-            limit=result["limit"]
+        page_data = {
+            "reviews": result["reviews"],
+            "total": result["total"],
+            "page": result["page"],
+            "limit": result["limit"]
+        }
+        # 直接输出序列化好的JSON字节，不构造响应模型和中间字典
+        return Response(
+            content=ReviewListResponse.create_response_bytes(**page_data),
+            media_type="application/json"
         )
     except Exception as e:
         # 捕获异常并抛出自定义HTTP异常
         raise HTTPException(status_code=500, detail=f"获取评价列表失败: {str(e)}")
 
 @router.get("/summary", response_model=ReviewSummaryResponse)
-async def get_review_summary(merchant_id: int = Path(..., description="商家ID")):
+async def get_review_summary(
+    request: Request,
+    response: Response,
+    merchant_id: int = Path(..., description="商家ID"),
+    review_service: ReviewService = Depends(get_review_service)
+):
     """
     获取商户评价统计概览
     
-    返回商户的关键评价统计数据
+    返回商户的关键评价统计数据，响应携带ETag，客户端数据未变化时返回304
     
     Args:
+        request (Request): 请求对象，用于读取If-None-Match
+        response (Response): 响应对象，用于设置缓存响应头
         merchant_id (int): 商户ID，路径参数
+        review_service (ReviewService): 评价业务服务，依赖注入
         
     Returns:
         ReviewSummaryResponse: 包含评价统计数据的响应数据
@@ -91,20 +130,72 @@ async def get_review_summary(merchant_id: int = Path(..., description="商家ID"
         HTTPException: 当获取评价概览失败时抛出500错误
     """
     try:
+        # 客户端缓存仍有效时直接返回304，不再查询统计数据
+        etag = await build_merchant_etag("reviews:summary", merchant_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        
         # 调用服务层获取评价统计摘要
         summary_data = await review_service.get_review_summary(merchant_id)
         
         # 使用响应模型包装数据
-        return ReviewSummaryResponse(data=summary_data)
+        return with_cache_headers(_render(ReviewSummaryResponse(data=summary_data)), response, etag)
     except Exception as e:
         # 捕获异常并抛出自定义HTTP异常
         raise HTTPException(status_code=500, detail=f"获取评价概览失败: {str(e)}")
 
+@router.get("/dashboard")
+async def get_review_dashboard(
+    merchant_id: int = Path(..., description="商家ID"),
+    params: ReviewQueryParams = Depends(),
+    review_service: ReviewService = Depends(get_review_service)
+):
+    """
+    获取评价管理首页数据
+    
+    一次请求同时返回评价列表和统计概览，两项查询并发执行，省去客户端的第二次HTTP往返
+    
+    Args:
+        merchant_id (int): 商户ID，路径参数
+        params (ReviewQueryParams): 评价列表查询参数
+        review_service (ReviewService): 评价业务服务，依赖注入
+        
+    Returns:
+        dict: 包含评价列表和统计概览的响应数据
+        
+    Raises:
+        HTTPException: 当获取数据失败时抛出500错误
+    """
+    try:
+        # 并发获取评价列表和统计摘要
+        result, summary_data = await asyncio.gather(
+            review_service.get_review_list(merchant_id=merchant_id, **params.model_dump()),
+            review_service.get_review_summary(merchant_id)
+        )
+        
+        # 复用列表和概览接口的响应结构
+        return {
+            "success": True,
+            "data": {
+                "list": ReviewListResponse.create_response_dict(
+                    reviews=result["reviews"],
+                    total=result["total"],
+                    page=result["page"],
+                    limit=result["limit"]
+                )["data"],
+                "summary": summary_data
+            }
+        }
+    except Exception as e:
+        # 捕获异常并抛出自定义HTTP异常
+        raise HTTPException(status_code=500, detail=f"获取评价首页数据失败: {str(e)}")
+
 @router.post("/{review_id}/reply", response_model=ReplyResponse)
 async def create_review_reply(
     merchant_id: int = Path(..., description="商家ID"),
     review_id: int = Path(..., description="评价ID"),
-    reply_data: ReplyCreate = ...
+    reply_data: ReplyCreate = ...,
+    review_service: ReviewService = Depends(get_review_service)
 ):
     """
     为指定评价创建回复
@@ -113,6 +204,7 @@ async def create_review_reply(
         merchant_id (int): 商户ID，路径参数
         review_id (int): 评价ID，路径参数
         reply_data (ReplyCreate): 回复创建数据，请求体参数
+        review_service (ReviewService): 评价业务服务，依赖注入
         
     Returns:
         ReplyResponse: 创建成功的回复数据
@@ -129,7 +221,7 @@ async def create_review_reply(
         )
         
         # 使用响应模型包装数据
-        return ReplyResponse(data=result)
+        return _render(ReplyResponse(data=result))
     except ValueError as e:
         # 处理业务逻辑错误（如评价不存在、重复回复等）
         raise HTTPException(status_code=400, detail=str(e))
@@ -139,17 +231,23 @@ async def create_review_reply(
 
 @router.get("/{review_id}/templates")
 async def get_reply_templates(
+    request: Request,
+    response: Response,
     merchant_id: int = Path(..., description="商家ID"),
-    review_id: int = Path(..., description="评价ID")
+    review_id: int = Path(..., description="评价ID"),
+    template_service: ReplyTemplateService = Depends(get_template_service)
 ):
     """
     获取评价回复模板推荐
     
-    根据评价的评分和其他因素推荐合适的回复模板
+    根据评价的评分和其他因素推荐合适的回复模板，响应携带ETag，客户端数据未变化时返回304
     
     Args:
+        request (Request): 请求对象，用于读取If-None-Match
+        response (Response): 响应对象，用于设置缓存响应头
         merchant_id (int): 商户ID，路径参数
         review_id (int): 评价ID，路径参数
+        template_service (ReplyTemplateService): 回复模板服务，依赖注入
         
     Returns:
         dict: 包含评分相关模板和常用模板的响应数据
@@ -158,29 +256,25 @@ async def get_reply_templates(
         HTTPException: 当评价不存在时抛出404错误，当获取模板失败时抛出500错误
     """
     try:
-        # 获取评价信息以确定评分
-        review_result = review_service.review_crud.db.table("merchant_reviews").select("rating").eq("id", review_id).execute()
-        if not review_result.data:
+        # 客户端缓存仍有效时直接返回304，不再查询评价评分
+        etag = await build_merchant_etag("reviews:templates", merchant_id, review_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        
+        # 一次调用获取评价评分及对应的推荐模板和常用模板
+        result = await template_service.get_templates_for_review(review_id, merchant_id)
+        if result is None:
             # 如果评价不存在，抛出404错误
             raise HTTPException(status_code=404, detail="评价不存在")
         
-        # 获取评价评分
-        rating = review_result.data[0]["rating"]
-        
-        # 根据评分获取推荐模板
-        templates = await template_service.get_templates_by_rating(rating)
-        
-        # 获取商户常用回复模板
-        frequent_templates = await template_service.get_frequently_used(merchant_id)
-        
         # 返回包含不同类型模板的响应数据
-        return {
+        return with_cache_headers({
             "success": True,
             "data": {
-                "rating_based": templates,      # 基于评分的推荐模板
-                "frequently_used": frequent_templates  # 商户常用模板
+                "rating_based": result["rating_based"],      # 基于评分的推荐模板
+                "frequently_used": result["frequently_used"]  # 商户常用模板
             }
-        }
+        }, response, etag)
     except HTTPException:
         # 重新抛出已有的HTTP异常（如404）
         raise
@@ -192,7 +286,8 @@ async def get_reply_templates(
 async def update_review_status(
     merchant_id: int = Path(..., description="商家ID"),
     review_id: int = Path(..., description="评价ID"),
-    status: str = Query(..., description="状态: active/hidden/deleted")
+    status: str = Query(..., description="状态: active/hidden/deleted"),
+    review_service: ReviewService = Depends(get_review_service)
 ):
     """
     更新评价状态
@@ -203,6 +298,7 @@ async def update_review_status(
         merchant_id (int): 商户ID，路径参数
         review_id (int): 评价ID，路径参数
         status (str): 新的状态值，查询参数，可选值: active/hidden/deleted
+        review_service (ReviewService): 评价业务服务，依赖注入
         
     Returns:
         dict: 状态更新结果信息
@@ -229,6 +325,8 @@ async def update_review_status(
         内容系统
 from typing import List, Optional, Dict, Any  # 导入类型注解
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Request  # 导入FastAPI相关依赖
+from fastapi.responses import ORJSONResponse  # 导入响应类
+from pydantic import BaseModel  # 导入Pydantic基础模型
 from sqlalchemy.orm import Session  # 导入数据库会话
 from app.schemas.review_schemas import (  # 导入评价相关的数据模式
     ReviewCreateSchema, 
@@ -236,7 +334,8 @@ from app.schemas.review_schemas import (  # 导入评价相关的数据模式
     ReviewResponseSchema,
     BusinessReplyCreateSchema,
     ReviewHelpfulVoteCreateSchema,
-    ReviewSummarySchema
+    ReviewSummarySchema,
+    ReviewListParams
 )
 from app.schemas.response_schemas import (  # 导入响应模式
     StandardResponse, 
@@ -247,15 +346,29 @@ from app.schemas.response_schemas import (  # 导入响应模式
 from app.services.review_service import review_service  # 导入评价服务
 from app.utils.pagination import PaginationParams, get_pagination_params  # 导入分页工具
 from app.utils.security import get_current_user, get_current_user_optional  # 导入安全工具
-from app.models.content_models import ContentStatus  # 导入内容模型
+from app.utils.json_response_utils import ModelJSONResponse  # 导入模型JSON响应类
 import logging  # 导入日志模块
 
 # 创建评价路由的APIRouter实例
-router = APIRouter(prefix="/reviews", tags=["reviews"])
+router = APIRouter(prefix="/reviews", tags=["reviews"], default_response_class=ORJSONResponse)
 
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+
+def _render(model: BaseModel, status_code: int = status.HTTP_200_OK):
+    """
+    输出响应模型（直接返回已序列化的响应，response_model仅用于OpenAPI文档，不再二次校验）
+    
+    Args:
+        model: 响应模型实例
+        status_code: HTTP状态码
+        
+    Returns:
+        由模型序列化器直接生成的JSON响应
+    """
+    return ModelJSONResponse(model, status_code=status_code)
+
 @router.post("/", response_model=StandardResponse[ReviewResponseSchema], status_code=status.HTTP_201_CREATED)
 async def create_review(
     review_data: ReviewCreateSchema,  # 评价创建数据
@@ -275,42 +388,29 @@ async def create_review(
     Returns:
         创建的评价响应
     """
-    try:
-        # 从当前用户信息中提取用户ID、姓名和头像
-        user_id = current_user.get("user_id")
-        user_name = current_user.get("name")
-        user_avatar = current_user.get("avatar_url")
-        
-        # 调用评价服务创建评价
-        created_review = await review_service.create_review(
-            review_data=review_data,
-            user_id=user_id,
-            user_name=user_name,
-            user_avatar=user_avatar,
-            background_tasks=background_tasks
-        )
-        
-        # 记录成功日志
-        logger.info(f"评价创建成功: {created_review.id}, 目标实体: {review_data.target_entity_type}:{review_data.target_entity_id}, 用户: {user_id}")
-        
-        # 返回成功响应
-        return create_success_response(
-            data=created_review,
-            message="评价创建成功",
-            status_code=status.HTTP_201_CREATED
-        )
-        
-    except HTTPException as e:
-        # 重新抛出HTTP异常
-        raise e
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"创建评价异常: {str(e)}", exc_info=True)
-        # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="评价创建失败，请稍后重试"
-        )
+    # 从当前用户信息中提取用户ID、姓名和头像
+    user_id = current_user.get("user_id")
+    user_name = current_user.get("name")
+    user_avatar = current_user.get("avatar_url")
+    
+    # 调用评价服务创建评价
+    created_review = await review_service.create_review(
+        review_data=review_data,
+        user_id=user_id,
+        user_name=user_name,
+        user_avatar=user_avatar,
+        background_tasks=background_tasks
+    )
+    
+    # 记录成功日志
+    logger.info(f"评价创建成功: {created_review.id}, 目标实体: {review_data.target_entity_type}:{review_data.target_entity_id}, 用户: {user_id}")
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=created_review,
+        message="评价创建成功",
+        status_code=status.HTTP_201_CREATED
+    ), status_code=status.HTTP_201_CREATED)
 
 @router.get("/{review_id}", response_model=StandardResponse[ReviewResponseSchema])
 async def get_review(
@@ -329,38 +429,25 @@ async def get_review(
     Returns:
         评价详情响应
     """
-    try:
-        # 从当前用户信息中提取用户ID（如果用户已登录）
-        user_id = current_user.get("user_id") if current_user else None
-        
-        # 调用评价服务获取评价详情
-        review = await review_service.get_review(review_id, user_id)
-        
-        # 检查评价是否存在
-        if not review:
-            # 返回404错误
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="评价不存在"
-            )
-        
-        # 返回成功响应
-        return create_success_response(
-            data=review,
-            message="获取评价成功"
-        )
-        
-    except HTTPException as e:
-        # 重新抛出HTTP异常
-        raise e
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"获取评价异常: {str(e)}", exc_info=True)
-        # 返回错误响应
+    # 从当前用户信息中提取用户ID（如果用户已登录）
+    user_id = current_user.get("user_id") if current_user else None
+    
+    # 调用评价服务获取评价详情
+    review = await review_service.get_review(review_id, user_id)
+    
+    # 检查评价是否存在
+    if not review:
+        # 返回404错误
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="获取评价失败，请稍后重试"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="评价不存在"
         )
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=review,
+        message="获取评价成功"
+    ))
 
 @router.put("/{review_id}", response_model=StandardResponse[ReviewResponseSchema])
 async def update_review(
@@ -381,45 +468,32 @@ async def update_review(
     Returns:
         更新后的评价响应
     """
-    try:
-        # 从当前用户信息中提取用户ID
-        user_id = current_user.get("user_id")
-        
-        # 调用评价服务更新评价
-        updated_review = await review_service.update_review(
-            review_id=review_id,
-            update_data=update_data,
-            user_id=user_id
-        )
-        
-        # 检查评价是否成功更新
-        if not updated_review:
-            # 返回404错误
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="评价不存在或更新失败"
-            )
-        
-        # 记录成功日志
-        logger.info(f"评价更新成功: {review_id}, 用户: {user_id}")
-        
-        # 返回成功响应
-        return create_success_response(
-            data=updated_review,
-            message="评价更新成功"
-        )
-        
-    except HTTPException as e:
-        # 重新抛出HTTP异常
-        raise e
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"更新评价异常: {str(e)}", exc_info=True)
-        # 返回错误响应
+    # 从当前用户信息中提取用户ID
+    user_id = current_user.get("user_id")
+    
+    # 调用评价服务更新评价
+    updated_review = await review_service.update_review(
+        review_id=review_id,
+        update_data=update_data,
+        user_id=user_id
+    )
+    
+    # 检查评价是否成功更新
+    if not updated_review:
+        # 返回404错误
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="评价更新失败，请稍后重试"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="评价不存在或更新失败"
         )
+    
+    # 记录成功日志
+    logger.info(f"评价更新成功: {review_id}, 用户: {user_id}")
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=updated_review,
+        message="评价更新成功"
+    ))
 
 @router.delete("/{review_id}", response_model=StandardResponse[bool])
 async def delete_review(
@@ -438,52 +512,32 @@ async def delete_review(
     Returns:
         删除操作结果
     """
-    try:
-        # 从当前用户信息中提取用户ID
-        user_id = current_user.get("user_id")
-        
-        # 调用评价服务删除评价
-        success = await review_service.delete_review(review_id, user_id)
-        
-        # 检查删除是否成功
-        if not success:
-            # 返回404错误
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="评价不存在或删除失败"
-            )
-        
-        # 记录成功日志
-        logger.info(f"评价删除成功: {review_id}, 用户: {user_id}")
-        
-        # 返回成功响应
-        return create_success_response(
-            data=True,
-            message="评价删除成功"
-        )
-        
-    except HTTPException as e:
-        # 重新抛出HTTP异常
-        raise e
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"删除评价异常: {str(e)}", exc_info=True)
-        # 返回错误响应
+    # 从当前用户信息中提取用户ID
+    user_id = current_user.get("user_id")
+    
+    # 调用评价服务删除评价
+    success = await review_service.delete_review(review_id, user_id)
+    
+    # 检查删除是否成功
+    if not success:
+        # 返回404错误
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="评价删除失败，请稍后重试"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="评价不存在或删除失败"
         )
+    
+    # 记录成功日志
+    logger.info(f"评价删除成功: {review_id}, 用户: {user_id}")
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=True,
+        message="评价删除成功"
+    ))
 
 @router.get("/", response_model=PaginatedResponse[ReviewResponseSchema])
 async def list_reviews(
-    target_entity_type: Optional[str] = Query(None, description="目标实体类型过滤"),  # 目标实体类型查询参数
-    target_entity_id: Optional[str] = Query(None, description="目标实体ID过滤"),  # 目标实体ID查询参数
-    author_id: Optional[str] = Query(None, description="作者ID过滤"),  # 作者ID查询参数
-    status: Optional[ContentStatus] = Query(None, description="评价状态过滤"),  # 评价状态查询参数
-    min_rating: Optional[float] = Query(None, ge=1.0, le=5.0, description="最低评分过滤"),  # 最低评分查询参数
-    max_rating: Optional[float] = Query(None, ge=1.0, le=5.0, description="最高评分过滤"),  # 最高评分查询参数
-    has_media: Optional[bool] = Query(None, description="是否有媒体文件过滤"),  # 媒体文件查询参数
-    is_verified: Optional[bool] = Query(None, description="是否已验证过滤"),  # 验证状态查询参数
+    filters: ReviewListParams = Depends(),  # 过滤条件查询参数
     pagination: PaginationParams = Depends(get_pagination_params),  # 分页参数依赖注入
     current_user: Optional[Dict[str, Any]] = Depends(get_current_user_optional),  # 可选当前用户
     request: Request = None  # 请求对象
@@ -492,14 +546,7 @@ async def list_reviews(
     获取评价列表（支持多种过滤条件和分页）
     
     Args:
-        target_entity_type: 目标实体类型过滤
-        target_entity_id: 目标实体ID过滤
-        author_id: 作者ID过滤
-        status: 评价状态过滤
-        min_rating: 最低评分过滤
-        max_rating: 最高评分过滤
-        has_media: 是否有媒体文件过滤
-        is_verified: 是否已验证过滤
+        filters: 过滤条件（目标实体、作者、状态、评分范围、媒体、验证状态）
         pagination: 分页参数
         current_user: 当前用户信息（可选）
         request: HTTP请求对象
@@ -507,38 +554,21 @@ async def list_reviews(
     Returns:
         分页的评价列表响应
     """
-    try:
-        # 从当前用户信息中提取用户ID（如果用户已登录）
-        user_id = current_user.get("user_id") if current_user else None
-        
-        # 调用评价服务获取评价列表
-        result = await review_service.list_reviews(
-            pagination=pagination,
-            target_entity_type=target_entity_type,
-            target_entity_id=target_entity_id,
-            author_id=author_id,
-            status=status,
-            min_rating=min_rating,
-            max_rating=max_rating,
-            has_media=has_media,
-            is_verified=is_verified,
-            user_id=user_id
-        )
-        
-        # 返回成功响应
-        return create_success_response(
-            data=result,
-            message="获取评价列表成功"
-        )
-        
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"获取评价列表异常: {str(e)}", exc_info=True)
-        # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="获取评价列表失败，请稍后重试"
-        )
+    # 从当前用户信息中提取用户ID（如果用户已登录）
+    user_id = current_user.get("user_id") if current_user else None
+    
+    # 调用评价服务获取评价列表
+    result = await review_service.list_reviews(
+        pagination=pagination,
+        user_id=user_id,
+        **filters.model_dump()
+    )
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=result,
+        message="获取评价列表成功"
+    ))
 
 @router.post("/{review_id}/business-reply", response_model=StandardResponse[bool])
 async def add_business_reply(
@@ -559,50 +589,38 @@ async def add_business_reply(
     Returns:
         回复操作结果
     """
-    try:
-        # 从当前用户信息中提取用户ID
-        user_id = current_user.get("user_id")
-        
-        # 调用评价服务添加商家回复
-        success = await review_service.add_business_reply(
-            review_id=review_id,
-            reply_data=reply_data,
-            user_id=user_id
-        )
-        
-        # 检查回复是否成功添加
-        if not success:
-            # 返回400错误
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="商家回复添加失败"
-            )
-        
-        # 记录成功日志
-        logger.info(f"商家回复添加成功: {review_id}, 商家用户: {user_id}")
-        
-        # 返回成功响应
-        return create_success_response(
-            data=True,
-            message="商家回复添加成功"
-        )
-        
-    except HTTPException as e:
-        # 重新抛出HTTP异常
-        raise e
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"添加商家回复异常: {str(e)}", exc_info=True)
-        # 返回错误响应
+    # 从当前用户信息中提取用户ID
+    user_id = current_user.get("user_id")
+    
+    # 调用评价服务添加商家回复
+    success = await review_service.add_business_reply(
+        review_id=review_id,
+        reply_data=reply_data,
+        user_id=user_id
+    )
+    
+    # 检查回复是否成功添加
+    if not success:
+        # 返回400错误
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="商家回复添加失败，请稍后重试"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="商家回复添加失败"
         )
+    
+    # 记录成功日志
+    logger.info(f"商家回复添加成功: {review_id}, 商家用户: {user_id}")
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=True,
+        message="商家回复添加成功"
+    ))
 
 @router.post("/{review_id}/helpful-votes", response_model=StandardResponse[bool])
 async def add_helpful_vote(
     review_id: str,  # 评价ID路径参数
     vote_data: ReviewHelpfulVoteCreateSchema,  # 有用性投票数据
+    background_tasks: BackgroundTasks,  # 后台任务管理器
     current_user: Dict[str, Any] = Depends(get_current_user),  # 当前用户依赖注入
     request: Request = None  # 请求对象
 ):
@@ -612,55 +630,44 @@ async def add_helpful_vote(
     Args:
         review_id: 评价ID
         vote_data: 有用性投票数据
+        background_tasks: 后台任务管理器
         current_user: 当前用户信息
         request: HTTP请求对象
         
     Returns:
         投票操作结果
     """
-    try:
-        # 从当前用户信息中提取用户ID
-        user_id = current_user.get("user_id")
-        
-        # 从请求中获取客户端IP地址
-        client_ip = request.client.host if request else None
-        
-        # 调用评价服务添加有用性投票
-        success = await review_service.add_helpful_vote(
-            review_id=review_id,
-            vote_data=vote_data,
-            user_id=user_id,
-            ip_address=client_ip
-        )
-        
-        # 检查投票是否成功添加
-        if not success:
-            # 返回400错误
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="有用性投票添加失败"
-            )
-        
-        # 记录成功日志
-        logger.info(f"有用性投票添加成功: {review_id}, 用户: {user_id}, 有用: {vote_data.is_helpful}")
-        
-        # 返回成功响应
-        return create_success_response(
-            data=True,
-            message="有用性投票添加成功"
-        )
-        
-    except HTTPException as e:
-        # 重新抛出HTTP异常
-        raise e
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"添加有用性投票异常: {str(e)}", exc_info=True)
-        # 返回错误响应
+    # 从当前用户信息中提取用户ID
+    user_id = current_user.get("user_id")
+    
+    # 从请求中获取客户端IP地址
+    client_ip = request.client.host if request else None
+    
+    # 调用评价服务添加有用性投票
+    success = await review_service.add_helpful_vote(
+        review_id=review_id,
+        vote_data=vote_data,
+        user_id=user_id,
+        ip_address=client_ip,
+        background_tasks=background_tasks
+    )
+    
+    # 检查投票是否成功添加
+    if not success:
+        # 返回400错误
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="有用性投票添加失败，请稍后重试"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="有用性投票添加失败"
         )
+    
+    # 记录成功日志
+    logger.info(f"有用性投票添加成功: {review_id}, 用户: {user_id}, 有用: {vote_data.is_helpful}")
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=True,
+        message="有用性投票添加成功"
+    ))
 
 @router.get("/summary/{target_entity_type}/{target_entity_id}", response_model=StandardResponse[ReviewSummarySchema])
 async def get_review_summary(
@@ -679,21 +686,11 @@ async def get_review_summary(
     Returns:
         评价汇总信息响应
     """
-    try:
-        # 调用评价服务获取评价汇总信息
-        summary = await review_service.get_review_summary(target_entity_type, target_entity_id)
-        
-        # 返回成功响应
-        return create_success_response(
-            data=summary,
-            message="获取评价汇总信息成功"
-        )
-        
-    except Exception as e:
-        # 记录错误日志
-        logger.error(f"获取评价汇总信息异常: {str(e)}", exc_info=True)
-        # 返回错误响应
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="获取评价汇总信息失败，请稍后重试"
-        )    
\ No newline at end of file
+    # 调用评价服务获取评价汇总信息
+    summary = await review_service.get_review_summary(target_entity_type, target_entity_id)
+    
+    # 返回成功响应
+    return _render(create_success_response(
+        data=summary,
+        message="获取评价汇总信息成功"
+    ))
\ No newline at end of file
@@ -8,26 +8,43 @@
 - 刷新统计缓存
 """
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from app.services.analytics_service import ReviewAnalyticsService
+from app.services.review_service import ReviewService
+from app.utils.cache_utils import cache_manager
+from app.utils.etag_utils import (
+    build_merchant_etag, bump_merchant_version, is_not_modified, not_modified_response, with_cache_headers
+)
 
 # 创建API路由实例，设置路径前缀和标签
-router = APIRouter(prefix="/api/v1/merchants/{merchant_id}/statistics", tags=["statistics"])
+router = APIRouter(
+    prefix="/api/v1/merchants/{merchant_id}/statistics",
+    tags=["statistics"],
+    default_response_class=ORJSONResponse  # 使用orjson序列化响应
+)
 
 # 初始化统计分析服务实例
 analytics_service = ReviewAnalyticsService()
 
+# 统计数据在Redis中的缓存有效期（秒），多个worker共享
+STATISTICS_CACHE_TTL = 300
+
 @router.get("/trend")
 async def get_trend_analysis(
+    request: Request,
+    response: Response,
     merchant_id: int = Path(..., description="商家ID"),
     days: int = Query(7, ge=1, le=30, description="天数")
 ):
     """
     获取评分趋势分析数据
     
-    返回指定天数内商户评价的各项指标趋势数据
+    返回指定天数内商户评价的各项指标趋势数据，响应携带ETag，客户端数据未变化时返回304
     
     Args:
+        request (Request): 请求对象，用于读取If-None-Match
+        response (Response): 响应对象，用于设置缓存响应头
         merchant_id (int): 商户ID，路径参数
         days (int): 分析天数，默认7天，范围1-30天，查询参数
         
@@ -37,27 +54,39 @@ async def get_trend_analysis(
     Raises:
         HTTPException: 当获取趋势分析失败时抛出500错误
     """
-    try:
+    # 客户端缓存仍有效时直接返回304
+    etag = await build_merchant_etag("statistics:trend", merchant_id, days)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    
+    # 优先从共享缓存读取趋势数据
+    cache_key = f"statistics:trend:{merchant_id}:{days}"
+    trend_data = await cache_manager.get(cache_key)
+    if trend_data is None:
         # 调用统计分析服务获取趋势分析数据
         trend_data = await analytics_service.get_trend_analysis(merchant_id, days)
-        
-        # 返回成功响应，包含趋势数据
-        return {
-            "success": True,
-            "data": trend_data
-        }
-    except Exception as e:
-        # 捕获异常并抛出自定义HTTP异常
-        raise HTTPException(status_code=500, detail=f"获取趋势分析失败: {str(e)}")
+        await cache_manager.set(cache_key, trend_data, expire=STATISTICS_CACHE_TTL)
+    
+    # 返回成功响应，包含趋势数据
+    return with_cache_headers({
+        "success": True,
+        "data": trend_data
+    }, response, etag)
 
 @router.get("/comparison")
-async def get_comparison_data(merchant_id: int = Path(..., description="商家ID")):
+async def get_comparison_data(
+    request: Request,
+    response: Response,
+    merchant_id: int = Path(..., description="商家ID")
+):
     """
     获取与周边商家的对比数据
     
-    返回当前商户与同行业或同区域商家的评价数据对比
+    返回当前商户与同行业或同区域商家的评价数据对比，响应携带ETag，客户端数据未变化时返回304
     
     Args:
+        request (Request): 请求对象，用于读取If-None-Match
+        response (Response): 响应对象，用于设置缓存响应头
         merchant_id (int): 商户ID，路径参数
         
     Returns:
@@ -66,18 +95,24 @@ async def get_comparison_data(merchant_id: int = Path(..., description="商家ID
     Raises:
         HTTPException: 当获取对比数据失败时抛出500错误
     """
-    try:
+    # 客户端缓存仍有效时直接返回304
+    etag = await build_merchant_etag("statistics:comparison", merchant_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    
+    # 优先从共享缓存读取对比数据
+    cache_key = f"statistics:comparison:{merchant_id}"
+    comparison_data = await cache_manager.get(cache_key)
+    if comparison_data is None:
         # 调用统计分析服务获取商家对比数据
         comparison_data = await analytics_service.get_comparison_data(merchant_id)
-        
-        # 返回成功响应，包含对比数据
-        return {
-            "success": True,
-            "data": comparison_data
-        }
-    except Exception as e:
-        # 捕获异常并抛出自定义HTTP异常
-        raise HTTPException(status_code=500, detail=f"获取对比数据失败: {str(e)}")
+        await cache_manager.set(cache_key, comparison_data, expire=STATISTICS_CACHE_TTL)
+    
+    # 返回成功响应，包含对比数据
+    return with_cache_headers({
+        "success": True,
+        "data": comparison_data
+    }, response, etag)
 
 @router.post("/refresh-cache")
 async def refresh_statistics_cache(merchant_id: int = Path(..., description="商家ID")):
@@ -95,18 +130,21 @@ async def refresh_statistics_cache(merchant_id: int = Path(..., description="商
     Raises:
         HTTPException: 当缓存刷新失败时抛出500错误
     """
-    try:
-        # 调用统计分析服务更新统计缓存
-        success = await analytics_service.update_statistics_cache(merchant_id)
-        if not success:
-            # 如果缓存刷新失败，抛出500错误
-            raise HTTPException(status_code=500, detail="缓存刷新失败")
-        
-        # 返回成功响应
-        return {
-            "success": True,
-            "message": "统计缓存刷新成功"
-        }
-    except Exception as e:
-        # 捕获异常并抛出自定义HTTP异常
-        raise HTTPException(status_code=500, detail=f"刷新缓存失败: {str(e)}")
\ No newline at end of file
+    # 调用统计分析服务更新统计缓存
+    success = await analytics_service.update_statistics_cache(merchant_id)
+    if not success:
+        # 如果缓存刷新失败，抛出500错误
+        raise HTTPException(status_code=500, detail="缓存刷新失败")
+    
+    # 同步清除评价统计摘要的进程内缓存和趋势、对比数据的共享缓存
+    ReviewService.invalidate_summary_cache(merchant_id)
+    await cache_manager.delete_pattern(f"statistics:trend:{merchant_id}:*")
+    await cache_manager.delete(f"statistics:comparison:{merchant_id}")
+    # 递增商户数据版本号，使客户端持有的ETag失效
+    await bump_merchant_version(merchant_id)
+    
+    # 返回成功响应
+    return {
+        "success": True,
+        "message": "统计缓存刷新成功"
+    }
\ No newline at end of file
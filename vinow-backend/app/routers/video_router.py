@@ -11,51 +11,102 @@
 6. 视频转码进度跟踪
 7. 热门视频推荐
 
-所有接口都包含完善的认证、授权和异常处理机制。
+所有接口都包含完善的认证和授权机制；业务异常（NotFoundException、BusinessException）
+均为HTTPException，未预期的异常由全局异常处理器（app.core.error_handlers）统一记录并返回500。
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-
-from app.database.session import get_db
-from app.middleware.auth import get_current_user
+from typing import Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.session import AsyncSessionLocal, get_async_db
+from app.middleware.auth import AuthUser, get_current_user
+from app.models.video_models import VideoContent
 from app.schemas.video_schemas import (
-    VideoCreate, VideoUpdate, VideoResponse, VideoUploadResponse,
-    VideoUploadComplete, VideoInteractionCreate, VideoStatsResponse,
-    VideoStatus, VideoVisibility, TranscodingStatus
+    VideoCreate, VideoUpdate, VideoCore, VideoUploadResponse,
+    MultipartUploadInit, VideoUploadComplete, VideoInteractionCreate,
+    VideoStatus, VideoVisibility,
+    VideoStandardResponse, VideoListStandardResponse, VideoStatsStandardResponse
 )
 from app.schemas.response_schemas import StandardResponse, PaginatedResponse
 from app.schemas.pagination_schemas import PaginationParams
 from app.services.video_service import VideoService
 from app.services.transcoding_service import VideoTranscodingService
 from app.services.cdn_service import cdn_service
+from app.services.interaction_buffer import interaction_buffer
 from app.services.storage_service import StorageService
-from app.core.exceptions import NotFoundException, ValidationException, BusinessException
 from app.utils.pagination import Pagination
+from app.utils.file_utils import get_video_extension
+from app.utils.json_response_utils import ModelJSONResponse
+from app.utils.etag_utils import (
+    HTTP_CACHE_MAX_AGE, build_etag, cache_control_value, is_not_modified,
+    not_modified_response, with_cache_headers
+)
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 __all__ = ['router']
 
-router = APIRouter(prefix="/api/v1/videos", tags=["videos"])
+# 权限和状态判断使用的取值（数据库和缓存中均以字符串保存，直接按字符串比较）
+_PRIVATE = "private"
+_PUBLIC = "public"
+_TRANSCODING_COMPLETED = "completed"
+
+# 视频详情、统计、热门列表过期后允许先返回旧内容并在后台重新校验的时长（秒）
+VIDEO_STALE_WHILE_REVALIDATE = 300
+
+router = APIRouter(
+    prefix="/api/v1/videos",
+    tags=["videos"],
+    default_response_class=ORJSONResponse  # 使用orjson序列化响应
+)
+
+
+async def get_video_for_request(
+    video_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+) -> VideoContent:
+    """
+    获取当前请求的视频依赖
+    
+    同一请求内按视频ID缓存在request.state中，权限检查和后续修改共用一次查询
+    
+    Args:
+        video_id: 视频ID
+        request: 请求对象
+        db: 异步数据库会话
+        
+    Returns:
+        视频内容对象
+        
+    Raises:
+        NotFoundException: 视频不存在时抛出
+    """
+    videos = getattr(request.state, "videos", None)
+    if videos is None:
+        videos = request.state.videos = {}
+    if video_id not in videos:
+        videos[video_id] = await VideoService.get_video_by_id(db, video_id)
+    return videos[video_id]
 
 
-@router.post("", response_model=StandardResponse[VideoResponse], status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=VideoStandardResponse, status_code=status.HTTP_201_CREATED)
 async def create_video(
     video_data: VideoCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user)
 ):
     """
     创建视频记录
     
     Args:
         video_data: 视频创建数据
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
         
     Returns:
@@ -64,32 +115,32 @@ async def create_video(
     Raises:
         HTTPException: 创建失败时抛出相应错误
     """
-    try:
-        video = VideoService.create_video(db, video_data, current_user["user_id"])
-        return StandardResponse(
-            success=True,
-            message="视频创建成功",
-            data=video
-        )
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        logger.error(f"Create video error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.get("/{video_id}", response_model=StandardResponse[VideoResponse])
+    video = await VideoService.create_video(db, video_data, current_user.user_id)
+    return StandardResponse(
+        success=True,
+        message="视频创建成功",
+        data=video
+    )
+
+
+@router.get("/{video_id}", response_model=VideoStandardResponse)
 async def get_video(
     video_id: str,
-    db: Session = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[AuthUser] = Depends(get_current_user)
 ):
     """
     获取视频详情
     
+    支持If-None-Match条件请求，视频未变化时返回304
+    
     Args:
         video_id: 视频ID
-        db: 数据库会话
+        request: 请求对象
+        response: 响应对象
+        db: 异步数据库会话
         current_user: 当前用户信息（可选）
         
     Returns:
@@ -98,34 +149,36 @@ async def get_video(
     Raises:
         HTTPException: 视频不存在或无权限时抛出相应错误
     """
-    try:
-        video = VideoService.get_video_by_id(db, video_id)
-        
-        # 检查权限
-        if (video.visibility == VideoVisibility.PRIVATE and 
-            (not current_user or video.user_id != current_user["user_id"])):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权访问此视频")
-            
-        return StandardResponse(
-            success=True,
-            message="获取视频成功",
-            data=video
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Get video error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.put("/{video_id}", response_model=StandardResponse[VideoResponse])
+    video = await VideoService.get_video_detail(db, video_id)
+    
+    # 检查权限
+    if (video["visibility"] == _PRIVATE and 
+        (not current_user or video["user_id"] != current_user.user_id)):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权访问此视频")
+    
+    etag = build_etag("video", video_id, video["updated_at"], video["view_count"])
+    cache_control = cache_control_value(
+        HTTP_CACHE_MAX_AGE,
+        public=video["visibility"] == _PUBLIC,
+        stale_while_revalidate=VIDEO_STALE_WHILE_REVALIDATE
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control=cache_control)
+        
+    return with_cache_headers(ModelJSONResponse(VideoStandardResponse(
+        success=True,
+        message="获取视频成功",
+        data=video
+    )), response, etag, cache_control=cache_control)
+
+
+@router.put("/{video_id}", response_model=VideoStandardResponse)
 async def update_video(
     video_id: str,
     update_data: VideoUpdate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     更新视频信息
@@ -133,8 +186,9 @@ async def update_video(
     Args:
         video_id: 视频ID
         update_data: 视频更新数据
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         更新后的视频信息
@@ -142,42 +196,33 @@ async def update_video(
     Raises:
         HTTPException: 视频不存在、无权限或更新失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权修改此视频")
-            
-        video = VideoService.update_video(db, video_id, update_data)
-        return StandardResponse(
-            success=True,
-            message="视频更新成功",
-            data=video
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Update video error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权修改此视频")
+        
+    video = await VideoService.update_video(db, video, update_data)
+    return StandardResponse(
+        success=True,
+        message="视频更新成功",
+        data=video
+    )
 
 
 @router.delete("/{video_id}", response_model=StandardResponse[bool])
 async def delete_video(
     video_id: str,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     删除视频（软删除）
     
     Args:
         video_id: 视频ID
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         删除操作结果
@@ -185,30 +230,19 @@ async def delete_video(
     Raises:
         HTTPException: 视频不存在、无权限或删除失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权删除此视频")
-            
-        result = VideoService.delete_video(db, video_id)
-        return StandardResponse(
-            success=True,
-            message="视频删除成功",
-            data=result
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Delete video error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.get("", response_model=PaginatedResponse[VideoResponse])
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权删除此视频")
+        
+    result = await VideoService.delete_video(db, video)
+    return StandardResponse(
+        success=True,
+        message="视频删除成功",
+        data=result
+    )
+
+
+@router.get("", response_model=PaginatedResponse[VideoCore], response_model_exclude_none=True)
 async def list_videos(
     user_id: Optional[str] = Query(None, description="用户ID过滤"),
     merchant_id: Optional[str] = Query(None, description="商家ID过滤"),
@@ -216,8 +250,10 @@ async def list_videos(
     visibility: Optional[VideoVisibility] = Query(None, description="可见性过滤"),
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
-    db: Session = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    include_total: bool = Query(False, description="是否返回总数"),
+    cursor: Optional[str] = Query(None, description="游标（上一页返回的next_cursor）"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[AuthUser] = Depends(get_current_user)
 ):
     """
     分页列出视频
@@ -229,7 +265,9 @@ async def list_videos(
         visibility: 可见性过滤
         page: 页码
         page_size: 每页数量
-        db: 数据库会话
+        include_total: 是否返回总数（不需要总数时省去计数查询）
+        cursor: 游标，传入时按创建时间和视频ID继续向后翻页
+        db: 异步数据库会话
         current_user: 当前用户信息（可选）
         
     Returns:
@@ -238,40 +276,48 @@ async def list_videos(
     Raises:
         HTTPException: 查询失败时抛出相应错误
     """
-    try:
-        # 如果是普通用户，只能看到公开视频或自己的视频
-        if current_user and current_user.get("role") != "admin":
-            if user_id and user_id != current_user["user_id"]:
-                visibility = VideoVisibility.PUBLIC
-            elif not user_id:
-                user_id = current_user["user_id"]
-                
-        page_result = VideoService.list_videos(
-            db, user_id, merchant_id, status, visibility, page, page_size
-        )
-        
-        return PaginatedResponse(
-            success=True,
-            message="获取视频列表成功",
-            data=page_result.items,
-            pagination={
-                "page": page_result.page,
-                "page_size": page_result.page_size,
-                "total": page_result.total,
-                "pages": page_result.pages
-            }
-        )
-    except Exception as e:
-        logger.error(f"List videos error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
+    # 如果是普通用户，只能看到公开视频或自己的视频
+    if current_user and current_user.role != "admin":
+        if user_id and user_id != current_user.user_id:
+            visibility = _PUBLIC
+        elif not user_id:
+            user_id = current_user.user_id
+    
+    # 解析游标
+    cursor_key = None
+    if cursor:
+        try:
+            cursor_key = VideoService.decode_list_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="游标格式无效") from None
+            
+    page_result = await VideoService.list_videos(
+        db, user_id, merchant_id, status, visibility, page, page_size,
+        include_total=include_total, cursor=cursor_key
+    )
+    
+    return PaginatedResponse(
+        success=True,
+        message="获取视频列表成功",
+        data=page_result.items,
+        pagination={
+            "page": page_result.page,
+            "page_size": page_result.page_size,
+            "total": page_result.total,
+            "pages": page_result.pages,
+            "has_next": page_result.has_next,
+            "next_cursor": page_result.next_cursor
+        }
+    )
 
 
 @router.post("/{video_id}/upload", response_model=StandardResponse[VideoUploadResponse])
 async def initiate_video_upload(
     video_id: str,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     初始化视频上传
@@ -279,8 +325,9 @@ async def initiate_video_upload(
     Args:
         video_id: 视频ID
         background_tasks: 后台任务
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         上传初始化信息
@@ -288,58 +335,55 @@ async def initiate_video_upload(
     Raises:
         HTTPException: 视频不存在、无权限或初始化失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权上传此视频")
-            
-        # 生成文件路径
-        file_extension = video.original_filename.split('.')[-1] if '.' in video.original_filename else 'mp4'
-        file_key = f"videos/{video_id}/original.{file_extension}"
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权上传此视频")
         
-        # 生成预签名上传URL
-        upload_url = cdn_service.generate_presigned_url(file_key, 'put_object', 3600)
-        
-        # 更新视频文件信息
+    # 生成文件路径
+    file_extension = get_video_extension(video.original_filename)
+    file_key = f"videos/{video_id}/original.{file_extension}"
+    
+    # 获取预签名上传URL（重复初始化时复用缓存中的URL，不再重新签名）
+    presigned = await cdn_service.get_cached_presigned_url(file_key, 'put_object', 3600)
+    
+    # 更新视频文件信息（未变化时不提交）
+    if video.file_key != file_key:
         video.file_key = file_key
-        db.commit()
-        
-        response_data = VideoUploadResponse(
-            video_id=video_id,
-            upload_url=upload_url,
-            expires_at=datetime.utcnow() + timedelta(hours=1)
-        )
-        
-        return StandardResponse(
-            success=True,
-            message="上传初始化成功",
-            data=response_data
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Initiate upload error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
+        await db.commit()
+        await VideoService.invalidate_video_cache(video_id)
+    
+    response_data = VideoUploadResponse(
+        video_id=video_id,
+        upload_url=presigned["url"],
+        expires_at=presigned["expires_at"]
+    )
+    
+    return StandardResponse(
+        success=True,
+        message="上传初始化成功",
+        data=response_data
+    )
 
 
 @router.post("/{video_id}/upload-multipart", response_model=StandardResponse[Dict[str, Any]])
 async def initiate_multipart_upload(
     video_id: str,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    init_data: Optional[MultipartUploadInit] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     初始化分片上传
     
+    返回上传ID及推荐的分片大小、并发数，小文件会提示改用单次直传
+    
     Args:
         video_id: 视频ID
-        db: 数据库会话
+        init_data: 分片上传初始化数据（客户端声明的文件大小，可选）
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         分片上传初始化信息
@@ -347,46 +391,37 @@ async def initiate_multipart_upload(
     Raises:
         HTTPException: 视频不存在、无权限或初始化失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权上传此视频")
-            
-        # 生成文件路径
-        file_extension = video.original_filename.split('.')[-1] if '.' in video.original_filename else 'mp4'
-        file_key = f"videos/{video_id}/original.{file_extension}"
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权上传此视频")
         
-        # 初始化分片上传
-        upload_info = cdn_service.initiate_multipart_upload(file_key)
-        
-        # 更新视频文件信息
-        video.file_key = file_key
-        db.commit()
-        
-        return StandardResponse(
-            success=True,
-            message="分片上传初始化成功",
-            data=upload_info
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Initiate multipart upload error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
+    # 生成文件路径
+    file_extension = get_video_extension(video.original_filename)
+    file_key = f"videos/{video_id}/original.{file_extension}"
+    
+    # 初始化分片上传
+    file_size = init_data.file_size if init_data else video.file_size
+    upload_info = cdn_service.initiate_multipart_upload(file_key, file_size)
+    
+    # 更新视频文件信息
+    video.file_key = file_key
+    await db.commit()
+    await VideoService.invalidate_video_cache(video_id)
+    
+    return StandardResponse(
+        success=True,
+        message="分片上传初始化成功",
+        data=upload_info
+    )
 
 
 @router.post("/{video_id}/upload-complete", response_model=StandardResponse[bool])
 async def complete_multipart_upload(
     video_id: str,
     complete_data: VideoUploadComplete,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     完成分片上传
@@ -394,9 +429,9 @@ async def complete_multipart_upload(
     Args:
         video_id: 视频ID
         complete_data: 完成上传数据
-        background_tasks: 后台任务
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         上传完成结果
@@ -404,65 +439,58 @@ async def complete_multipart_upload(
     Raises:
         HTTPException: 视频不存在、无权限或完成失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权上传此视频")
-            
-        # 完成分片上传
-        cdn_service.complete_multipart_upload(
-            video.file_key, complete_data.upload_id, complete_data.parts
-        )
-        
-        # 获取文件信息
-        file_info = cdn_service.get_file_info(video.file_key)
-        if file_info:
-            video.file_size = file_info["file_size"]
-            video.status = VideoStatus.PROCESSING
-            db.commit()
-            
-            # 启动转码任务
-            if settings.ENABLE_VIDEO_TRANSCODING:
-                profiles = VideoTranscodingService.create_transcoding_profiles(
-                    db, video_id, video.file_key
-                )
-                background_tasks.add_task(
-                    VideoTranscodingService.start_transcoding_task,
-                    video_id, video.file_key, profiles
-                )
-        
-        return StandardResponse(
-            success=True,
-            message="分片上传完成",
-            data=True
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Complete multipart upload error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.post("/{video_id}/interactions", response_model=StandardResponse[bool])
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权上传此视频")
+        
+    # 完成分片上传
+    cdn_service.complete_multipart_upload(
+        video.file_key, complete_data.upload_id, complete_data.parts
+    )
+    
+    # 获取文件信息
+    file_info = cdn_service.get_file_info(video.file_key)
+    if file_info:
+        video.file_size = file_info["file_size"]
+        video.status = "processing"
+        await db.commit()
+        await VideoService.invalidate_video_cache(video_id)
+        
+        # 启动转码任务
+        if settings.ENABLE_VIDEO_TRANSCODING:
+            # 转码服务基于同步会话实现，通过run_sync在异步会话的连接上执行
+            profiles = await db.run_sync(
+                VideoTranscodingService.create_transcoding_profiles, video_id, video.file_key
+            )
+            # 投递到转码队列，由独立的转码worker执行
+            VideoTranscodingService.start_transcoding_task(video_id, video.file_key, profiles)
+    
+    return StandardResponse(
+        success=True,
+        message="分片上传完成",
+        data=True
+    )
+
+
+@router.post("/{video_id}/interactions", response_model=StandardResponse[bool], status_code=status.HTTP_202_ACCEPTED)
 async def record_interaction(
     video_id: str,
     interaction_data: VideoInteractionCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     记录用户互动
     
+    互动记录入队后即返回，由后台任务批量写入数据库；队列已满时直接写入
+    
     Args:
         video_id: 视频ID
         interaction_data: 互动数据
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         互动记录结果
@@ -470,44 +498,40 @@ async def record_interaction(
     Raises:
         HTTPException: 视频不存在、无权限或记录失败时抛出相应错误
     """
-    try:
-        # 增加观看次数（如果是观看互动）
-        if interaction_data.interaction_type == 'view':
-            VideoService.increment_view_count(db, video_id)
-            
-        # 记录互动
-        VideoService.record_video_interaction(
-            db, video_id, current_user["user_id"], interaction_data.model_dump()
-        )
-        
-        return StandardResponse(
-            success=True,
-            message="互动记录成功",
-            data=True
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Record interaction error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.get("/{video_id}/stats", response_model=StandardResponse[VideoStatsResponse])
+    # 增加观看次数（如果是观看互动）
+    if interaction_data.interaction_type == 'view':
+        await VideoService.increment_view_count(db, video_id)
+        
+    # 记录互动
+    interaction = interaction_data.model_dump()
+    if not interaction_buffer.enqueue(video_id, current_user.user_id, interaction):
+        await VideoService.record_video_interaction(db, video, current_user.user_id, interaction)
+    
+    return StandardResponse(
+        success=True,
+        message="互动记录成功",
+        data=True
+    )
+
+
+@router.get("/{video_id}/stats", response_model=VideoStatsStandardResponse)
 async def get_video_stats(
     video_id: str,
-    db: Session = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[AuthUser] = Depends(get_current_user)
 ):
     """
     获取视频统计信息
     
+    支持If-None-Match条件请求，统计未重新计算时返回304
+    
     Args:
         video_id: 视频ID
-        db: 数据库会话
+        request: 请求对象
+        response: 响应对象
+        db: 异步数据库会话
         current_user: 当前用户信息（可选）
         
     Returns:
@@ -516,41 +540,52 @@ async def get_video_stats(
     Raises:
         HTTPException: 视频不存在、无权限或获取失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if (video.visibility == VideoVisibility.PRIVATE and 
-            current_user and video.user_id != current_user["user_id"]):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权访问此视频统计")
-            
-        stats = VideoService.get_video_stats(db, video_id)
-        return StandardResponse(
-            success=True,
-            message="获取视频统计成功",
-            data=stats
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Get video stats error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
+    async def load_stats() -> Dict[str, Any]:
+        # 异步会话不支持并发查询，统计查询使用独立会话
+        async with AsyncSessionLocal() as stats_db:
+            return await VideoService.get_video_stats(stats_db, video_id)
+    
+    # 视频详情和统计并发查询，两者都返回后再检查权限
+    video, stats = await asyncio.gather(
+        VideoService.get_video_detail(db, video_id),
+        load_stats()
+    )
+    if (video["visibility"] == _PRIVATE and 
+        current_user and video["user_id"] != current_user.user_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权访问此视频统计")
+    
+    # 统计按缓存周期重新计算，last_updated即为统计版本
+    etag = build_etag("video_stats", video_id, stats["last_updated"], stats["total_views"])
+    cache_control = cache_control_value(
+        HTTP_CACHE_MAX_AGE,
+        public=video["visibility"] == _PUBLIC,
+        stale_while_revalidate=VIDEO_STALE_WHILE_REVALIDATE
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control=cache_control)
+        
+    return with_cache_headers(ModelJSONResponse(VideoStatsStandardResponse(
+        success=True,
+        message="获取视频统计成功",
+        data=stats
+    )), response, etag, cache_control=cache_control)
 
 
 @router.get("/{video_id}/transcoding-progress", response_model=StandardResponse[Dict[str, Any]])
 async def get_transcoding_progress(
     video_id: str,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     获取转码进度
     
     Args:
         video_id: 视频ID
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         转码进度信息
@@ -558,40 +593,33 @@ async def get_transcoding_progress(
     Raises:
         HTTPException: 视频不存在、无权限或获取失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权查看转码进度")
-            
-        progress = VideoTranscodingService.get_transcoding_progress(db, video_id)
-        return StandardResponse(
-            success=True,
-            message="获取转码进度成功",
-            data=progress
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Get transcoding progress error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.post("/{video_id}/publish", response_model=StandardResponse[VideoResponse])
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权查看转码进度")
+        
+    progress = await db.run_sync(VideoTranscodingService.get_transcoding_progress, video_id)
+    return StandardResponse(
+        success=True,
+        message="获取转码进度成功",
+        data=progress
+    )
+
+
+@router.post("/{video_id}/publish", response_model=VideoStandardResponse)
 async def publish_video(
     video_id: str,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    video: VideoContent = Depends(get_video_for_request)
 ):
     """
     发布视频
     
     Args:
         video_id: 视频ID
-        db: 数据库会话
+        db: 异步数据库会话
         current_user: 当前用户信息
+        video: 视频内容对象
         
     Returns:
         发布后的视频信息
@@ -599,49 +627,44 @@ async def publish_video(
     Raises:
         HTTPException: 视频不存在、无权限、状态不正确或发布失败时抛出相应错误
     """
-    try:
-        # 检查权限
-        video = VideoService.get_video_by_id(db, video_id)
-        if video.user_id != current_user["user_id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权发布此视频")
-            
-        # 检查视频状态
-        if video.transcoding_status != TranscodingStatus.COMPLETED:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="视频转码未完成")
-            
-        video = VideoService.update_video_status(
-            db, video_id, VideoStatus.PUBLISHED, current_user["user_id"]
-        )
-        
-        return StandardResponse(
-            success=True,
-            message="视频发布成功",
-            data=video
-        )
-    except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except BusinessException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Publish video error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
-
-
-@router.get("/popular/latest", response_model=StandardResponse[List[VideoResponse]])
+    # 检查权限
+    if video.user_id != current_user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权发布此视频")
+        
+    # 检查视频状态
+    if video.transcoding_status != _TRANSCODING_COMPLETED:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="视频转码未完成")
+        
+    video = await VideoService.update_video_status(
+        db, video, "published", current_user.user_id
+    )
+    
+    return StandardResponse(
+        success=True,
+        message="视频发布成功",
+        data=video
+    )
+
+
+@router.get("/popular/latest", response_model=VideoListStandardResponse, response_model_exclude_none=True)
 async def get_popular_videos(
+    request: Request,
+    response: Response,
     limit: int = Query(10, ge=1, le=50, description="返回数量"),
     days: int = Query(7, ge=1, le=30, description="时间范围(天)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     获取热门视频
     
+    支持If-None-Match条件请求，列表未变化时返回304
+    
     Args:
+        request: 请求对象
+        response: 响应对象
         limit: 返回视频数量
         days: 时间范围（天）
-        db: 数据库会话
+        db: 异步数据库会话
         
     Returns:
         热门视频列表
@@ -649,13 +672,20 @@ async def get_popular_videos(
     Raises:
         HTTPException: 查询失败时抛出相应错误
     """
-    try:
-        videos = VideoService.get_popular_videos(db, limit, days)
-        return StandardResponse(
-            success=True,
-            message="获取热门视频成功",
-            data=videos
-        )
-    except Exception as e:
-        logger.error(f"Get popular videos error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
\ No newline at end of file
+    videos = await VideoService.get_popular_videos(db, limit, days)
+    
+    # 列表顺序和各视频的更新时间共同决定响应内容
+    etag = build_etag("popular_videos", days, limit, *(
+        f"{video['id']}@{video['updated_at']}" for video in videos
+    ))
+    cache_control = cache_control_value(
+        HTTP_CACHE_MAX_AGE, public=True, stale_while_revalidate=VIDEO_STALE_WHILE_REVALIDATE
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control=cache_control)
+    
+    return with_cache_headers(ModelJSONResponse(VideoListStandardResponse(
+        success=True,
+        message="获取热门视频成功",
+        data=videos
+    ), exclude_none=True), response, etag, cache_control=cache_control)
\ No newline at end of file
@@ -1,8 +1,7 @@
 商家板块6财务中心
-from datetime import datetime
+from datetime import date, datetime
 from typing import Generic, TypeVar, Optional, List
-from pydantic import BaseModel, Field, validator, root_validator
-import math
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 DataT = TypeVar('DataT')
 
@@ -45,7 +44,8 @@ class PaginatedResponse(BaseModel, Generic[DataT]):
         if page_size > 100:
             page_size = 100
             
-        total_pages = math.ceil(total / page_size) if page_size > 0 and total > 0 else 0
+        # 整数向上取整，page_size已保证大于0
+        total_pages = (total + page_size - 1) // page_size
         
         # 确保当前页不超过总页数
         if total_pages > 0 and page > total_pages:
@@ -59,63 +59,63 @@ class PaginatedResponse(BaseModel, Generic[DataT]):
             total_pages=total_pages
         )
     
+    @computed_field
+    @property
     def has_next(self) -> bool:
         """是否有下一页"""
         return self.page < self.total_pages
     
+    @computed_field
+    @property
     def has_prev(self) -> bool:
         """是否有上一页"""
         return self.page > 1
     
+    @computed_field
+    @property
     def next_page(self) -> Optional[int]:
         """获取下一页页码"""
-        return self.page + 1 if self.has_next() else None
+        return self.page + 1 if self.page < self.total_pages else None
     
+    @computed_field
+    @property
     def prev_page(self) -> Optional[int]:
         """获取上一页页码"""
-        return self.page - 1 if self.has_prev() else None
+        return self.page - 1 if self.page > 1 else None
 
 
 class DateRangeParams(BaseModel):
     """日期范围参数"""
     
-    start_date: Optional[str] = Field(None, description="开始日期 (格式: YYYY-MM-DD)")
-    end_date: Optional[str] = Field(None, description="结束日期 (格式: YYYY-MM-DD)")
-    
-    @validator('start_date', 'end_date')
-    def validate_date_format(cls, v):
-        """验证日期格式"""
-        if v is not None:
-            if not isinstance(v, str):
-                raise ValueError('日期必须是字符串格式')
-            if len(v) != 10 or v[4] != '-' or v[7] != '-':
-                raise ValueError('日期格式必须为 YYYY-MM-DD')
-        return v
-    
-    @root_validator
-    def validate_date_range(cls, values):
+    model_config = ConfigDict(extra="forbid")
+    
+    start_date: Optional[date] = Field(None, description="开始日期 (格式: YYYY-MM-DD)")
+    end_date: Optional[date] = Field(None, description="结束日期 (格式: YYYY-MM-DD)")
+    
+    @model_validator(mode="after")
+    def validate_date_range(self) -> 'DateRangeParams':
         """验证日期范围的合理性"""
-        start_date, end_date = values.get('start_date'), values.get('end_date')
-        if start_date and end_date:
-            if start_date > end_date:
+        if self.start_date and self.end_date:
+            if self.start_date > self.end_date:
                 raise ValueError('开始日期不能晚于结束日期')
-        return values
+        return self
 
 
 class TimeRangeParams(BaseModel):
     """时间范围参数"""
     
+    model_config = ConfigDict(extra="forbid")
+    
     start_time: Optional[datetime] = Field(None, description="开始时间")
     end_time: Optional[datetime] = Field(None, description="结束时间")
     
-    @root_validator
-    def validate_time_range(cls, values):
+    @model_validator(mode="after")
+    def validate_time_range(self) -> 'TimeRangeParams':
         """验证时间范围的合理性"""
-        start_time, end_time = values.get('start_time'), values.get('end_time')
-        if start_time and end_time:
-            if start_time > end_time:
+        if self.start_time and self.end_time:
+            if self.start_time > self.end_time:
                 raise ValueError('开始时间不能晚于结束时间')
-        return values
+        return self
 
 
 class SortParams(BaseModel):
@@ -136,9 +136,8 @@ class SearchParams(BaseModel):
 class FilterParams(BaseModel):
     """过滤参数基类"""
     
-    class Config:
-        # 允许额外字段
-        extra = "allow"
+    # 允许额外字段
+    model_config = ConfigDict(extra="allow")
 
 
 class ResponseModel(BaseModel, Generic[DataT]):
@@ -10,13 +10,14 @@ from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from app.models.content_models import ContentType, ContentStatus
+from app.schemas.response_schemas import StandardResponse
 
 __all__ = [
     'ContentCreateSchema',
     'ContentUpdateSchema',
     'ContentResponseSchema',
     'ContentListResponseSchema',
-    'MediaUploadResponseSchema'
+    'ContentStandardResponse'
 ]
 
 
@@ -49,7 +50,8 @@ class ContentUpdateSchema(BaseModel):
 
 class ContentResponseSchema(BaseModel):
     """内容响应Schema"""
-    model_config = ConfigDict(from_attributes=True)
+    # 仅用于输出，延迟构建校验器；实例只读，重复出现的字符串值共用同一对象
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True, cache_strings='all')
     
     id: str = Field(..., description="内容ID")
     title: Optional[str] = Field(None, description="内容标题")
@@ -78,7 +80,7 @@ class ContentResponseSchema(BaseModel):
 
 class ContentListResponseSchema(BaseModel):
     """内容列表响应Schema"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 仅用于输出，延迟构建校验器
     
     contents: List[ContentResponseSchema] = Field(..., description="内容列表")
     total_count: int = Field(..., description="总数量")
@@ -87,12 +89,5 @@ class ContentListResponseSchema(BaseModel):
     has_next: bool = Field(..., description="是否有下一页")
 
 
-class MediaUploadResponseSchema(BaseModel):
-    """媒体上传响应Schema"""
-    model_config = ConfigDict(from_attributes=True)
-    
-    file_url: str = Field(..., description="文件URL")
-    file_name: str = Field(..., description="文件名")
-    file_size: int = Field(..., description="文件大小")
-    file_type: str = Field(..., description="文件类型")
-    upload_id: str = Field(..., description="上传ID")
\ No newline at end of file
+class ContentStandardResponse(StandardResponse[ContentResponseSchema]):
+    """内容详情标准响应Schema（高频接口使用的具体类型，导入时一次性构建）"""
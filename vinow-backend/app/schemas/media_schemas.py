@@ -11,6 +11,7 @@
 6. 分片上传请求模型（ChunkedUploadRequestSchema）
 7. 文件元数据模型（FileMetadataSchema）
 8. 上传初始化响应模型（UploadInitiationResponseSchema）
+9. 预签名URL请求参数模型（PresignedUrlRequestSchema）
 
 所有模型都使用Pydantic V2语法，并支持从ORM对象创建。
 """
@@ -27,7 +28,8 @@ __all__ = [
     'MediaUploadRequestSchema',
     'ChunkedUploadRequestSchema',
     'FileMetadataSchema',
-    'UploadInitiationResponseSchema'
+    'UploadInitiationResponseSchema',
+    'PresignedUrlRequestSchema'
 ]
 
 
@@ -42,14 +44,14 @@ class MediaUploadResponseSchema(BaseModel):
     file_size: int = Field(..., description="文件大小（字节）")  # 文件大小
     file_type: str = Field(..., description="文件类型")  # 文件类型
     upload_id: str = Field(..., description="上传ID")  # 上传ID
-    uploaded_at: str = Field(..., description="上传时间")  # 上传时间
+    uploaded_at: Optional[str] = Field(None, description="上传时间")  # 上传时间（可选）
 
 
 class ChunkedUploadResponseSchema(BaseModel):
     """
     分片上传响应模型 - 用于分片上传的响应
     """
-    model_config = ConfigDict(from_attributes=True)  # 允许从ORM对象创建
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 允许从ORM对象创建，仅用于输出故延迟构建校验器
     
     upload_id: str = Field(..., description="上传会话ID")  # 上传ID
     chunk_number: int = Field(..., description="当前分片序号")  # 分片序号
@@ -63,7 +65,7 @@ class PresignedUrlResponseSchema(BaseModel):
     """
     预签名URL响应模型 - 用于生成预签名URL的响应
     """
-    model_config = ConfigDict(from_attributes=True)  # 允许从ORM对象创建
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 允许从ORM对象创建，仅用于输出故延迟构建校验器
     
     presigned_url: str = Field(..., description="预签名URL")  # 预签名URL
     expires_in: int = Field(..., description="过期时间（秒）")  # 过期时间
@@ -73,7 +75,9 @@ class MediaFileInfoSchema(BaseModel):
     """
     媒体文件信息模型 - 用于存储媒体文件的详细信息
     """
-    model_config = ConfigDict(from_attributes=True)  # 允许从ORM对象创建
+    model_config = ConfigDict(
+        from_attributes=True, defer_build=True, frozen=True, cache_strings='all'
+    )  # 允许从ORM对象创建，仅用于输出故延迟构建校验器；实例只读，重复字符串共用同一对象
     
     id: str = Field(..., description="文件ID")  # 文件ID
     content_id: str = Field(..., description="关联内容ID")  # 内容ID
@@ -109,7 +113,7 @@ class ChunkedUploadRequestSchema(BaseModel):
     """
     分片上传请求模型 - 用于分片上传的请求参数
     """
-    model_config = ConfigDict(from_attributes=True)  # 允许从ORM对象创建
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 允许从ORM对象创建，冷路径模型延迟构建校验器
     
     upload_id: str = Field(..., description="上传会话ID")  # 上传ID
     chunk_number: int = Field(..., ge=1, description="当前分片序号")  # 分片序号
@@ -121,7 +125,7 @@ class FileMetadataSchema(BaseModel):
     """
     文件元数据模型 - 用于存储文件的元数据信息
     """
-    model_config = ConfigDict(from_attributes=True)  # 允许从ORM对象创建
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 允许从ORM对象创建，冷路径模型延迟构建校验器
     
     file_path: str = Field(..., description="文件路径")  # 文件路径
     file_name: str = Field(..., description="文件名")  # 文件名
@@ -138,10 +142,17 @@ class UploadInitiationResponseSchema(BaseModel):
     """
     上传初始化响应模型 - 用于分片上传初始化的响应
     """
-    model_config = ConfigDict(from_attributes=True)  # 允许从ORM对象创建
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 允许从ORM对象创建，仅用于输出故延迟构建校验器
     
     upload_id: str = Field(..., description="上传会话ID")  # 上传ID
     chunk_size: int = Field(..., description="分片大小")  # 分片大小
     total_chunks: int = Field(..., description="总分片数")  # 总分片数
     file_name: str = Field(..., description="文件名")  # 文件名
-    file_size: int = Field(..., description="文件大小")  # 文件大小
\ No newline at end of file
+    file_size: int = Field(..., description="文件大小")  # 文件大小
+
+
+class PresignedUrlRequestSchema(BaseModel):
+    """
+    预签名URL请求参数模型 - 用于生成预签名URL的查询参数
+    """
+    expires_in: int = Field(3600, ge=60, le=86400, description="URL过期时间（秒）")  # 过期时间
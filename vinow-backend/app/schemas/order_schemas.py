@@ -1,8 +1,26 @@
 # app/schemas/order.py
 from typing import Optional, List, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
-from app.models.order import OrderStatus, PaymentMethod
+from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field
+
+# 仅用于输出的响应模型及冷路径请求模型延迟到首次使用时再构建校验器，减少导入耗时和常驻内存
+RESPONSE_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+class OrderTrendPoint(TypedDict):
+    """订单趋势单日数据"""
+    date: str  # 日期（YYYY-MM-DD）
+    total_orders: int  # 订单总数
+    completed_orders: int  # 已核销订单数
+    total_amount: float  # 订单总金额
+
+class ProductRankingItem(TypedDict):
+    """商品排行单项数据"""
+    product_id: str  # 商品ID
+    product_name: str  # 商品名称
+    total_quantity: int  # 销售数量
+    total_amount: float  # 销售金额
+    order_count: int  # 订单数
 
 class OrderResponse(BaseModel):
     """订单响应模型"""
@@ -11,6 +29,7 @@ class OrderResponse(BaseModel):
 
 class OrderListResponse(BaseModel):
     """订单列表响应模型"""
+    model_config = RESPONSE_MODEL_CONFIG
     orders: List[Any]
     total_count: int
     page: int
@@ -19,6 +38,7 @@ class OrderListResponse(BaseModel):
 
 class OrderStatsResponse(BaseModel):
     """订单统计响应模型"""
+    model_config = RESPONSE_MODEL_CONFIG
     total_orders: int
     pending_orders: int
     completed_amount: float
@@ -26,6 +46,7 @@ class OrderStatsResponse(BaseModel):
 
 class RefundRequest(BaseModel):
     """退款请求模型"""
+    model_config = RESPONSE_MODEL_CONFIG
     order_id: str = Field(..., description="订单ID")
     reason: str = Field(..., description="退款原因")
     explanation: Optional[str] = Field(None, description="详细说明")
@@ -33,20 +54,24 @@ class RefundRequest(BaseModel):
 
 class RefundApprovalRequest(BaseModel):
     """退款审批请求模型"""
+    model_config = RESPONSE_MODEL_CONFIG
     processed_by: str = Field(..., description="处理人员")
     reject_reason: Optional[str] = Field(None, description="拒绝原因")
 
 class OrderTrendResponse(BaseModel):
     """订单趋势响应模型"""
+    model_config = RESPONSE_MODEL_CONFIG
     period: str
-    trends: List[dict]
+    trends: List[OrderTrendPoint]
 
 class ProductRankingResponse(BaseModel):
     """商品排行响应模型"""
-    products: List[dict]
+    model_config = RESPONSE_MODEL_CONFIG
+    products: List[ProductRankingItem]
 
 class DailyReportResponse(BaseModel):
     """日报表响应模型"""
+    model_config = RESPONSE_MODEL_CONFIG
     report_date: str
     total_orders: int
     verified_orders: int
@@ -63,10 +88,12 @@ class DailyReportResponse(BaseModel):
 
     from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 from app.models.order import OrderStatus
 
 class OrderItemCreate(BaseModel):
+    # 已校验的订单项实例按引用放入订单，不再重复校验和复制
+    model_config = ConfigDict(revalidate_instances="never")
     product_id: str = Field(..., min_length=1, description="商品ID")
     product_name: str = Field(..., min_length=1, max_length=255, description="商品名称")
     product_image: Optional[str] = Field(None, description="商品图片")
@@ -74,22 +101,19 @@ class OrderItemCreate(BaseModel):
     quantity: int = Field(..., gt=0, description="数量")
 
 class OrderCreate(BaseModel):
+    model_config = ConfigDict(revalidate_instances="never")
     merchant_id: str = Field(..., min_length=1, description="商家ID")
-    items: List[OrderItemCreate] = Field(..., min_items=1, description="订单项列表")
+    items: List[OrderItemCreate] = Field(..., min_length=1, description="订单项列表")
     shipping_address: Optional[Dict[str, Any]] = Field(None, description="收货地址")
     contact_info: Optional[Dict[str, Any]] = Field(None, description="联系信息")
-    
-    @validator('items')
-    def validate_items(cls, v):
-        if not v:
-            raise ValueError("Order must have at least one item")
-        return v
 
 class OrderUpdate(BaseModel):
     status: Optional[OrderStatus] = Field(None, description="订单状态")
     cancellation_reason: Optional[str] = Field(None, max_length=500, description="取消原因")
 
 class OrderResponse(BaseModel):
+    # 实例只读，状态、货币等重复字符串共用同一对象
+    model_config = ConfigDict(from_attributes=True, frozen=True, cache_strings="all")
     id: str = Field(..., description="订单ID")
     order_number: str = Field(..., description="订单号")
     user_id: str = Field(..., description="用户ID")
@@ -99,8 +123,9 @@ class OrderResponse(BaseModel):
     discount_amount: float = Field(..., description="折扣金额")
     final_amount: float = Field(..., description="实付金额")
     currency: str = Field(..., description="货币")
-    shipping_address: Optional[Dict[str, Any]] = Field(None, description="收货地址")
-    contact_info: Optional[Dict[str, Any]] = Field(None, description="联系信息")
+    # 地址、联系信息由数据库JSONB字段直接读出，输出时跳过逐项校验
+    shipping_address: SkipValidation[Optional[Dict[str, Any]]] = Field(None, description="收货地址")
+    contact_info: SkipValidation[Optional[Dict[str, Any]]] = Field(None, description="联系信息")
     expires_at: Optional[datetime] = Field(None, description="订单过期时间")
     paid_at: Optional[datetime] = Field(None, description="支付时间")
     completed_at: Optional[datetime] = Field(None, description="完成时间")
@@ -108,11 +133,10 @@ class OrderResponse(BaseModel):
     cancellation_reason: Optional[str] = Field(None, description="取消原因")
     created_at: datetime = Field(..., description="创建时间")
     updated_at: datetime = Field(..., description="更新时间")
-    
-    class Config:
-        from_attributes = True
 
 class OrderListResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)  # 仅用于输出，延迟构建校验器
+    
     items: List[OrderResponse] = Field(..., description="订单列表")
     total: int = Field(..., description="总记录数")
     page: int = Field(..., description="当前页码")
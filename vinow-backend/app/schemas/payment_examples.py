@@ -0,0 +1,61 @@
+"""
+支付接口OpenAPI示例数据
+
+示例数据仅用于生成接口文档，通过路由的Body(openapi_examples=...)和responses参数传入，
+不放在模型字段上，避免随每个字段的FieldInfo常驻内存。
+"""
+
+from typing import Any, Dict
+
+__all__ = [
+    'PAYMENT_CREATE_EXAMPLES',
+    'PAYMENT_CALLBACK_EXAMPLES',
+    'PAYMENT_RESPONSE_EXAMPLE'
+]
+
+# 创建支付请求示例
+PAYMENT_CREATE_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "momo": {
+        "summary": "MoMo钱包支付",
+        "value": {
+            "order_id": "ORD202312010001",
+            "method": "momo",
+            "amount": 150000,
+            "currency": "VND"
+        }
+    }
+}
+
+# 支付回调请求示例
+PAYMENT_CALLBACK_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "success": {
+        "summary": "支付成功回调",
+        "value": {
+            "payment_id": "pay_123e4567-e89b-12d3-a456-426614174000",
+            "transaction_id": "TXN2023120100001",
+            "status": "success",
+            "amount": 150000,
+            "currency": "VND",
+            "signature": "a1b2c3d4e5f67890...",
+            "timestamp": "2023-12-01T10:30:00Z",
+            "metadata": {"bank_code": "VCB"}
+        }
+    }
+}
+
+# 支付详情响应示例
+PAYMENT_RESPONSE_EXAMPLE: Dict[str, Any] = {
+    "id": "pay_123e4567-e89b-12d3-a456-426614174000",
+    "order_id": "ORD202312010001",
+    "payment_number": "PMT2023120100001",
+    "method": "momo",
+    "amount": 150000,
+    "currency": "VND",
+    "status": "pending",
+    "gateway_transaction_id": "GTX2023120100001",
+    "gateway_response": {"result_code": 0},
+    "paid_at": "2023-12-01T10:30:00Z",
+    "expires_at": "2023-12-01T11:00:00Z",
+    "created_at": "2023-12-01T10:00:00Z",
+    "updated_at": "2023-12-01T10:00:00Z"
+}
@@ -12,7 +12,8 @@ class ReplyCreate(ReplyBase):
     review_id: int
 
 class ReplyInDB(ReplyBase):
-    model_config = ConfigDict(from_attributes=True)
+    # 回复类型等重复字符串共用同一对象，实例只读；仅在创建回复时使用，延迟构建校验器
+    model_config = ConfigDict(from_attributes=True, frozen=True, cache_strings='all', defer_build=True)
     
     id: int
     merchant_id: int
@@ -20,5 +21,7 @@ class ReplyInDB(ReplyBase):
     created_at: datetime
 
 class ReplyResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)  # 仅用于输出，延迟构建校验器
+    
     success: bool = True
     data: ReplyInDB
\ No newline at end of file
@@ -11,13 +11,17 @@
 6. 批量操作响应格式（BatchOperationResponse）
 7. 统计信息响应格式（StatisticsResponse）
 
-以及相应的响应创建工具函数。
+以及相应的响应创建工具函数（数据由服务端构造，工具函数跳过模型校验直接构造响应）。
 """
 
 from typing import TypeVar, Generic, Optional, List, Any, Dict
+from typing_extensions import TypedDict
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
+# 文件上传响应与媒体上传响应共用同一个模型
+from app.schemas.media_schemas import MediaUploadResponseSchema as UploadResponse
+
 # 定义泛型类型变量
 T = TypeVar('T')
 
@@ -29,19 +33,57 @@ __all__ = [
     'UploadResponse',
     'BatchOperationResponse',
     'StatisticsResponse',
+    'PaginationInfo',
+    'DatabaseHealthInfo',
+    'CacheHealthInfo',
     'create_success_response',
     'create_error_response',
     'create_paginated_response'
 ]
 
 
+class PaginationInfo(TypedDict, total=False):
+    """
+    分页信息 - 仅作为PaginatedResponse的字段使用
+
+    使用TypedDict而非嵌套模型，校验时不再单独构建模型实例；
+    页码分页与游标分页的字段均为可选
+    """
+    page: int  # 当前页码
+    page_size: int  # 每页数量
+    total: Optional[int]  # 总记录数（未统计时为空）
+    pages: Optional[int]  # 总页数（未统计时为空）
+    total_count: int  # 总记录数
+    total_pages: int  # 总页数
+    has_next: bool  # 是否有下一页
+    has_previous: bool  # 是否有上一页
+    next_cursor: Optional[str]  # 下一页游标
+
+
+class DatabaseHealthInfo(TypedDict, total=False):
+    """数据库健康状态 - 仅作为HealthCheckResponse的字段使用"""
+    supabase: bool  # Supabase连接状态
+    redis: bool  # Redis连接状态
+    sqlalchemy: bool  # SQLAlchemy连接状态
+    timestamp: datetime  # 检查时间
+
+
+class CacheHealthInfo(TypedDict, total=False):
+    """缓存健康状态 - 仅作为HealthCheckResponse的字段使用"""
+    status: str  # 健康状态
+    message: str  # 状态说明
+    redis_version: Optional[str]  # Redis版本
+    used_memory: Optional[str]  # 已用内存
+    connected_clients: Optional[int]  # 客户端连接数
+
+
 class StandardResponse(BaseModel, Generic[T]):
     """
     标准API响应模型 - 所有API响应的统一格式
     
     Generic[T]: 泛型类型，T为数据字段的类型
     """
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
     
     success: bool = Field(..., description="请求是否成功")  # 成功状态
     message: str = Field(..., description="响应消息")  # 响应消息
@@ -56,12 +98,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
     
     Generic[T]: 泛型类型，T为列表项的类型
     """
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
     
     success: bool = Field(..., description="请求是否成功")  # 成功状态
     message: str = Field(..., description="响应消息")  # 响应消息
     data: List[T] = Field(..., description="数据列表")  # 数据列表
-    pagination: Dict[str, Any] = Field(..., description="分页信息")  # 分页信息
+    pagination: PaginationInfo = Field(..., description="分页信息")  # 分页信息
     timestamp: datetime = Field(default_factory=datetime.now, description="响应时间戳")  # 时间戳
 
 
@@ -69,7 +111,7 @@ class ErrorResponse(BaseModel):
     """
     错误响应模型 - 用于错误响应的统一格式
     """
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
     
     success: bool = Field(False, description="请求是否成功")  # 成功状态（固定为False）
     message: str = Field(..., description="错误消息")  # 错误消息
@@ -93,11 +135,11 @@ def create_success_response(
     Returns:
         成功响应模型实例
     """
-    return StandardResponse(
+    # 服务端构造的可信数据，有意跳过校验，直接构造模型
+    return StandardResponse.model_construct(
         success=True,
         message=message,
-        data=data,
-        timestamp=datetime.now()
+        data=data
     )
 
 
@@ -119,17 +161,41 @@ def create_error_response(
     Returns:
         错误响应模型实例
     """
-    return ErrorResponse(
+    # 服务端构造的可信数据，有意跳过校验，直接构造模型
+    return ErrorResponse.model_construct(
         success=False,
         message=message,
         error={
             "code": error_code,
             "details": error_details
-        },
-        timestamp=datetime.now()
+        }
     )
 
 
+def _build_pagination_info(total_count: int, page: int, page_size: int) -> PaginationInfo:
+    """
+    计算分页信息
+
+    Args:
+        total_count: 总记录数
+        page: 当前页码
+        page_size: 每页大小
+
+    Returns:
+        分页信息字典
+    """
+    # 整数向上取整计算总页数（每页大小由查询参数校验为不小于1，此处仅防御0）
+    total_pages = -(-total_count // page_size) if page_size else 0
+    return {
+        "total_count": total_count,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_previous": page > 1
+    }
+
+
 def create_paginated_response(
     data: List[Any],
     total_count: int,
@@ -150,26 +216,12 @@ def create_paginated_response(
     Returns:
         分页响应模型实例
     """
-    # 计算总页数
-    total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
-    # 判断是否有下一页
-    has_next = page < total_pages
-    # 判断是否有上一页
-    has_previous = page > 1
-    
-    return PaginatedResponse(
+    # 服务端构造的可信数据，有意跳过校验，直接构造模型（分页信息为普通字典，不做嵌套校验）
+    return PaginatedResponse.model_construct(
         success=True,
         message=message,
         data=data,
-        pagination={
-            "total_count": total_count,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": total_pages,
-            "has_next": has_next,
-            "has_previous": has_previous
-        },
-        timestamp=datetime.now()
+        pagination=_build_pagination_info(total_count, page, page_size)
     )
 
 
@@ -177,34 +229,21 @@ class HealthCheckResponse(BaseModel):
     """
     健康检查响应模型
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 仅用于输出，延迟构建校验器
     
     status: str = Field(..., description="健康状态")  # 健康状态
     timestamp: float = Field(..., description="检查时间戳")  # 时间戳
     version: str = Field(..., description="应用版本")  # 应用版本
     environment: str = Field(..., description="运行环境")  # 运行环境
-    database: Dict[str, Any] = Field(..., description="数据库状态")  # 数据库状态
-    cache: Dict[str, Any] = Field(..., description="缓存状态")  # 缓存状态
-
-
-class UploadResponse(BaseModel):
-    """
-    文件上传响应模型
-    """
-    model_config = ConfigDict(from_attributes=True)
-    
-    file_url: str = Field(..., description="文件URL")  # 文件URL
-    file_name: str = Field(..., description="文件名")  # 文件名
-    file_size: int = Field(..., description="文件大小")  # 文件大小
-    file_type: str = Field(..., description="文件类型")  # 文件类型
-    upload_id: str = Field(..., description="上传ID")  # 上传ID
+    database: DatabaseHealthInfo = Field(..., description="数据库状态")  # 数据库状态
+    cache: CacheHealthInfo = Field(..., description="缓存状态")  # 缓存状态
 
 
 class BatchOperationResponse(BaseModel):
     """
     批量操作响应模型
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 仅用于输出，延迟构建校验器
     
     success_count: int = Field(..., description="成功数量")  # 成功数量
     failure_count: int = Field(..., description="失败数量")  # 失败数量
@@ -216,7 +255,7 @@ class StatisticsResponse(BaseModel):
     """
     统计信息响应模型
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)  # 仅用于输出，延迟构建校验器
     
     total_count: int = Field(..., description="总数")  # 总数
     today_count: int = Field(..., description="今日数量")  # 今日数量
@@ -224,46 +263,3 @@ class StatisticsResponse(BaseModel):
     month_count: int = Field(..., description="本月数量")  # 本月数量
     growth_rate: float = Field(..., description="增长率")  # 增长率
     statistics: Dict[str, Any] = Field(default_factory=dict, description="详细统计")  # 详细统计
-
-    内容板块-响应模型
-
-from pydantic import BaseModel, Generic, TypeVar
-from typing import Optional, List, Any, Generic
-from datetime import datetime
-
-T = TypeVar('T')
-
-
-class StandardResponse(BaseModel, Generic[T]):
-    """标准API响应模型"""
-    success: bool
-    message: str
-    data: Optional[T] = None
-    error_code: Optional[str] = None
-    timestamp: datetime = datetime.utcnow()
-
-
-class PaginatedResponse(BaseModel, Generic[T]):
-    """分页API响应模型"""
-    success: bool
-    message: str
-    data: List[T]
-    pagination: 'PaginationParams'
-    timestamp: datetime = datetime.utcnow()
-
-
-class ErrorResponse(BaseModel):
-    """错误响应模型"""
-    success: bool = False
-    message: str
-    error_code: str
-    details: Optional[Dict[str, Any]] = None
-    timestamp: datetime = datetime.utcnow()
-
-
-class HealthCheckResponse(BaseModel):
-    """健康检查响应"""
-    status: str
-    timestamp: datetime
-    services: Dict[str, str]
-    version: str
\ No newline at end of file
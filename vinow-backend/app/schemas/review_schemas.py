@@ -8,9 +8,12 @@
 - 不同业务场景下的数据结构定义
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
 from typing import Optional, List
 from datetime import datetime
+from functools import lru_cache
+import orjson
+from app.models.content_models import ContentStatus
 
 class ReviewBase(BaseModel):
     """
@@ -66,8 +69,15 @@ class ReviewInDB(ReviewBase):
     
     表示从数据库查询出的完整评价信息
     """
-    # 启用 ORM 模式，允许从 ORM 对象创建 Pydantic 模型
-    model_config = ConfigDict(from_attributes=True)
+    # 启用 ORM 模式，允许从 ORM 对象创建 Pydantic 模型；查询结果只读，实例冻结（子类ReviewWithReply同样适用）
+    # 嵌套在列表响应中的已有实例不再重新校验，赋值不校验，未知字段直接忽略
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore"
+    )
     
     # 评价ID
     id: int
@@ -87,14 +97,70 @@ class ReviewWithReply(ReviewInDB):
     
     在基本评价信息基础上增加回复相关信息
     """
-    # 是否有回复
-    has_reply: bool = False
-    
     # 回复内容（可选）
     reply_content: Optional[str] = None
     
     # 回复创建时间（可选）
     reply_created_at: Optional[datetime] = None
+    
+    @computed_field
+    @property
+    def has_reply(self) -> bool:
+        """是否有回复（回复内容为必填项，由回复内容是否存在推导，不再单独校验）"""
+        return self.reply_content is not None
+
+# 评价列表的校验器只在导入时构建一次，各请求复用
+REVIEW_LIST_ADAPTER: TypeAdapter[List[ReviewWithReply]] = TypeAdapter(List[ReviewWithReply])
+
+@lru_cache(maxsize=512)
+def _empty_list_envelope(total: Optional[int], page: int, limit: int) -> bytes:
+    """
+    生成空评价列表的响应JSON字节
+    
+    无评价的商户或超出末页的请求返回的响应只由分页参数决定，按参数缓存序列化结果
+    
+    Args:
+        total: 总记录数（未统计时为None）
+        page: 当前页码
+        limit: 每页条数
+        
+    Returns:
+        bytes: 空列表响应JSON字节
+    """
+    return orjson.dumps({
+        "success": True,
+        "data": {
+            "reviews": [],
+            "pagination": {"total": total, "page": page, "limit": limit}
+        }
+    })
+
+class Pagination(BaseModel):
+    """
+    分页信息模型
+    
+    列表接口返回的分页信息
+    """
+    # 总记录数（未统计时为None）
+    total: Optional[int] = None
+    
+    # 当前页码
+    page: int
+    
+    # 每页条数
+    limit: int
+
+class ReviewListData(BaseModel):
+    """
+    评价列表数据模型
+    
+    评价列表及分页信息，字段类型固定，校验和序列化不再逐键处理任意字典
+    """
+    # 评价列表
+    reviews: List[ReviewWithReply]
+    
+    # 分页信息
+    pagination: Pagination
 
 class ReviewListResponse(BaseModel):
     """
@@ -106,32 +172,90 @@ class ReviewListResponse(BaseModel):
     success: bool = True
     
     # 返回的数据
-    data: dict
+    data: ReviewListData
     
     @classmethod
-    def create_response(cls, reviews: List[ReviewWithReply], total: int, page: int, limit: int):
+    def create_response(cls, reviews: List[ReviewWithReply], total: Optional[int], page: int, limit: int):
         """
         创建标准化的列表响应
         
+        评价列表由模块级的列表适配器一次校验为ReviewWithReply实例；外层包装仅包含服务端计算的
+        分页信息，因此跳过外层校验直接构造模型，不可用于包装客户端传入的数据。
+        
         Args:
-            reviews: 评价列表数据
-            total: 总记录数
+            reviews: 评价列表数据（数据库记录字典或ReviewWithReply实例）
+            total: 总记录数（未统计时为None）
             page: 当前页码
             limit: 每页条数
             
         Returns:
             ReviewListResponse: 标准化的响应对象
         """
-        return cls(
-            data={
-                "reviews": reviews,
+        return cls.model_construct(
+            success=True,
+            data=ReviewListData.model_construct(
+                reviews=REVIEW_LIST_ADAPTER.validate_python(reviews),
+                pagination=Pagination.model_construct(total=total, page=page, limit=limit)
+            )
+        )
+    
+    @classmethod
+    def create_response_dict(cls, reviews: List[ReviewWithReply], total: Optional[int], page: int, limit: int) -> dict:
+        """
+        创建标准化的列表响应字典
+        
+        结构与create_response序列化后的结果一致，但不构造响应模型；评价列表经列表适配器
+        校验后直接转换为可JSON序列化的字典，路由可直接交给ORJSONResponse输出。
+        
+        Args:
+            reviews: 评价列表数据（数据库记录字典或ReviewWithReply实例）
+            total: 总记录数（未统计时为None）
+            page: 当前页码
+            limit: 每页条数
+            
+        Returns:
+            dict: 标准化的响应字典
+        """
+        return {
+            "success": True,
+            "data": {
+                "reviews": REVIEW_LIST_ADAPTER.dump_python(
+                    REVIEW_LIST_ADAPTER.validate_python(reviews), mode="json"
+                ),
                 "pagination": {
                     "total": total,
                     "page": page,
                     "limit": limit
                 }
             }
-        )
+        }
+    
+    @classmethod
+    def create_response_bytes(cls, reviews: List[ReviewWithReply], total: Optional[int], page: int, limit: int) -> bytes:
+        """
+        创建标准化的列表响应JSON字节
+        
+        结构与create_response_dict一致；评价列表经列表适配器校验后由序列化器直接输出JSON字节，
+        不再生成中间字典，分页信息单独编码后拼接；空列表直接返回按分页参数缓存的结果。
+        
+        Args:
+            reviews: 评价列表数据（数据库记录字典或ReviewWithReply实例）
+            total: 总记录数（未统计时为None）
+            page: 当前页码
+            limit: 每页条数
+            
+        Returns:
+            bytes: 标准化的响应JSON字节
+        """
+        if not reviews:
+            return _empty_list_envelope(total, page, limit)
+        return b"".join((
+            b'{"success":true,"data":{"reviews":',
+            REVIEW_LIST_ADAPTER.dump_json(REVIEW_LIST_ADAPTER.validate_python(reviews)),
+            b',"pagination":',
+            orjson.dumps({"total": total, "page": page, "limit": limit}),
+            b'}}'
+        ))
 
 class ReviewSummary(BaseModel):
     """
@@ -164,4 +288,45 @@ class ReviewSummaryResponse(BaseModel):
     success: bool = True
     
     # 返回的汇总数据
-    data: ReviewSummary
\ No newline at end of file
+    data: ReviewSummary
+
+
+class ReviewQueryParams(BaseModel):
+    """
+    商户评价列表查询参数模型
+    
+    作为单个依赖注入到评价列表接口，所有查询参数一次完成校验
+    """
+    # 页码
+    page: int = Field(1, ge=1, description="页码")
+    
+    # 每页数量
+    limit: int = Field(20, ge=1, le=100, description="每页数量")
+    
+    # 评分过滤（1-5星）
+    rating: Optional[int] = Field(None, ge=1, le=5, description="评分过滤")
+    
+    # 时间范围过滤
+    date_range: Optional[str] = Field(None, description="时间范围: today/week/month")
+    
+    # 是否已回复过滤
+    has_reply: Optional[bool] = Field(None, description="是否已回复")
+    
+    # 是否返回总记录数（不需要时跳过计数查询）
+    include_total: bool = Field(False, description="是否返回总记录数")
+
+
+class ReviewListParams(BaseModel):
+    """
+    内容评价列表过滤参数模型
+    
+    作为单个依赖注入到评价列表接口，所有过滤条件一次完成校验
+    """
+    target_entity_type: Optional[str] = Field(None, description="目标实体类型过滤")  # 目标实体类型
+    target_entity_id: Optional[str] = Field(None, description="目标实体ID过滤")  # 目标实体ID
+    author_id: Optional[str] = Field(None, description="作者ID过滤")  # 作者ID
+    status: Optional[ContentStatus] = Field(None, description="评价状态过滤")  # 评价状态
+    min_rating: Optional[float] = Field(None, ge=1.0, le=5.0, description="最低评分过滤")  # 最低评分
+    max_rating: Optional[float] = Field(None, ge=1.0, le=5.0, description="最高评分过滤")  # 最高评分
+    has_media: Optional[bool] = Field(None, description="是否有媒体文件过滤")  # 是否有媒体
+    is_verified: Optional[bool] = Field(None, description="是否已验证过滤")  # 是否已验证
@@ -4,87 +4,122 @@
 
 本模块定义了视频内容管理系统的Pydantic数据模型，包括：
 1. 视频创建和更新模型（VideoCreate, VideoUpdate）
-2. 视频响应模型（VideoResponse）
+2. 视频响应模型（VideoCore, VideoResponse）
 3. 视频转码配置模型（TranscodingProfileResponse）
 4. 视频缩略图模型（ThumbnailResponse）
 5. 视频上传相关模型（VideoUploadResponse, VideoUploadComplete）
 6. 视频分析模型（VideoAnalyticsResponse）
 7. 视频互动模型（VideoInteractionCreate）
 8. 视频统计模型（VideoStatsResponse）
+9. 高频接口的标准响应模型（VideoStandardResponse等）
 
 所有模型都使用Pydantic V2语法，并支持从ORM对象创建。
 """
 
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from enum import Enum
+from pydantic import AliasChoices, BaseModel, BeforeValidator, Field, ConfigDict, TypeAdapter, field_validator
+from typing import Optional, List, Literal, Tuple
+from datetime import datetime, timezone
+from typing_extensions import Annotated, TypedDict
+
+from app.schemas.response_schemas import StandardResponse
 
 __all__ = [
     'VideoStatus',
     'TranscodingStatus',
     'VideoVisibility',
+    'ORMBase',
     'VideoCreate',
     'VideoUpdate',
+    'VideoCore',
     'VideoResponse',
     'TranscodingProfileResponse',
     'ThumbnailResponse',
+    'PartETag',
     'VideoUploadResponse',
+    'MultipartUploadInit',
     'VideoUploadComplete',
     'VideoAnalyticsResponse',
     'VideoInteractionCreate',
-    'VideoStatsResponse'
+    'VideoStatsResponse',
+    'VideoStandardResponse',
+    'VideoListStandardResponse',
+    'VideoStatsStandardResponse',
+    'VIDEO_LIST_ADAPTER'
 ]
 
 
-class VideoStatus(str, Enum):
-    """视频状态枚举"""
-    DRAFT = "draft"
-    PROCESSING = "processing"
-    READY = "ready"
-    PUBLISHED = "published"
-    REJECTED = "rejected"
+# 状态、可见性取值使用Literal类型，校验时直接做字符串集合匹配，字段值保持为普通字符串
+# 视频状态：草稿、处理中、就绪、已发布、已拒绝
+VideoStatus = Literal["draft", "processing", "ready", "published", "rejected"]
+
+# 转码状态：等待中、转码中、已完成、失败
+TranscodingStatus = Literal["pending", "processing", "completed", "failed"]
+
+# 视频可见性：公开、私密、不公开列出
+VideoVisibility = Literal["public", "private", "unlisted"]
+
+# 单个视频的标签数量上限
+MAX_VIDEO_TAGS = 50
+
+# 创建、更新请求共用的标题与描述类型，字段约束只声明一次
+Title = Annotated[str, Field(min_length=1, max_length=500, description="视频标题")]
+OptionalTitle = Annotated[Optional[str], Field(default=None, min_length=1, max_length=500, description="视频标题")]
+Description = Annotated[Optional[str], Field(default=None, max_length=5000, description="视频描述")]
+
 
+def _dedup_tags(tags: Optional[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+    """按首次出现的顺序去除重复标签"""
+    if tags is None:
+        return None
+    return tuple(dict.fromkeys(tags))
 
-class TranscodingStatus(str, Enum):
-    """转码状态枚举"""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
 
+def _datetime_to_ts(value):
+    """数据库中的datetime（无时区时按UTC处理）转换为Unix秒级时间戳，其他值原样交给int校验"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return value
 
-class VideoVisibility(str, Enum):
-    """视频可见性枚举"""
-    PUBLIC = "public"
-    PRIVATE = "private"
-    UNLISTED = "unlisted"
 
+class ORMBase(BaseModel):
+    """视频模型公共基类，统一从ORM对象创建等配置，子类只声明差异项"""
+    # 模型由可信的数据库记录构造：嵌套的已有实例不再重新校验，赋值不校验，未知字段直接忽略
+    model_config = ConfigDict(
+        from_attributes=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore"
+    )
 
-class VideoCreate(BaseModel):
+
+class VideoCreate(ORMBase):
     """创建视频请求模型"""
-    model_config = ConfigDict(from_attributes=True)
     
-    title: str = Field(..., min_length=1, max_length=500, description="视频标题")
-    description: Optional[str] = Field(None, max_length=5000, description="视频描述")
-    tags: List[str] = Field(default_factory=list, description="视频标签")
+    title: Title
+    description: Description
+    tags: Tuple[str, ...] = Field(default=(), max_length=MAX_VIDEO_TAGS, description="视频标签")
     merchant_id: Optional[str] = Field(None, description="商家ID")
-    visibility: VideoVisibility = Field(default=VideoVisibility.PUBLIC, description="视频可见性")
+    visibility: VideoVisibility = Field(default="public", description="视频可见性")
+    
+    dedup_tags = field_validator("tags")(_dedup_tags)
 
 
-class VideoUpdate(BaseModel):
+class VideoUpdate(ORMBase):
     """更新视频请求模型"""
-    model_config = ConfigDict(from_attributes=True)
     
-    title: Optional[str] = Field(None, min_length=1, max_length=500, description="视频标题")
-    description: Optional[str] = Field(None, max_length=5000, description="视频描述")
-    tags: Optional[List[str]] = Field(None, description="视频标签")
+    title: OptionalTitle
+    description: Description
+    tags: Optional[Tuple[str, ...]] = Field(None, max_length=MAX_VIDEO_TAGS, description="视频标签")
     visibility: Optional[VideoVisibility] = Field(None, description="视频可见性")
+    
+    dedup_tags = field_validator("tags")(_dedup_tags)
 
 
-class VideoResponse(BaseModel):
-    """视频响应模型"""
-    model_config = ConfigDict(from_attributes=True)
+class VideoCore(ORMBase):
+    """视频核心信息模型（列表接口使用）"""
+    model_config = ConfigDict(frozen=True)
     
     id: str
     user_id: str
@@ -94,29 +129,38 @@ class VideoResponse(BaseModel):
     tags: Optional[List[str]]
     status: VideoStatus
     visibility: VideoVisibility
+    duration: Optional[float]
+    view_count: int
+    like_count: int
+    share_count: int
+    comment_count: int
+    created_at: datetime
+    updated_at: datetime
+    published_at: Optional[datetime]
+
+
+class VideoResponse(VideoCore):
+    """视频响应模型（详情接口使用，在核心信息基础上增加文件、转码和审核信息）"""
+    
     original_filename: str
     file_size: int
-    duration: Optional[float]
     resolution: Optional[str]
     format: Optional[str]
     transcoding_status: TranscodingStatus
     transcoding_progress: float
-    view_count: int
-    like_count: int
-    share_count: int
-    comment_count: int
     is_approved: bool
     approved_by: Optional[str]
     approved_at: Optional[datetime]
     rejection_reason: Optional[str]
-    created_at: datetime
-    updated_at: datetime
-    published_at: Optional[datetime]
 
 
-class TranscodingProfileResponse(BaseModel):
+# 视频列表的校验器只在导入时构建一次，批量转换ORM对象时复用
+VIDEO_LIST_ADAPTER: TypeAdapter[List[VideoResponse]] = TypeAdapter(List[VideoResponse])
+
+
+class TranscodingProfileResponse(ORMBase):
     """转码配置响应模型"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)  # 冷路径模型，首次使用时再构建校验器
     
     id: str
     video_id: str
@@ -134,9 +178,9 @@ class TranscodingProfileResponse(BaseModel):
     updated_at: datetime
 
 
-class ThumbnailResponse(BaseModel):
+class ThumbnailResponse(ORMBase):
     """缩略图响应模型"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)  # 冷路径模型，首次使用时再构建校验器
     
     id: str
     video_id: str
@@ -151,31 +195,47 @@ class ThumbnailResponse(BaseModel):
     created_at: datetime
 
 
-class VideoUploadResponse(BaseModel):
+class PartETag(TypedDict):
+    """分片上传的分片信息（S3 CompleteMultipartUpload所需格式）"""
+    PartNumber: int  # 分片序号
+    ETag: str  # 分片上传后返回的ETag
+
+
+class VideoUploadResponse(ORMBase):
     """视频上传响应模型"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True)  # 冷路径模型，首次使用时再构建校验器
     
     video_id: str
     upload_url: str
     upload_id: Optional[str] = None
-    parts: Optional[List[Dict]] = None
+    parts: Optional[List[PartETag]] = None
     expires_at: datetime
 
 
-class VideoUploadComplete(BaseModel):
+class MultipartUploadInit(ORMBase):
+    """分片上传初始化请求"""
+    model_config = ConfigDict(defer_build=True)  # 冷路径模型，首次使用时再构建校验器
+    
+    file_size: int = Field(..., gt=0, description="文件大小(bytes)")
+
+
+class VideoUploadComplete(ORMBase):
     """视频上传完成请求"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True)  # 冷路径模型，首次使用时再构建校验器
     
     upload_id: str
-    parts: List[Dict[str, Any]]
+    parts: List[PartETag]
 
 
-class VideoAnalyticsResponse(BaseModel):
+class VideoAnalyticsResponse(ORMBase):
     """视频分析响应模型"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)  # 冷路径模型，首次使用时再构建校验器
     
     video_id: str
-    date: datetime
+    # 按日的时序数据行数多，统计日期以Unix秒级时间戳返回，由客户端格式化；从ORM对象创建时读取date属性
+    date_ts: Annotated[int, BeforeValidator(_datetime_to_ts)] = Field(
+        ..., validation_alias=AliasChoices("date_ts", "date"), description="统计日期（Unix秒级时间戳）"
+    )
     views: int
     unique_viewers: int
     watch_time: float
@@ -188,18 +248,17 @@ class VideoAnalyticsResponse(BaseModel):
     completion_100: int
 
 
-class VideoInteractionCreate(BaseModel):
+class VideoInteractionCreate(ORMBase):
     """视频互动创建模型"""
-    model_config = ConfigDict(from_attributes=True)
     
     interaction_type: str = Field(..., description="互动类型: view, like, share")
     watch_duration: Optional[float] = Field(0.0, description="观看时长(秒)")
     watch_percentage: Optional[float] = Field(0.0, description="观看百分比")
 
 
-class VideoStatsResponse(BaseModel):
+class VideoStatsResponse(ORMBase):
     """视频统计响应模型"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
     
     video_id: str
     total_views: int
@@ -209,4 +268,17 @@ class VideoStatsResponse(BaseModel):
     average_watch_time: float
     completion_rate: float
     engagement_rate: float
-    last_updated: datetime
\ No newline at end of file
+    last_updated: datetime
+
+
+# 高频接口的具体标准响应模型，在导入时一次性构建校验器，并在OpenAPI中使用固定名称
+class VideoStandardResponse(StandardResponse[VideoResponse]):
+    """视频详情标准响应模型"""
+
+
+class VideoListStandardResponse(StandardResponse[List[VideoCore]]):
+    """视频列表标准响应模型"""
+
+
+class VideoStatsStandardResponse(StandardResponse[VideoStatsResponse]):
+    """视频统计标准响应模型"""
@@ -5,23 +5,95 @@ CDN分发服务模块
 本模块提供了基于S3兼容存储的CDN分发服务，包括：
 1. 预签名URL生成（用于安全访问私有文件）
 2. 分片上传支持（大文件上传）
-3. 文件信息查询
-4. 文件删除操作
+3. 本地文件上传（按分片从磁盘流式读取，不在内存中缓冲整个分片）
+4. 文件信息查询
+5. 文件删除操作
 
 当前实现基于Supabase Storage，但可以适配其他S3兼容的存储服务。
 """
 
+import io
 import logging
+import os
+from math import ceil
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 import boto3
 from botocore.exceptions import ClientError
 from app.config import settings
 from app.core.exceptions import BusinessException
+from app.utils.cache_utils import cache_manager
 
 logger = logging.getLogger(__name__)
 
-__all__ = ['CDNService', 'cdn_service']
+__all__ = ['CDNService', 'PartIO', 'cdn_service']
+
+# 分片上传参数
+MULTIPART_PART_SIZE = 16 * 1024 * 1024  # 推荐分片大小（16MB），分片大小按此对齐
+MULTIPART_MAX_PARTS = 10000  # S3单次分片上传的分片数量上限
+MULTIPART_MAX_PARALLEL = 8  # 推荐客户端并发上传的分片数
+STREAMING_UPLOAD_THRESHOLD = 8 * 1024 * 1024  # 小于该大小的文件建议单次直传
+
+# 预签名URL缓存提前失效的时间（秒），保证返回给客户端的URL至少还有这么久的有效期
+PRESIGNED_URL_CACHE_MARGIN = 300
+
+
+class PartIO(io.RawIOBase):
+    """
+    文件分片读取对象
+    
+    将磁盘文件中[offset, offset + size)的区间包装为独立的可读、可定位文件对象，
+    上传时由SDK按需分块读取，无需为每个分片预先分配完整的内存缓冲区
+    """
+    
+    def __init__(self, path: str, offset: int, size: int):
+        super().__init__()
+        self._file = open(path, 'rb')
+        self._offset = offset
+        self._size = size
+        self._position = 0
+        self._file.seek(offset)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        """读取数据到缓冲区，读取量不超过分片剩余长度"""
+        remaining = self._size - self._position
+        if remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:remaining]
+        count = self._file.readinto(view)
+        self._position += count
+        return count
+    
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        """在分片范围内定位，位置相对于分片起点"""
+        if whence == io.SEEK_CUR:
+            position += self._position
+        elif whence == io.SEEK_END:
+            position += self._size
+        self._position = min(max(position, 0), self._size)
+        self._file.seek(self._offset + self._position)
+        return self._position
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def rewind(self) -> None:
+        """回到分片起点（签名计算或重试后重新读取）"""
+        self.seek(0)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._file.close()
+        super().close()
 
 
 class CDNService:
@@ -93,15 +165,84 @@ class CDNService:
             logger.error(f"Failed to generate presigned URL for {file_key}: {str(e)}", exc_info=True)
             raise BusinessException("生成预签名URL失败")
     
-    def initiate_multipart_upload(self, file_key: str) -> Dict[str, Any]:
+    async def get_cached_presigned_url(
+        self,
+        file_key: str,
+        operation: str = 'get_object',
+        expires_in: int = 3600
+    ) -> Dict[str, Any]:
+        """
+        获取预签名URL（Redis缓存）
+        
+        签名只依赖服务端密钥和文件键，同一文件在有效期内重复请求时直接复用已签名的URL，
+        缓存比签名有效期提前PRESIGNED_URL_CACHE_MARGIN秒过期
+        
+        Args:
+            file_key: 文件键
+            operation: 操作类型 ('get_object' 或 'put_object')
+            expires_in: 过期时间（秒）
+            
+        Returns:
+            包含预签名URL(url)和过期时间(expires_at)的字典
+            
+        Raises:
+            BusinessException: 生成URL失败时抛出
+        """
+        cache_key = f"presign:{operation}:{file_key}"
+        cached = await cache_manager.get(cache_key)
+        if cached:
+            return {"url": cached["url"], "expires_at": datetime.fromisoformat(cached["expires_at"])}
+        
+        expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+        url = self.generate_presigned_url(file_key, operation, expires_in)
+        
+        cache_ttl = expires_in - PRESIGNED_URL_CACHE_MARGIN
+        if cache_ttl > 0:
+            await cache_manager.set(
+                cache_key,
+                {"url": url, "expires_at": expires_at.isoformat()},
+                expire=cache_ttl
+            )
+        
+        return {"url": url, "expires_at": expires_at}
+    
+    @staticmethod
+    def plan_multipart_upload(file_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        计算分片上传的推荐参数
+        
+        分片过小会产生大量请求，过大则单片重传代价高；分片大小取16MB，
+        超大文件按S3的10000片上限放大，并始终向上对齐到16MB的整数倍
+        
+        Args:
+            file_size: 文件大小（bytes），未知时按默认分片大小推荐
+            
+        Returns:
+            包含推荐分片大小、分片数、并发数和是否建议直传的字典
+        """
+        part_size = MULTIPART_PART_SIZE
+        if file_size:
+            min_part_size = ceil(file_size / MULTIPART_MAX_PARTS)
+            part_size = ceil(max(part_size, min_part_size) / MULTIPART_PART_SIZE) * MULTIPART_PART_SIZE
+        part_count = ceil(file_size / part_size) if file_size else None
+        
+        return {
+            "recommended_part_size": part_size,
+            "part_count": part_count,
+            "max_parallel_parts": min(MULTIPART_MAX_PARALLEL, part_count) if part_count else MULTIPART_MAX_PARALLEL,
+            "use_streaming": bool(file_size) and file_size < STREAMING_UPLOAD_THRESHOLD
+        }
+    
+    def initiate_multipart_upload(self, file_key: str, file_size: Optional[int] = None) -> Dict[str, Any]:
         """
         初始化分片上传
         
         Args:
             file_key: 文件键
+            file_size: 文件大小（bytes），用于计算推荐分片参数
             
         Returns:
-            包含上传ID和文件键的字典
+            包含上传ID、文件键和推荐分片参数的字典
             
         Raises:
             BusinessException: 初始化失败时抛出
@@ -114,7 +255,8 @@ class CDNService:
             
             return {
                 "upload_id": response['UploadId'],
-                "file_key": file_key
+                "file_key": file_key,
+                **self.plan_multipart_upload(file_size)
             }
             
         except ClientError as e:
@@ -194,6 +336,68 @@ class CDNService:
             logger.error(f"Failed to complete multipart upload for {file_key}: {str(e)}", exc_info=True)
             raise BusinessException("完成分片上传失败")
     
+    def upload_local_file(self, file_path: str, file_key: str) -> bool:
+        """
+        上传本地文件
+        
+        小文件单次上传，大文件按推荐分片大小分片上传；每个分片通过PartIO从磁盘流式读取，
+        内存占用与文件大小和分片大小无关
+        
+        Args:
+            file_path: 本地文件路径
+            file_key: 文件键
+            
+        Returns:
+            操作是否成功
+            
+        Raises:
+            BusinessException: 上传失败时抛出
+        """
+        file_size = os.path.getsize(file_path)
+        part_size = self.plan_multipart_upload(file_size)["recommended_part_size"]
+        
+        if file_size <= part_size:
+            try:
+                with PartIO(file_path, 0, file_size) as body:
+                    self.s3_client.put_object(
+                        Bucket=settings.STORAGE_BUCKET,
+                        Key=file_key,
+                        Body=body,
+                        ContentLength=file_size
+                    )
+                logger.info(f"File uploaded to CDN: {file_key}")
+                return True
+            except ClientError as e:
+                logger.error(f"Failed to upload file {file_key}: {str(e)}", exc_info=True)
+                raise BusinessException("上传文件失败")
+        
+        upload_id = self.initiate_multipart_upload(file_key, file_size)["upload_id"]
+        try:
+            parts = []
+            for part_number, offset in enumerate(range(0, file_size, part_size), start=1):
+                length = min(part_size, file_size - offset)
+                with PartIO(file_path, offset, length) as body:
+                    response = self.s3_client.upload_part(
+                        Bucket=settings.STORAGE_BUCKET,
+                        Key=file_key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=body,
+                        ContentLength=length
+                    )
+                parts.append({"PartNumber": part_number, "ETag": response['ETag']})
+        except ClientError as e:
+            logger.error(f"Failed to upload parts for {file_key}: {str(e)}", exc_info=True)
+            # 放弃未完成的分片上传，避免残留分片占用存储
+            self.s3_client.abort_multipart_upload(
+                Bucket=settings.STORAGE_BUCKET,
+                Key=file_key,
+                UploadId=upload_id
+            )
+            raise BusinessException("上传文件失败")
+        
+        return self.complete_multipart_upload(file_key, upload_id, parts)
+    
     def get_file_info(self, file_key: str) -> Optional[Dict[str, Any]]:
         """
         获取文件信息
@@ -0,0 +1,232 @@
+"""
+视频互动写入缓冲模块
+
+本模块将视频互动记录先放入进程内队列，由后台任务批量写入数据库，包括：
+1. 互动记录入队（接口只做入队，不等待数据库写入）
+2. 定时批量写入（使用asyncpg的COPY协议，每批最多1000行）
+3. 点赞、分享计数按视频聚合后与互动记录在同一事务中更新
+4. 写入失败的批次在后续周期重试，重试用尽后逐行写入，只丢弃无法写入的单行记录
+5. 应用关闭时写入队列中剩余的记录
+
+队列已满时入队失败，由调用方改为直接写入数据库；观看次数仍通过Redis计数器累加。
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.database.session import async_engine
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['InteractionBuffer', 'interaction_buffer']
+
+# 队列容量、单批写入行数和写入间隔（秒）
+INTERACTION_QUEUE_SIZE = 100_000
+INTERACTION_FLUSH_BATCH_SIZE = 1000
+INTERACTION_FLUSH_INTERVAL = 0.5
+
+# 批次写入失败后的最大尝试次数，用尽后改为逐行写入
+INTERACTION_FLUSH_MAX_ATTEMPTS = 3
+
+# COPY写入的列，顺序与入队的记录元组一致
+_INTERACTION_COLUMNS = (
+    "id", "video_id", "user_id", "interaction_type",
+    "watch_duration", "watch_percentage", "created_at", "updated_at"
+)
+
+
+class InteractionBuffer:
+    """视频互动写入缓冲"""
+
+    def __init__(self, maxsize: int = INTERACTION_QUEUE_SIZE):
+        """
+        初始化互动写入缓冲
+
+        Args:
+            maxsize: 队列容量
+        """
+        self._maxsize = maxsize
+        # 队列在启动时于运行中的事件循环内创建
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 写入失败待重试的批次：(已尝试次数, 记录列表)
+        self._retry_batches: Deque[Tuple[int, List[Tuple]]] = deque()
+
+    async def start(self) -> None:
+        """启动后台写入任务"""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._task = asyncio.create_task(self._run())
+        logger.info("Interaction buffer started")
+
+    async def stop(self) -> None:
+        """停止后台写入任务并写入队列中剩余的记录"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+        # 重试批次每次写入至少增加一次尝试次数，最多几轮即全部写入或逐行处理完毕
+        while self._retry_batches:
+            await self.flush()
+        logger.info("Interaction buffer stopped")
+
+    def enqueue(self, video_id: str, user_id: str, interaction_data: Dict[str, Any]) -> bool:
+        """
+        互动记录入队
+
+        Args:
+            video_id: 视频ID
+            user_id: 用户ID
+            interaction_data: 互动数据
+
+        Returns:
+            是否入队成功；未启动或队列已满时返回False
+        """
+        if self._queue is None:
+            return False
+
+        now = datetime.utcnow()
+        record = (
+            str(uuid.uuid4()),
+            video_id,
+            user_id,
+            interaction_data.get('interaction_type'),
+            interaction_data.get('watch_duration') or 0.0,
+            interaction_data.get('watch_percentage') or 0.0,
+            now,
+            now
+        )
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Interaction buffer full, falling back to direct write for video {video_id}")
+            return False
+
+    async def flush(self) -> int:
+        """
+        写入队列中当前的全部记录
+
+        Returns:
+            写入的记录数
+        """
+        if self._queue is None:
+            return 0
+
+        flushed = 0
+        # 先重试之前写入失败的批次，本轮再次失败的批次留到下一轮
+        for _ in range(len(self._retry_batches)):
+            attempts, batch = self._retry_batches.popleft()
+            flushed += await self._write_with_retry(batch, attempts)
+
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < INTERACTION_FLUSH_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            flushed += await self._write_with_retry(batch, 0)
+
+        return flushed
+
+    async def _write_with_retry(self, batch: List[Tuple], attempts: int) -> int:
+        """
+        写入一批记录，失败时放入重试队列，尝试次数用尽后逐行写入
+
+        Args:
+            batch: 互动记录元组列表
+            attempts: 此前已尝试的次数
+
+        Returns:
+            写入的记录数
+        """
+        try:
+            await self._write_batch(batch)
+            return len(batch)
+        except Exception as e:
+            attempts += 1
+            if attempts < INTERACTION_FLUSH_MAX_ATTEMPTS:
+                logger.warning(
+                    f"Failed to flush {len(batch)} video interactions (attempt {attempts}), will retry: {str(e)}"
+                )
+                self._retry_batches.append((attempts, batch))
+                return 0
+
+            logger.error(
+                f"Failed to flush {len(batch)} video interactions after {attempts} attempts, "
+                f"writing rows individually: {str(e)}",
+                exc_info=True
+            )
+
+        return await self._write_rows(batch)
+
+    async def _write_rows(self, batch: List[Tuple]) -> int:
+        """
+        逐行写入记录，隔离导致整批失败的单行
+
+        Args:
+            batch: 互动记录元组列表
+
+        Returns:
+            写入的记录数
+        """
+        written = 0
+        for record in batch:
+            try:
+                await self._write_batch([record])
+                written += 1
+            except Exception as e:
+                logger.critical(
+                    f"Dropped video interaction {record[0]} ({record[3]}) for video {record[1]}: {str(e)}",
+                    exc_info=True
+                )
+        return written
+
+    async def _run(self) -> None:
+        """后台写入循环"""
+        while True:
+            await asyncio.sleep(INTERACTION_FLUSH_INTERVAL)
+            await self.flush()
+
+    @staticmethod
+    async def _write_batch(batch: List[Tuple]) -> None:
+        """
+        在一个事务中COPY写入一批互动记录并更新点赞、分享计数
+
+        Args:
+            batch: 互动记录元组列表
+        """
+        # 按视频聚合点赞、分享次数
+        counters: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        for record in batch:
+            if record[3] == 'like':
+                counters[record[1]][0] += 1
+            elif record[3] == 'share':
+                counters[record[1]][1] += 1
+
+        async with async_engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            async with driver_connection.transaction():
+                await driver_connection.copy_records_to_table(
+                    "video_interactions", records=batch, columns=_INTERACTION_COLUMNS
+                )
+                if counters:
+                    await driver_connection.executemany(
+                        "UPDATE video_contents SET like_count = like_count + $2, "
+                        "share_count = share_count + $3 WHERE id = $1",
+                        [(video_id, likes, shares) for video_id, (likes, shares) in counters.items()]
+                    )
+
+
+# 全局互动写入缓冲实例
+interaction_buffer = InteractionBuffer()
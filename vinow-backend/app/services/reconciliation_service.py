@@ -612,8 +612,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.database.session import get_db
-from app.middleware.auth import get_current_user
-from app.schemas.video_schemas import VideoResponse
+from app.middleware.auth import AuthUser, get_current_user
+from app.schemas.video_schemas import VideoListStandardResponse
 from app.schemas.response_schemas import StandardResponse
 from app.services.recommendation_service import RecommendationService
 from app.utils.exceptions import NotFoundException
@@ -623,16 +623,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/recommendations", tags=["recommendations"])
 
 
-@router.get("/personalized", response_model=StandardResponse[List[VideoResponse]])
+@router.get("/personalized", response_model=VideoListStandardResponse)
 async def get_personalized_recommendations(
     limit: int = Query(10, ge=1, le=50, description="推荐数量"),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_user)
 ):
     """获取个性化推荐"""
     try:
         recommendations = await RecommendationService.get_personalized_recommendations(
-            db, current_user["user_id"], limit
+            db, current_user.user_id, limit
         )
         
         return StandardResponse(
@@ -645,7 +645,7 @@ async def get_personalized_recommendations(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
 
 
-@router.get("/trending", response_model=StandardResponse[List[VideoResponse]])
+@router.get("/trending", response_model=VideoListStandardResponse)
 async def get_trending_recommendations(
     limit: int = Query(10, ge=1, le=50, description="推荐数量"),
     db: Session = Depends(get_db)
@@ -664,7 +664,7 @@ async def get_trending_recommendations(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
 
 
-@router.get("/popular", response_model=StandardResponse[List[VideoResponse]])
+@router.get("/popular", response_model=VideoListStandardResponse)
 async def get_popular_recommendations(
     limit: int = Query(10, ge=1, le=50, description="推荐数量"),
     db: Session = Depends(get_db)
@@ -683,7 +683,7 @@ async def get_popular_recommendations(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="服务器内部错误")
 
 
-@router.get("/content-based/{video_id}", response_model=StandardResponse[List[VideoResponse]])
+@router.get("/content-based/{video_id}", response_model=VideoListStandardResponse)
 async def get_content_based_recommendations(
     video_id: str,
     limit: int = Query(10, ge=1, le=50, description="推荐数量"),
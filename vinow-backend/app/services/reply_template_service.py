@@ -5,10 +5,12 @@
 本模块提供了评价回复模板的相关业务逻辑处理，包括：
 - 根据评分获取推荐回复模板
 - 获取商家常用回复模板
+- 按评价一次性获取推荐模板和常用模板
 - 保存商家自定义回复模板
 """
 
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional
 from app.database import supabase
 
 class ReplyTemplateService:
@@ -18,6 +20,9 @@ class ReplyTemplateService:
     负责处理回复模板相关的业务逻辑，包括默认模板管理、自定义模板等
     """
     
+    # 无实例状态，禁止创建实例字典
+    __slots__ = ()
+    
     # 默认回复模板配置
     DEFAULT_TEMPLATES = {
         # 正面评价回复模板（4-5星）
@@ -88,6 +93,41 @@ class ReplyTemplateService:
             {"id": "frequent_3", "content": "我们会继续努力提供更好的服务", "type": "official"}
         ][:limit]
 
+    async def get_templates_for_review(self, review_id: int, merchant_id: int) -> Optional[Dict[str, Any]]:
+        """
+        获取指定评价的回复模板推荐
+        
+        只查询一次评价评分（同时校验评价归属商户），推荐模板和常用模板均在此基础上生成，
+        路由层无需再分别发起多次调用
+        
+        Args:
+            review_id (int): 评价ID
+            merchant_id (int): 商户ID
+            
+        Returns:
+            Optional[Dict[str, Any]]: 包含评分、基于评分的模板和常用模板的字典，评价不存在时返回None
+        """
+        # 查询评价评分，限定在当前商户下（同步Supabase客户端放到线程中执行，避免阻塞事件循环）
+        review_result = await asyncio.to_thread(
+            supabase.table("merchant_reviews").select("rating").eq(
+                "id", review_id
+            ).eq("merchant_id", merchant_id).limit(1).execute
+        )
+        if not review_result.data:
+            return None
+        
+        rating = review_result.data[0]["rating"]
+        # 两类模板相互独立，并发获取
+        rating_based, frequently_used = await asyncio.gather(
+            self.get_templates_by_rating(rating),
+            self.get_frequently_used(merchant_id)
+        )
+        return {
+            "rating": rating,
+            "rating_based": rating_based,  # 基于评分的推荐模板
+            "frequently_used": frequently_used  # 商户常用模板
+        }
+
     async def save_custom_template(self, merchant_id: int, template_data: Dict[str, Any]) -> bool:
         """
         保存商家自定义回复模板
@@ -9,13 +9,29 @@
 - 评价状态更新
 """
 
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from app.crud.review import ReviewCRUD
 from app.crud.reply import ReplyCRUD
 from app.schemas.review import ReviewCreate, ReviewSummary
 from app.schemas.reply import ReplyCreate
 from app.database import supabase
+from app.utils.cache_utils import cache_manager
+from app.utils.etag_utils import bump_merchant_version
+
+# 评价统计摘要的进程内缓存有效期（秒）
+REVIEW_SUMMARY_CACHE_TTL = 60
+
+# 评价统计摘要进程内缓存的最大商户数，超出时淘汰最久未使用的条目
+REVIEW_SUMMARY_CACHE_MAXSIZE = 4096
+
+# 评价列表总数在Redis中的缓存有效期（秒）
+REVIEW_TOTAL_CACHE_TTL = 60
+
+# 评价允许的状态值
+VALID_REVIEW_STATUSES = frozenset({"active", "hidden", "deleted"})
 
 class ReviewService:
     """
@@ -24,6 +40,22 @@ class ReviewService:
     负责处理评价相关的业务逻辑，协调数据访问层(CRUD)完成具体操作
     """
     
+    # 固定实例属性，减少实例内存占用和属性查找开销
+    __slots__ = ("review_crud", "reply_crud")
+    
+    # 评价统计摘要LRU缓存：商户ID -> (过期时间, 摘要数据)，所有实例共享
+    _summary_cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    @classmethod
+    def invalidate_summary_cache(cls, merchant_id: int) -> None:
+        """
+        清除指定商户的评价统计摘要缓存
+        
+        Args:
+            merchant_id (int): 商户ID
+        """
+        cls._summary_cache.pop(merchant_id, None)
+    
     def __init__(self):
         """
         初始化评价服务对象
@@ -43,7 +75,8 @@ class ReviewService:
         limit: int = 20,
         rating: Optional[int] = None,
         date_range: Optional[str] = None,
-        has_reply: Optional[bool] = None
+        has_reply: Optional[bool] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """
         获取商户的评价列表（业务层封装）
@@ -55,19 +88,31 @@ class ReviewService:
             rating (Optional[int]): 评分过滤条件（1-5星）
             date_range (Optional[str]): 时间范围过滤（today/week/month/year）
             has_reply (Optional[bool]): 是否有回复过滤条件
+            include_total (bool): 是否返回总记录数，精确总数按过滤条件缓存
             
         Returns:
             Dict[str, Any]: 包含评价列表和分页信息的字典
         """
+        # 需要总数时先查缓存，命中则本次查询无需再计数
+        total_cache_key = f"reviews:total:{merchant_id}:{rating}:{date_range}:{has_reply}"
+        cached_total = await cache_manager.get(total_cache_key) if include_total else None
+        
         # 调用数据访问层方法获取评价列表
-        return await self.review_crud.get_reviews(
+        result = await self.review_crud.get_reviews(
             merchant_id=merchant_id,
             page=page,
             limit=limit,
             rating=rating,
             date_range=date_range,
-            has_reply=has_reply
+            has_reply=has_reply,
+            include_total=include_total and cached_total is None
         )
+        
+        if cached_total is not None:
+            result["total"] = cached_total
+        elif include_total:
+            await cache_manager.set(total_cache_key, result["total"], expire=REVIEW_TOTAL_CACHE_TTL)
+        return result
 
     async def create_review_reply(
         self,
@@ -111,6 +156,11 @@ class ReviewService:
         if not result:
             raise ValueError("回复创建失败")
         
+        # 回复会影响待回复数、回复率和按回复过滤的总数，清除相关缓存
+        self.invalidate_summary_cache(merchant_id)
+        await cache_manager.delete_pattern(f"reviews:total:{merchant_id}:*")
+        await bump_merchant_version(merchant_id)
+        
         # 返回创建成功的回复数据
         return result
 
@@ -124,8 +174,23 @@ class ReviewService:
         Returns:
             Dict[str, Any]: 包含各种统计信息的字典
         """
+        # 优先使用未过期的进程内缓存，命中时移到末尾，过期条目读取时直接删除
+        cached = self._summary_cache.get(merchant_id)
+        now = time.monotonic()
+        if cached:
+            if cached[0] > now:
+                self._summary_cache.move_to_end(merchant_id)
+                return cached[1]
+            self._summary_cache.pop(merchant_id, None)
+        
         # 调用数据访问层方法获取评价统计摘要
-        return await self.review_crud.get_review_summary(merchant_id)
+        summary = await self.review_crud.get_review_summary(merchant_id)
+        self._summary_cache[merchant_id] = (time.monotonic() + REVIEW_SUMMARY_CACHE_TTL, summary)
+        self._summary_cache.move_to_end(merchant_id)
+        # 超出容量时淘汰最久未使用的条目
+        while len(self._summary_cache) > REVIEW_SUMMARY_CACHE_MAXSIZE:
+            self._summary_cache.popitem(last=False)
+        return summary
 
     async def update_review_status(
         self,
@@ -147,15 +212,18 @@ class ReviewService:
         Raises:
             ValueError: 当状态值不在有效范围内时抛出异常
         """
-        # 定义有效的状态值列表
-        valid_statuses = ["active", "hidden", "deleted"]
-        
-        # 验证状态值是否有效
-        if status not in valid_statuses:
-            raise ValueError(f"状态必须是: {', '.join(valid_statuses)}")
+        # 验证状态值是否有效（在访问数据库之前）
+        if status not in VALID_REVIEW_STATUSES:
+            raise ValueError(f"状态必须是: {', '.join(sorted(VALID_REVIEW_STATUSES))}")
         
         # 调用数据访问层方法更新评价状态
-        return await self.review_crud.update_review_status(review_id, merchant_id, status)
+        success = await self.review_crud.update_review_status(review_id, merchant_id, status)
+        if success:
+            # 状态变化会影响统计结果和列表总数，清除相关缓存
+            self.invalidate_summary_cache(merchant_id)
+            await cache_manager.delete_pattern(f"reviews:total:{merchant_id}:*")
+            await bump_merchant_version(merchant_id)
+        return success
 
         内容系统-完整的评价服务
   import asyncio
@@ -621,8 +689,8 @@ class ReviewService:
                 logger.debug(f"从缓存获取评价列表: {cache_key}")
                 return cached_result
             
-            # 构建查询 - 联表查询评价和内容
-            query = self.supabase.table("reviews").select("*, contents(*)")
+            # 构建查询 - 联表查询评价、内容及内容媒体文件（一次查询取回，避免逐条查询媒体）
+            query = self.supabase.table("reviews").select("*, contents(*, content_media(*))")
             
             # 添加过滤条件
             if target_entity_type:
@@ -678,19 +746,30 @@ class ReviewService:
             # 执行查询
             response = query.execute()
             
+            # 一次查询取回当前用户对本页所有评价的投票状态
+            user_votes: Dict[str, bool] = {}
+            if user_id and response.data:
+                votes_response = self.supabase.table("review_helpful_votes").select(
+                    "review_id, is_helpful"
+                ).eq("user_id", user_id).in_(
+                    "review_id", [item["id"] for item in response.data]
+                ).execute()
+                user_votes = {vote["review_id"]: vote["is_helpful"] for vote in votes_response.data or []}
+            
             # 格式化响应
             reviews = []
             for item in response.data:
                 review_data = item
                 content_data = item.get("contents", {})
                 
-                # 获取媒体文件
-                media_files = await content_service._get_content_media(content_data["id"])
+                # 媒体文件已随内容联表返回，按显示顺序排列
+                media_files = sorted(
+                    content_data.pop("content_media", None) or [],
+                    key=lambda media: media.get("display_order", 0)
+                )
                 
                 # 获取用户投票状态
-                user_vote_status = None
-                if user_id:
-                    user_vote_status = await self._get_user_helpful_vote(review_data["id"], user_id)
+                user_vote_status = user_votes.get(review_data["id"]) if user_id else None
                 
                 review_response = await self._format_review_response(
                     review_data, content_data, media_files, user_id, user_vote_status
@@ -788,7 +867,8 @@ class ReviewService:
         review_id: str, 
         vote_data: ReviewHelpfulVoteCreateSchema, 
         user_id: str,
-        ip_address: Optional[str] = None
+        ip_address: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> bool:
         """
         添加有用性投票
@@ -798,6 +878,7 @@ class ReviewService:
             vote_data: 投票数据
             user_id: 用户ID
             ip_address: IP地址
+            background_tasks: 后台任务（提供时投票统计在响应返回后更新）
             
         Returns:
             操作是否成功
@@ -831,11 +912,16 @@ class ReviewService:
             if not insert_response.data:
                 return False
             
-            # 更新评价的有用性投票统计
-            await self._update_helpful_votes_count(review_id, vote_data.is_helpful, 1)
-            
-            # 清除缓存
-            await self.cache.delete(f"review:{review_id}")
+            if background_tasks:
+                # 投票记录已写入，统计更新和缓存清除放到响应返回后按顺序执行
+                background_tasks.add_task(self._update_helpful_votes_count, review_id, vote_data.is_helpful, 1)
+                background_tasks.add_task(self.cache.delete, f"review:{review_id}")
+            else:
+                # 更新评价的有用性投票统计
+                await self._update_helpful_votes_count(review_id, vote_data.is_helpful, 1)
+                
+                # 清除缓存
+                await self.cache.delete(f"review:{review_id}")
             
             logger.info(f"有用性投票添加成功: {review_id}, 用户: {user_id}, 有用: {vote_data.is_helpful}")
             
@@ -177,6 +177,8 @@ storage_service = StorageService()
 
 内容系统
 import asyncio
+import hashlib
+import time
 import uuid
 import os
 from typing import Optional, Dict, Any, List, Tuple
@@ -185,6 +187,7 @@ import aiofiles
 from supabase import Client
 from app.config import settings
 from app.database.connection import supabase, DatabaseManager
+from app.utils.cache_utils import cache_manager
 from app.utils.file_utils import validate_file_type, validate_file_size, generate_file_hash
 import logging
 from datetime import datetime, timedelta
@@ -193,6 +196,21 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 预签名URL过期时间档位（秒），请求的过期时间向上归档，较短的请求可复用同一档位的URL
+PRESIGN_EXPIRES_TIERS = (600, 3600, 86400)
+# 预签名URL缓存提前失效的安全余量（秒）
+PRESIGN_CACHE_MARGIN = 60
+# 合并分片时的最大并发下载数
+MEDIA_ASSEMBLY_CONCURRENCY = int(os.getenv("MEDIA_ASSEMBLY_CONCURRENCY", "8"))
+
+
+def _bucket_expires_in(expires_in: int) -> int:
+    """将过期时间向上归档到最近的档位，超过最大档位时保持原值（签名有效期不短于请求值）"""
+    for tier in PRESIGN_EXPIRES_TIERS:
+        if expires_in <= tier:
+            return tier
+    return expires_in
+
 class StorageService:
     """增强的存储服务类 - 生产级别"""
     
@@ -371,13 +389,31 @@ class StorageService:
             预签名URL或None
         """
         try:
+            # 同一文件在同一过期档位内复用已签名的URL，避免重复签名；缓存的URL剩余有效期
+            # 不短于请求的过期时间减去安全余量时才复用（请求值恰为档位时也能命中）
+            signed_expires_in = _bucket_expires_in(expires_in)
+            path_digest = hashlib.sha1(file_path.encode("utf-8")).hexdigest()
+            cache_key = f"presign:{path_digest}:{signed_expires_in}"
+            cached = await cache_manager.get(cache_key)
+            if isinstance(cached, dict) and cached["expires_at"] - time.time() >= expires_in - PRESIGN_CACHE_MARGIN:
+                return cached["url"]
+            
             # 使用Supabase的签名URL功能
+            expires_at = time.time() + signed_expires_in
             response = supabase.storage.from_(self.bucket_name).create_signed_url(
                 file_path, 
-                expires_in
+                signed_expires_in
             )
             
             if response.get('signedURL'):
+                # 缓存时间比URL有效期略短，读取时再按请求的过期时间检查剩余有效期
+                cache_ttl = signed_expires_in - PRESIGN_CACHE_MARGIN
+                if cache_ttl > 0:
+                    await cache_manager.set(
+                        cache_key,
+                        {"url": response['signedURL'], "expires_at": expires_at},
+                        expire=cache_ttl
+                    )
                 return response['signedURL']
             else:
                 logger.error(f"生成预签名URL失败: {response.get('error')}")
@@ -534,7 +570,7 @@ class StorageService:
         if chunk_number < 1 or chunk_number > total_chunks:
             raise HTTPException(status_code=400, detail="无效的分片序号")
         
-        if len(chunk_content) > 10 * 1024 * 1024:  # 每个分片最大10MB
+        if len(chunk_content) > 32 * 1024 * 1024:  # 每个分片最大32MB（覆盖媒体路由的最大分片档位）
             raise HTTPException(status_code=400, detail="分片大小超过限制")
     
     async def _check_all_chunks_uploaded(self, upload_id: str, total_chunks: int) -> bool:
@@ -556,17 +592,21 @@ class StorageService:
     async def _merge_chunks(self, upload_id: str, total_chunks: int, user_id: str, original_filename: str) -> Dict[str, Any]:
         """合并文件分片"""
         try:
-            # 读取所有分片
-            chunks = []
-            for chunk_number in range(1, total_chunks + 1):
-                chunk_path = f"chunks/{upload_id}/{chunk_number}"
-                chunk_response = supabase.storage.from_(self.bucket_name).download(chunk_path)
-                
-                if chunk_response:
-                    chunks.append(chunk_response)
+            bucket = supabase.storage.from_(self.bucket_name)
+            semaphore = asyncio.Semaphore(MEDIA_ASSEMBLY_CONCURRENCY)
+            
+            async def _download_chunk(chunk_number: int) -> Optional[bytes]:
+                """在并发限制内下载单个分片（同步SDK调用放到线程池执行）"""
+                async with semaphore:
+                    return await asyncio.to_thread(bucket.download, f"chunks/{upload_id}/{chunk_number}")
+            
+            # 并发读取所有分片，gather 按分片序号返回结果
+            chunks = await asyncio.gather(
+                *(_download_chunk(chunk_number) for chunk_number in range(1, total_chunks + 1))
+            )
             
             # 合并分片
-            merged_content = b''.join(chunks)
+            merged_content = b''.join(chunk for chunk in chunks if chunk)
             
             # 生成最终文件元数据
             file_metadata = await self._generate_file_metadata(
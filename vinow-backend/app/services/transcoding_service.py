@@ -24,8 +24,8 @@ from sqlalchemy.orm import Session
 from app.config import settings
 from app.utils.cache_utils import cache_manager
 from app.models.video_models import VideoTranscodingProfile, VideoThumbnail
-from app.schemas.video_schemas import TranscodingStatus
-from app.core.exceptions import BusinessException
+from app.core.exceptions import BusinessException, NotFoundException
+from app.services.cdn_service import cdn_service
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +95,7 @@ class VideoTranscodingService:
                 video_bitrate=int(config["video_bitrate"].replace('k', '000')),
                 audio_bitrate=int(config["audio_bitrate"].replace('k', '000')),
                 file_key=f"transcoded/{video_id}/{profile_name}.mp4",
-                status=TranscodingStatus.PENDING
+                status="pending"
             )
             db.add(profile)
             profiles.append(profile)
@@ -108,39 +108,49 @@ class VideoTranscodingService:
         return profiles
     
     @staticmethod
-    async def start_transcoding_task(video_id: str, original_file_path: str, profiles: List[VideoTranscodingProfile]) -> None:
+    def start_transcoding_task(video_id: str, original_file_path: str, profiles: List[VideoTranscodingProfile]) -> None:
         """
-        启动转码任务（异步）
+        启动转码任务
+        
+        将转码任务投递到Celery的video_transcoding队列，由独立的转码worker执行
         
         Args:
             video_id: 视频ID
             original_file_path: 原始文件路径
             profiles: 转码配置列表
         """
-        # 这里实际应该使用消息队列（如Celery）来异步处理转码
-        # 为简化，我们使用 asyncio.create_task 来模拟异步处理
-        asyncio.create_task(
-            VideoTranscodingService.process_transcoding(video_id, original_file_path, profiles)
-        )
+        from app.tasks.video_tasks import process_video_transcoding
+        
+        # 只传递配置ID，worker在自己的数据库会话中重新加载配置
+        process_video_transcoding.delay(video_id, original_file_path, [profile.id for profile in profiles])
+        logger.info(f"Transcoding task queued for video: {video_id}")
     
     @staticmethod
-    async def process_transcoding(video_id: str, original_file_path: str, profiles: List[VideoTranscodingProfile]) -> None:
+    async def process_transcoding(video_id: str, original_file_path: str, profile_ids: List[str]) -> None:
         """
         处理视频转码
         
         Args:
             video_id: 视频ID
             original_file_path: 原始文件路径
-            profiles: 转码配置列表
+            profile_ids: 转码配置ID列表
         """
+        from app.database.connection import DatabaseManager
         from app.database.session import SessionLocal
-        from app.services.video_service import VideoService
+        from app.models.video_models import VideoContent
         
         db = SessionLocal()
         try:
-            # 更新视频状态为转码中
-            video = VideoService.get_video_by_id(db, video_id)
-            video.transcoding_status = TranscodingStatus.PROCESSING
+            # 在当前会话中加载转码配置，状态更新随本会话提交
+            profiles = db.query(VideoTranscodingProfile).filter(
+                VideoTranscodingProfile.id.in_(profile_ids)
+            ).all()
+            
+            # 更新视频状态为转码中（后台任务使用同步会话，直接按主键查询）
+            video = db.get(VideoContent, video_id)
+            if not video:
+                raise NotFoundException(f"视频不存在: {video_id}")
+            video.transcoding_status = "processing"
             db.commit()
             
             # 为每个配置执行转码
@@ -174,11 +184,11 @@ class VideoTranscodingService:
                     if process.returncode == 0:
                         # 转码成功，上传到存储
                         file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
-                        # 这里应该上传到云存储，示例中省略
-                        # await StorageService.upload_file(output_path, profile.file_key)
+                        # 从磁盘分片流式上传，放到线程中执行避免阻塞事件循环
+                        await asyncio.to_thread(cdn_service.upload_local_file, output_path, profile.file_key)
                         
                         # 更新转码配置状态
-                        profile.status = TranscodingStatus.COMPLETED
+                        profile.status = "completed"
                         profile.file_size = file_size
                         profile.cdn_url = f"{settings.CDN_BASE_URL}/{profile.file_key}"
                         db.commit()
@@ -190,7 +200,7 @@ class VideoTranscodingService:
                             os.remove(output_path)
                     else:
                         logger.error(f"Transcoding failed for profile {profile.profile_name}: {stderr.decode()}")
-                        profile.status = TranscodingStatus.FAILED
+                        profile.status = "failed"
                         db.commit()
                         
                         # 清理临时文件
@@ -199,22 +209,26 @@ class VideoTranscodingService:
                         
                 except Exception as e:
                     logger.error(f"Error in transcoding profile {profile.profile_name}: {str(e)}", exc_info=True)
-                    profile.status = TranscodingStatus.FAILED
+                    profile.status = "failed"
                     db.commit()
             
             # 检查所有转码任务是否完成
-            completed = all(p.status == TranscodingStatus.COMPLETED for p in profiles)
-            failed = any(p.status == TranscodingStatus.FAILED for p in profiles)
+            completed = all(p.status == "completed" for p in profiles)
+            failed = any(p.status == "failed" for p in profiles)
             
             # 更新视频转码状态
             if completed:
-                video.transcoding_status = TranscodingStatus.COMPLETED
+                video.transcoding_status = "completed"
                 video.status = "ready"
             elif failed:
-                video.transcoding_status = TranscodingStatus.FAILED
+                video.transcoding_status = "failed"
                 
             db.commit()
             
+            # 状态已变更，清除视频详情和统计缓存（后台任务使用同步Redis客户端）
+            redis_client = DatabaseManager.get_redis_client()
+            redis_client.delete(f"video:{video_id}:detail", f"video:{video_id}:stats")
+            
             # 生成缩略图
             await VideoTranscodingService.generate_thumbnails(db, video_id, original_file_path)
             
@@ -261,7 +275,7 @@ class VideoTranscodingService:
                     # 生成成功，上传到存储
                     file_key = f"thumbnails/{video_id}/thumb_{timepoint}.jpg"
                     file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
-                    # await StorageService.upload_file(output_path, file_key)
+                    await asyncio.to_thread(cdn_service.upload_local_file, output_path, file_key)
                     
                     thumbnail = VideoThumbnail(
                         video_id=video_id,
@@ -311,8 +325,8 @@ class VideoTranscodingService:
         ).all()
         
         total = len(profiles)
-        completed = sum(1 for p in profiles if p.status == TranscodingStatus.COMPLETED)
-        failed = sum(1 for p in profiles if p.status == TranscodingStatus.FAILED)
+        completed = sum(1 for p in profiles if p.status == "completed")
+        failed = sum(1 for p in profiles if p.status == "failed")
         
         progress = (completed / total * 100) if total > 0 else 0
         
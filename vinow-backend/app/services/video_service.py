@@ -14,9 +14,11 @@
 """
 
 import logging
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from typing import List, Optional, Dict, Any, Tuple
+from math import ceil
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, desc, func, tuple_
+from sqlalchemy.orm import raiseload
 import uuid
 from datetime import datetime, timedelta
 
@@ -25,11 +27,11 @@ from app.models.video_models import (
     VideoAnalytics, VideoInteraction
 )
 from app.schemas.video_schemas import (
-    VideoCreate, VideoUpdate, VideoStatus, TranscodingStatus,
-    VideoVisibility, VideoInteractionCreate
+    VideoCreate, VideoUpdate, VideoResponse, VideoStatus, TranscodingStatus,
+    VideoVisibility, VideoInteractionCreate, VIDEO_LIST_ADAPTER
 )
 from app.core.exceptions import NotFoundException, ValidationException, BusinessException
-from app.utils.pagination import paginate, Page
+from app.utils.pagination import Page
 from app.utils.cache_utils import cache_manager
 from app.config import settings
 
@@ -37,17 +39,108 @@ logger = logging.getLogger(__name__)
 
 __all__ = ['VideoService']
 
+# 缓存有效期（秒）
+VIDEO_DETAIL_CACHE_TTL = 300
+VIDEO_LIST_TOTAL_CACHE_TTL = 30
+VIDEO_STATS_CACHE_TTL = 60
+POPULAR_VIDEOS_CACHE_TTL = 300
+
+# 热门视频缓存版本号键，递增后旧版本的缓存键不再被读取，无需扫描键空间
+POPULAR_VIDEOS_VERSION_KEY = "popular_videos:version"
+
+# 待写回数据库的观看次数增量（Redis哈希，字段为视频ID），由定时任务批量写回
+VIDEO_VIEW_DELTAS_KEY = "video_views:pending"
+
+# 写回任务执行期间，待写回哈希改名为该键；写回提交前其中的增量仍需计入观看次数
+VIDEO_VIEW_FLUSHING_KEY = f"{VIDEO_VIEW_DELTAS_KEY}:flushing"
+
+# 热门视频有序集合（按时间窗口天数区分），由定时任务每5分钟刷新
+POPULAR_VIDEOS_ZSET_KEY = "popular:videos:{days}"
+POPULAR_VIDEOS_WINDOWS = (1, 7, 30)
+POPULAR_VIDEOS_ZSET_SIZE = 50
+POPULAR_VIDEOS_ZSET_TTL = 900
+
+# 热门度分数：观看次数加权点赞次数
+POPULAR_LIKE_WEIGHT = 2
+POPULAR_VIDEO_SCORE = VideoContent.view_count + POPULAR_LIKE_WEIGHT * VideoContent.like_count
+
+# 列表游标中创建时间与视频ID的分隔符（ISO时间和UUID中均不含逗号）
+VIDEO_CURSOR_SEPARATOR = ","
+
 
 class VideoService:
     """视频内容服务"""
     
     @staticmethod
-    def create_video(db: Session, video_data: VideoCreate, user_id: str) -> VideoContent:
+    def encode_list_cursor(video: VideoContent) -> str:
+        """
+        生成列表游标
+        
+        Args:
+            video: 当前页最后一条视频
+            
+        Returns:
+            由创建时间和视频ID组成的游标字符串
+        """
+        return f"{video.created_at.isoformat()}{VIDEO_CURSOR_SEPARATOR}{video.id}"
+    
+    @staticmethod
+    def decode_list_cursor(cursor: str) -> Tuple[datetime, str]:
+        """
+        解析列表游标
+        
+        Args:
+            cursor: encode_list_cursor生成的游标字符串
+            
+        Returns:
+            (创建时间, 视频ID)
+            
+        Raises:
+            ValueError: 游标格式无效时抛出
+        """
+        created_at, separator, video_id = cursor.partition(VIDEO_CURSOR_SEPARATOR)
+        if not separator or not video_id:
+            raise ValueError(f"Invalid video list cursor: {cursor}")
+        return datetime.fromisoformat(created_at), video_id
+    
+    @staticmethod
+    async def invalidate_video_cache(video_id: str) -> None:
+        """
+        清除视频相关缓存
+        
+        删除视频详情和统计缓存，并递增热门视频缓存版本号
+        
+        Args:
+            video_id: 视频ID
+        """
+        await cache_manager.delete(f"video:{video_id}:detail")
+        await cache_manager.delete(f"video:{video_id}:stats")
+        await cache_manager.increment(POPULAR_VIDEOS_VERSION_KEY)
+    
+    @staticmethod
+    async def get_pending_view_count(video_id: str) -> int:
+        """
+        获取尚未写回数据库的观看次数增量
+        
+        包括待写回哈希和正在写回中的哈希两部分
+        
+        Args:
+            video_id: 视频ID
+            
+        Returns:
+            观看次数增量
+        """
+        pending = await cache_manager.hget(VIDEO_VIEW_DELTAS_KEY, video_id)
+        flushing = await cache_manager.hget(VIDEO_VIEW_FLUSHING_KEY, video_id)
+        return int(pending or 0) + int(flushing or 0)
+    
+    @staticmethod
+    async def create_video(db: AsyncSession, video_data: VideoCreate, user_id: str) -> VideoContent:
         """
         创建视频记录
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_data: 视频创建数据
             user_id: 用户ID
             
@@ -65,27 +158,27 @@ class VideoService:
                 description=video_data.description,
                 tags=video_data.tags or [],
                 visibility=video_data.visibility,
-                status=VideoStatus.DRAFT
+                status="draft"
             )
             db.add(video)
-            db.commit()
-            db.refresh(video)
+            await db.commit()
+            await db.refresh(video)
             
             logger.info(f"Video record created: {video.id} by user: {user_id}")
             return video
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to create video record: {str(e)}", exc_info=True)
             raise BusinessException("创建视频记录失败")
     
     @staticmethod
-    def get_video_by_id(db: Session, video_id: str) -> VideoContent:
+    async def get_video_by_id(db: AsyncSession, video_id: str) -> VideoContent:
         """
         根据ID获取视频
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_id: 视频ID
             
         Returns:
@@ -94,9 +187,7 @@ class VideoService:
         Raises:
             NotFoundException: 视频不存在时抛出
         """
-        video = db.query(VideoContent).filter(
-            VideoContent.id == video_id
-        ).first()
+        video = await db.get(VideoContent, video_id)
         
         if not video:
             raise NotFoundException(f"视频不存在: {video_id}")
@@ -104,23 +195,54 @@ class VideoService:
         return video
     
     @staticmethod
-    def update_video(db: Session, video_id: str, update_data: VideoUpdate) -> VideoContent:
+    async def get_video_detail(db: AsyncSession, video_id: str) -> Dict[str, Any]:
         """
-        更新视频信息
+        获取视频详情（读穿透缓存）
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_id: 视频ID
+            
+        Returns:
+            视频详情字典
+            
+        Raises:
+            NotFoundException: 视频不存在时抛出
+        """
+        cache_key = f"video:{video_id}:detail"
+        cached_video = await cache_manager.get(cache_key)
+        
+        if cached_video:
+            video_detail = cached_video
+        else:
+            video = await VideoService.get_video_by_id(db, video_id)
+            video_detail = VideoResponse.model_validate(video).model_dump(mode="json")
+            
+            # 缓存视频详情
+            await cache_manager.set(cache_key, video_detail, expire=VIDEO_DETAIL_CACHE_TTL)
+        
+        # 加上尚未写回数据库的观看次数
+        video_detail["view_count"] += await VideoService.get_pending_view_count(video_id)
+        
+        return video_detail
+    
+    @staticmethod
+    async def update_video(db: AsyncSession, video: VideoContent, update_data: VideoUpdate) -> VideoContent:
+        """
+        更新视频信息
+        
+        Args:
+            db: 异步数据库会话
+            video: 已加载的视频内容对象
             update_data: 视频更新数据
             
         Returns:
             更新后的视频内容对象
             
         Raises:
-            NotFoundException: 视频不存在时抛出
             BusinessException: 更新失败时抛出
         """
-        video = VideoService.get_video_by_id(db, video_id)
+        video_id = video.id
         
         try:
             update_dict = update_data.model_dump(exclude_unset=True)
@@ -128,102 +250,133 @@ class VideoService:
                 setattr(video, key, value)
                 
             video.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(video)
+            await db.commit()
+            await db.refresh(video)
             
             # 清除缓存
-            cache_key_pattern = f"video:{video_id}:*"
-            cache_manager.delete_pattern(cache_key_pattern)
+            await VideoService.invalidate_video_cache(video_id)
             
             logger.info(f"Video updated: {video_id}")
             return video
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to update video {video_id}: {str(e)}", exc_info=True)
             raise BusinessException("更新视频失败")
     
     @staticmethod
-    def delete_video(db: Session, video_id: str) -> bool:
+    async def delete_video(db: AsyncSession, video: VideoContent) -> bool:
         """
         删除视频（软删除）
         
         Args:
-            db: 数据库会话
-            video_id: 视频ID
+            db: 异步数据库会话
+            video: 已加载的视频内容对象
             
         Returns:
             删除是否成功
             
         Raises:
-            NotFoundException: 视频不存在时抛出
             BusinessException: 删除失败时抛出
         """
-        video = VideoService.get_video_by_id(db, video_id)
+        video_id = video.id
         
         try:
-            video.status = VideoStatus.REJECTED
+            video.status = "rejected"
             video.updated_at = datetime.utcnow()
-            db.commit()
+            await db.commit()
             
             # 清除缓存
-            cache_key_pattern = f"video:{video_id}:*"
-            cache_manager.delete_pattern(cache_key_pattern)
+            await VideoService.invalidate_video_cache(video_id)
             
             logger.info(f"Video deleted: {video_id}")
             return True
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to delete video {video_id}: {str(e)}", exc_info=True)
             raise BusinessException("删除视频失败")
     
     @staticmethod
-    def list_videos(
-        db: Session,
+    async def list_videos(
+        db: AsyncSession,
         user_id: Optional[str] = None,
         merchant_id: Optional[str] = None,
         status: Optional[VideoStatus] = None,
         visibility: Optional[VideoVisibility] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        include_total: bool = False,
+        cursor: Optional[Tuple[datetime, str]] = None
     ) -> Page[VideoContent]:
         """
         分页列出视频
         
+        默认不统计总数，多取一条记录判断是否有下一页；传入游标时按(创建时间, 视频ID)做键集分页，
+        不再使用OFFSET跳过前面的记录；视频ID参与排序，创建时间相同的视频不会在翻页时遗漏或重复
+        
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             user_id: 用户ID过滤
             merchant_id: 商家ID过滤
             status: 视频状态过滤
             visibility: 可见性过滤
-            page: 页码
+            page: 页码（未传游标时生效）
             page_size: 每页大小
+            include_total: 是否统计总数（总数在Redis中缓存30秒）
+            cursor: 游标，上一页最后一条视频的(创建时间, 视频ID)
             
         Returns:
             分页视频内容列表
         """
-        query = db.query(VideoContent)
-        
         # 过滤条件
+        filters = []
         if user_id:
-            query = query.filter(VideoContent.user_id == user_id)
+            filters.append(VideoContent.user_id == user_id)
         if merchant_id:
-            query = query.filter(VideoContent.merchant_id == merchant_id)
+            filters.append(VideoContent.merchant_id == merchant_id)
         if status:
-            query = query.filter(VideoContent.status == status)
+            filters.append(VideoContent.status == status)
         if visibility:
-            query = query.filter(VideoContent.visibility == visibility)
-            
-        # 排序
-        query = query.order_by(desc(VideoContent.created_at))
-        
-        return paginate(query, page, page_size)
+            filters.append(VideoContent.visibility == visibility)
+        
+        # 排序并分页；列表只使用视频主表字段，禁止关系属性懒加载，保证一页数据只需一次查询
+        query = select(VideoContent).options(raiseload("*")).where(*filters)
+        if cursor:
+            query = query.where(tuple_(VideoContent.created_at, VideoContent.id) < tuple_(*cursor))
+        else:
+            query = query.offset((page - 1) * page_size)
+        result = await db.scalars(
+            query.order_by(desc(VideoContent.created_at), desc(VideoContent.id)).limit(page_size + 1)
+        )
+        items = list(result.all())
+        has_next = len(items) > page_size
+        items = items[:page_size]
+        
+        total = pages = None
+        if include_total:
+            # 获取总数（直接对主表计数，按过滤条件缓存）
+            cache_key = f"videos:total:{user_id}:{merchant_id}:{status}:{visibility}"
+            total = await cache_manager.get(cache_key)
+            if total is None:
+                total = await db.scalar(select(func.count(VideoContent.id)).where(*filters)) or 0
+                await cache_manager.set(cache_key, total, expire=VIDEO_LIST_TOTAL_CACHE_TTL)
+            pages = ceil(total / page_size) if total > 0 else 1
+        
+        return Page(
+            items=items,
+            page=page,
+            page_size=page_size,
+            total=total,
+            pages=pages,
+            has_next=has_next,
+            next_cursor=VideoService.encode_list_cursor(items[-1]) if has_next else None
+        )
     
     @staticmethod
-    def update_video_status(
-        db: Session,
-        video_id: str,
+    async def update_video_status(
+        db: AsyncSession,
+        video: VideoContent,
         status: VideoStatus,
         approved_by: Optional[str] = None,
         rejection_reason: Optional[str] = None
@@ -232,8 +385,8 @@ class VideoService:
         更新视频状态
         
         Args:
-            db: 数据库会话
-            video_id: 视频ID
+            db: 异步数据库会话
+            video: 已加载的视频内容对象
             status: 新状态
             approved_by: 审核人ID
             rejection_reason: 拒绝原因
@@ -242,42 +395,40 @@ class VideoService:
             更新后的视频内容对象
             
         Raises:
-            NotFoundException: 视频不存在时抛出
             BusinessException: 更新失败时抛出
         """
-        video = VideoService.get_video_by_id(db, video_id)
+        video_id = video.id
         
         try:
             video.status = status
             
-            if status == VideoStatus.PUBLISHED:
+            if status == "published":
                 video.is_approved = True
                 video.approved_by = approved_by
                 video.approved_at = datetime.utcnow()
                 video.published_at = datetime.utcnow()
-            elif status == VideoStatus.REJECTED:
+            elif status == "rejected":
                 video.is_approved = False
                 video.rejection_reason = rejection_reason
                 
             video.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(video)
+            await db.commit()
+            await db.refresh(video)
             
             # 清除缓存
-            cache_key_pattern = f"video:{video_id}:*"
-            cache_manager.delete_pattern(cache_key_pattern)
+            await VideoService.invalidate_video_cache(video_id)
             
             logger.info(f"Video status updated: {video_id} -> {status}")
             return video
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to update video status {video_id}: {str(e)}", exc_info=True)
             raise BusinessException("更新视频状态失败")
     
     @staticmethod
-    def update_transcoding_progress(
-        db: Session,
+    async def update_transcoding_progress(
+        db: AsyncSession,
         video_id: str,
         progress: float,
         status: TranscodingStatus
@@ -286,7 +437,7 @@ class VideoService:
         更新转码进度和状态
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_id: 视频ID
             progress: 转码进度
             status: 转码状态
@@ -298,64 +449,64 @@ class VideoService:
             NotFoundException: 视频不存在时抛出
             BusinessException: 更新失败时抛出
         """
-        video = VideoService.get_video_by_id(db, video_id)
+        video = await VideoService.get_video_by_id(db, video_id)
         
         try:
             video.transcoding_progress = progress
             video.transcoding_status = status
             
-            if status == TranscodingStatus.COMPLETED:
-                video.status = VideoStatus.READY
+            if status == "completed":
+                video.status = "ready"
                 
             video.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(video)
+            await db.commit()
+            await db.refresh(video)
+            
+            # 清除缓存
+            await VideoService.invalidate_video_cache(video_id)
             
             return video
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to update transcoding progress for {video_id}: {str(e)}", exc_info=True)
             raise BusinessException("更新转码进度失败")
     
     @staticmethod
-    def increment_view_count(db: Session, video_id: str) -> VideoContent:
+    async def increment_view_count(db: AsyncSession, video_id: str) -> None:
         """
         增加视频观看次数
         
+        观看次数先累加到Redis中，由定时任务按视频聚合后批量写回数据库，
+        避免热门视频的每次观看都更新同一行；Redis不可用时直接更新数据库
+        
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_id: 视频ID
             
-        Returns:
-            更新后的视频内容对象
-            
         Raises:
-            NotFoundException: 视频不存在时抛出
             BusinessException: 更新失败时抛出
         """
-        video = VideoService.get_video_by_id(db, video_id)
+        if await cache_manager.hincrby(VIDEO_VIEW_DELTAS_KEY, video_id) is not None:
+            return
         
         try:
-            video.view_count += 1
-            db.commit()
-            db.refresh(video)
-            
-            # 更新缓存中的观看次数
-            cache_key = f"video:{video_id}:views"
-            cache_manager.set(cache_key, video.view_count, expire=3600)
-            
-            return video
+            await db.execute(
+                update(VideoContent)
+                .where(VideoContent.id == video_id)
+                .values(view_count=VideoContent.view_count + 1)
+            )
+            await db.commit()
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to increment view count for {video_id}: {str(e)}", exc_info=True)
             raise BusinessException("更新观看次数失败")
     
     @staticmethod
-    def record_video_interaction(
-        db: Session,
-        video_id: str,
+    async def record_video_interaction(
+        db: AsyncSession,
+        video: VideoContent,
         user_id: str,
         interaction_data: Dict[str, Any]
     ) -> VideoInteraction:
@@ -363,8 +514,8 @@ class VideoService:
         记录用户互动
         
         Args:
-            db: 数据库会话
-            video_id: 视频ID
+            db: 异步数据库会话
+            video: 已加载的视频内容对象
             user_id: 用户ID
             interaction_data: 互动数据
             
@@ -374,6 +525,8 @@ class VideoService:
         Raises:
             BusinessException: 记录失败时抛出
         """
+        video_id = video.id
+        
         try:
             interaction = VideoInteraction(
                 video_id=video_id,
@@ -384,28 +537,26 @@ class VideoService:
             )
             
             db.add(interaction)
-            db.commit()
-            db.refresh(interaction)
             
-            # 更新视频的互动计数
-            video = VideoService.get_video_by_id(db, video_id)
+            # 更新视频的互动计数，与互动记录在同一事务中提交
             if interaction_data.get('interaction_type') == 'like':
                 video.like_count += 1
             elif interaction_data.get('interaction_type') == 'share':
                 video.share_count += 1
                 
-            db.commit()
+            await db.commit()
+            await db.refresh(interaction)
             
             return interaction
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to record interaction for video {video_id}: {str(e)}", exc_info=True)
             raise BusinessException("记录用户互动失败")
     
     @staticmethod
-    def get_video_analytics(
-        db: Session,
+    async def get_video_analytics(
+        db: AsyncSession,
         video_id: str,
         start_date: datetime,
         end_date: datetime
@@ -414,7 +565,7 @@ class VideoService:
         获取视频分析数据
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_id: 视频ID
             start_date: 开始日期
             end_date: 结束日期
@@ -422,19 +573,22 @@ class VideoService:
         Returns:
             视频分析数据列表
         """
-        return db.query(VideoAnalytics).filter(
-            VideoAnalytics.video_id == video_id,
-            VideoAnalytics.date >= start_date,
-            VideoAnalytics.date <= end_date
-        ).order_by(VideoAnalytics.date).all()
+        result = await db.scalars(
+            select(VideoAnalytics).where(
+                VideoAnalytics.video_id == video_id,
+                VideoAnalytics.date >= start_date,
+                VideoAnalytics.date <= end_date
+            ).order_by(VideoAnalytics.date)
+        )
+        return list(result.all())
     
     @staticmethod
-    def get_video_stats(db: Session, video_id: str) -> Dict[str, Any]:
+    async def get_video_stats(db: AsyncSession, video_id: str) -> Dict[str, Any]:
         """
         获取视频统计信息
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             video_id: 视频ID
             
         Returns:
@@ -442,84 +596,128 @@ class VideoService:
         """
         # 尝试从缓存获取
         cache_key = f"video:{video_id}:stats"
-        cached_stats = cache_manager.get(cache_key)
+        cached_stats = await cache_manager.get(cache_key)
         
         if cached_stats:
             return cached_stats
         
-        video = VideoService.get_video_by_id(db, video_id)
-        
-        # 计算平均观看时长
-        avg_watch_time = db.query(func.avg(VideoInteraction.watch_duration)).filter(
-            VideoInteraction.video_id == video_id,
-            VideoInteraction.interaction_type == 'view'
-        ).scalar() or 0.0
+        video = await VideoService.get_video_by_id(db, video_id)
+        
+        # 平均观看时长、观看数和完播数在一次查询中聚合
+        watch_stats = (await db.execute(
+            select(
+                func.avg(VideoInteraction.watch_duration),
+                func.count(VideoInteraction.id),
+                func.count(VideoInteraction.id).filter(VideoInteraction.watch_percentage >= 0.9)
+            ).where(
+                VideoInteraction.video_id == video_id,
+                VideoInteraction.interaction_type == 'view'
+            )
+        )).one()
+        avg_watch_time = watch_stats[0] or 0.0
+        total_views = watch_stats[1] or 0
+        completed_views = watch_stats[2] or 0
         
         # 计算完成率
-        total_views = db.query(func.count(VideoInteraction.id)).filter(
-            VideoInteraction.video_id == video_id,
-            VideoInteraction.interaction_type == 'view'
-        ).scalar() or 0
-        
-        completed_views = db.query(func.count(VideoInteraction.id)).filter(
-            VideoInteraction.video_id == video_id,
-            VideoInteraction.interaction_type == 'view',
-            VideoInteraction.watch_percentage >= 0.9
-        ).scalar() or 0
-        
         completion_rate = (completed_views / total_views * 100) if total_views > 0 else 0
         
         stats = {
             "video_id": video_id,
-            "total_views": video.view_count,
+            "total_views": video.view_count + await VideoService.get_pending_view_count(video_id),
             "total_likes": video.like_count,
             "total_shares": video.share_count,
             "total_comments": video.comment_count,
             "average_watch_time": round(avg_watch_time, 2),
             "completion_rate": round(completion_rate, 2),
             "engagement_rate": round((video.like_count + video.share_count) / max(video.view_count, 1) * 100, 2),
-            "last_updated": datetime.utcnow()
+            "last_updated": datetime.utcnow().isoformat()
         }
         
         # 缓存统计信息
-        cache_manager.set(cache_key, stats, expire=300)  # 5分钟缓存
+        await cache_manager.set(cache_key, stats, expire=VIDEO_STATS_CACHE_TTL)
         
         return stats
     
     @staticmethod
-    def get_popular_videos(
-        db: Session,
+    async def get_video_details(db: AsyncSession, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        批量获取视频详情
+        
+        先通过一次MGET读取详情缓存，未命中的视频用一次查询补齐并写入缓存
+        
+        Args:
+            db: 异步数据库会话
+            video_ids: 视频ID列表
+            
+        Returns:
+            视频详情字典列表（与video_ids顺序一致，忽略不存在的视频）
+        """
+        cached = await cache_manager.mget([f"video:{video_id}:detail" for video_id in video_ids])
+        details = {video_id: detail for video_id, detail in zip(video_ids, cached) if detail}
+        
+        missing_ids = [video_id for video_id in video_ids if video_id not in details]
+        if missing_ids:
+            result = await db.scalars(
+                select(VideoContent).options(raiseload("*")).where(VideoContent.id.in_(missing_ids))
+            )
+            videos = result.all()
+            # 整页ORM对象一次校验、一次序列化
+            for video, detail in zip(videos, VIDEO_LIST_ADAPTER.dump_python(
+                VIDEO_LIST_ADAPTER.validate_python(videos), mode="json"
+            )):
+                details[video.id] = detail
+                await cache_manager.set(f"video:{video.id}:detail", detail, expire=VIDEO_DETAIL_CACHE_TTL)
+        
+        return [details[video_id] for video_id in video_ids if video_id in details]
+    
+    @staticmethod
+    async def get_popular_videos(
+        db: AsyncSession,
         limit: int = 10,
         days: int = 7
-    ) -> List[VideoContent]:
+    ) -> List[Dict[str, Any]]:
         """
-        获取热门视频
+        获取热门视频（读穿透缓存）
         
         Args:
-            db: 数据库会话
+            db: 异步数据库会话
             limit: 返回视频数量限制
             days: 天数范围
             
         Returns:
-            热门视频列表
+            热门视频详情字典列表
         """
-        cache_key = f"popular_videos:{days}d:{limit}"
-        cached_result = cache_manager.get(cache_key)
+        # 常用时间窗口直接读取定时刷新的有序集合，只需一次ZREVRANGE和一次MGET
+        if days in POPULAR_VIDEOS_WINDOWS:
+            video_ids = await cache_manager.zrevrange(
+                POPULAR_VIDEOS_ZSET_KEY.format(days=days), 0, limit - 1
+            )
+            if video_ids:
+                videos = await VideoService.get_video_details(db, video_ids)
+                # 刷新后被下架的视频不再返回
+                return [video for video in videos if video["status"] == "published"]
+        
+        # 缓存键带上版本号，视频变更时递增版本号即可使所有热门缓存失效
+        version = await cache_manager.get(POPULAR_VIDEOS_VERSION_KEY) or 0
+        cache_key = f"popular_videos:v{version}:{days}d:{limit}"
+        cached_result = await cache_manager.get(cache_key)
         
-        if cached_result:
+        if cached_result is not None:
             return cached_result
         
         since_date = datetime.utcnow() - timedelta(days=days)
         
-        videos = db.query(VideoContent).filter(
-            VideoContent.status == VideoStatus.PUBLISHED,
-            VideoContent.created_at >= since_date
-        ).order_by(
-            desc(VideoContent.view_count),
-            desc(VideoContent.like_count)
-        ).limit(limit).all()
+        result = await db.scalars(
+            select(VideoContent).options(raiseload("*")).where(
+                VideoContent.status == "published",
+                VideoContent.created_at >= since_date
+            ).order_by(
+                desc(POPULAR_VIDEO_SCORE)
+            ).limit(limit)
+        )
+        videos = VIDEO_LIST_ADAPTER.dump_python(VIDEO_LIST_ADAPTER.validate_python(result.all()), mode="json")
         
         # 缓存结果
-        cache_manager.set(cache_key, videos, expire=900)  # 15分钟缓存
+        await cache_manager.set(cache_key, videos, expire=POPULAR_VIDEOS_CACHE_TTL)
         
         return videos
\ No newline at end of file
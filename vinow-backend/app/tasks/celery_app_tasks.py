@@ -22,10 +22,25 @@ celery_app.conf.update(
     timezone='Asia/Ho_Chi_Minh',
     enable_utc=True,
     task_routes={
+        # 观看次数写回、热门视频刷新是轻量任务，不占用转码队列
+        'app.tasks.video_tasks.flush_video_view_counts': {'queue': 'default'},
+        'app.tasks.video_tasks.refresh_popular_videos': {'queue': 'default'},
         'app.tasks.video_tasks.*': {'queue': 'video_transcoding'},
         'app.tasks.content_tasks.*': {'queue': 'default'},
     },
     task_annotations={
         'app.tasks.video_tasks.process_video_transcoding': {'rate_limit': '10/m'},
+    },
+    beat_schedule={
+        # 每30秒将Redis中累积的观看次数批量写回数据库
+        'flush-video-view-counts': {
+            'task': 'app.tasks.video_tasks.flush_video_view_counts',
+            'schedule': 30.0,
+        },
+        # 每5分钟刷新热门视频有序集合
+        'refresh-popular-videos': {
+            'task': 'app.tasks.video_tasks.refresh_popular_videos',
+            'schedule': 300.0,
+        },
     }
 )
\ No newline at end of file
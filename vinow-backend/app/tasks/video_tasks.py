@@ -7,6 +7,9 @@
 3. 视频缩略图生成
 4. 处理文件上传和元数据更新
 5. 旧文件清理任务
+6. 视频内容上传完成后的转码任务（在独立的转码worker中执行）
+7. 观看次数增量批量写回任务（由Celery Beat定时触发）
+8. 热门视频有序集合刷新任务（由Celery Beat定时触发）
 
 依赖的外部工具：
 - FFmpeg：视频转码和缩略图生成
@@ -17,6 +20,7 @@
 
 import os
 import uuid
+import asyncio
 from typing import Dict, Any, Optional, List
 from celery import shared_task
 from app.config import settings
@@ -33,6 +37,9 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     'process_video_file',
+    'process_video_transcoding',
+    'flush_video_view_counts',
+    'refresh_popular_videos',
     'cleanup_old_video_files'
 ]
 
@@ -504,6 +511,146 @@ def update_media_metadata(media_id: str, video_info: Dict[str, Any], processed_f
         logger.error(f"更新媒体元数据异常: {str(e)}", exc_info=True)
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, acks_late=True)
+def process_video_transcoding(self, video_id: str, original_file_path: str, profile_ids: List[str]) -> None:
+    """
+    视频转码任务 - 按转码配置生成各分辨率版本和缩略图
+    
+    由API在分片上传完成后投递到video_transcoding队列，在独立的转码worker中执行，
+    不占用API进程的事件循环和CPU
+    
+    Args:
+        self: Celery任务实例
+        video_id: 视频ID
+        original_file_path: 原始文件路径
+        profile_ids: 转码配置ID列表
+    """
+    from app.services.transcoding_service import VideoTranscodingService
+    
+    try:
+        logger.info(f"开始视频转码任务: {video_id}")
+        asyncio.run(VideoTranscodingService.process_transcoding(video_id, original_file_path, profile_ids))
+    except Exception as e:
+        logger.error(f"视频转码任务异常: {video_id}, 错误: {str(e)}", exc_info=True)
+        raise self.retry(exc=e)
+
+
+@shared_task
+def flush_video_view_counts() -> Dict[str, Any]:
+    """
+    观看次数写回任务 - 将Redis中累积的观看次数增量批量写回数据库
+    
+    先将待写回哈希原子地改名为写回中的键，期间新的观看继续累加到新哈希，读取方同时计入两个哈希；
+    写回提交后删除写回中的键，并清除相关视频的详情和统计缓存，避免缓存中的旧观看次数回退；
+    写回失败时保留该键，下次执行时优先重试
+    
+    Returns:
+        写回结果字典
+    """
+    import redis
+    from sqlalchemy import update
+    from app.database.connection import DatabaseManager
+    from app.database.session import SessionLocal
+    from app.models.video_models import VideoContent
+    from app.services.video_service import VIDEO_VIEW_DELTAS_KEY, VIDEO_VIEW_FLUSHING_KEY
+    
+    redis_client = DatabaseManager.get_redis_client()
+    flushing_key = VIDEO_VIEW_FLUSHING_KEY
+    
+    if not redis_client.exists(flushing_key):
+        try:
+            redis_client.rename(VIDEO_VIEW_DELTAS_KEY, flushing_key)
+        except redis.ResponseError:
+            # 待写回哈希不存在，本周期没有新的观看
+            return {"success": True, "flushed_videos": 0}
+    
+    deltas = redis_client.hgetall(flushing_key)
+    
+    db = SessionLocal()
+    try:
+        for video_id, delta in deltas.items():
+            db.execute(
+                update(VideoContent)
+                .where(VideoContent.id == video_id)
+                .values(view_count=VideoContent.view_count + int(delta))
+            )
+        db.commit()
+        
+        # 增量已计入数据库，一次删除写回中的键和缓存中的旧观看次数
+        stale_keys = [flushing_key]
+        for video_id in deltas:
+            stale_keys.append(f"video:{video_id}:detail")
+            stale_keys.append(f"video:{video_id}:stats")
+        redis_client.delete(*stale_keys)
+        
+        logger.info(f"观看次数写回完成: {len(deltas)} 个视频")
+        return {"success": True, "flushed_videos": len(deltas)}
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"观看次数写回失败: {str(e)}", exc_info=True)
+        return {"success": False, "error": str(e)}
+    finally:
+        db.close()
+
+
+@shared_task
+def refresh_popular_videos() -> Dict[str, Any]:
+    """
+    热门视频刷新任务 - 按时间窗口计算热门视频并写入Redis有序集合
+    
+    每个窗口先写入临时键再原子改名，读取方不会看到写入一半的集合
+    
+    Returns:
+        刷新结果字典
+    """
+    from sqlalchemy import select, desc
+    from app.database.connection import DatabaseManager
+    from app.database.session import SessionLocal
+    from app.models.video_models import VideoContent
+    from app.services.video_service import (
+        POPULAR_VIDEOS_ZSET_KEY, POPULAR_VIDEOS_WINDOWS, POPULAR_VIDEOS_ZSET_SIZE,
+        POPULAR_VIDEOS_ZSET_TTL, POPULAR_VIDEO_SCORE
+    )
+    
+    redis_client = DatabaseManager.get_redis_client()
+    refreshed = {}
+    
+    db = SessionLocal()
+    try:
+        for days in POPULAR_VIDEOS_WINDOWS:
+            since_date = datetime.utcnow() - timedelta(days=days)
+            rows = db.execute(
+                select(VideoContent.id, POPULAR_VIDEO_SCORE).where(
+                    VideoContent.status == "published",
+                    VideoContent.created_at >= since_date
+                ).order_by(desc(POPULAR_VIDEO_SCORE)).limit(POPULAR_VIDEOS_ZSET_SIZE)
+            ).all()
+            
+            key = POPULAR_VIDEOS_ZSET_KEY.format(days=days)
+            temp_key = f"{key}:refreshing"
+            pipe = redis_client.pipeline()
+            pipe.delete(temp_key)
+            if rows:
+                pipe.zadd(temp_key, {video_id: score for video_id, score in rows})
+                pipe.expire(temp_key, POPULAR_VIDEOS_ZSET_TTL)
+                pipe.rename(temp_key, key)
+            else:
+                pipe.delete(key)
+            pipe.execute()
+            
+            refreshed[f"{days}d"] = len(rows)
+        
+        logger.info(f"热门视频刷新完成: {refreshed}")
+        return {"success": True, "refreshed": refreshed}
+        
+    except Exception as e:
+        logger.error(f"热门视频刷新失败: {str(e)}", exc_info=True)
+        return {"success": False, "error": str(e)}
+    finally:
+        db.close()
+
+
 @shared_task
 def cleanup_old_video_files(days_old: int = 30) -> Dict[str, Any]:
     """
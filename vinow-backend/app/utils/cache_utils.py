@@ -3,9 +3,9 @@
 缓存管理工具模块
 
 本模块提供了基于Redis的缓存管理功能，包括：
-1. 基础缓存操作（设置、获取、删除）
-2. 哈希表操作
-3. 计数器操作（递增、递减）
+1. 基础缓存操作（设置、获取、批量获取、删除）
+2. 哈希表和有序集合操作
+3. 计数器操作（递增、递减、哈希字段递增）
 4. 缓存模式匹配删除
 5. 缓存健康检查
 6. TTL管理和过期时间设置
@@ -308,6 +308,31 @@ class CacheManager:
             logger.warning(f"缓存递减异常 - 键: {key}, 错误: {str(e)}")
             return None
     
+    async def hincrby(self, key: str, field: str, amount: int = 1) -> Optional[int]:
+        """
+        递增哈希字段值
+        
+        Args:
+            key: 哈希键
+            field: 字段名
+            amount: 递增数量
+            
+        Returns:
+            递增后的值或None
+        """
+        try:
+            # 检查Redis客户端是否可用
+            if not self.redis_client:
+                return None
+            
+            # 递增哈希字段值
+            return self.redis_client.hincrby(key, field, amount)
+            
+        except Exception as e:
+            # 记录异常，但不抛出（缓存失败不应该影响主流程）
+            logger.warning(f"哈希递增异常 - 键: {key}, 字段: {field}, 错误: {str(e)}")
+            return None
+    
     async def hset(self, key: str, field: str, value: Any) -> bool:
         """
         设置哈希字段值
@@ -413,6 +438,69 @@ class CacheManager:
             logger.warning(f"哈希获取全部异常 - 键: {key}, 错误: {str(e)}")
             return {}
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        批量获取缓存数据（一次往返）
+        
+        Args:
+            keys: 缓存键列表
+            
+        Returns:
+            与键一一对应的缓存数据列表，不存在的键对应None
+        """
+        try:
+            # 检查Redis客户端是否可用
+            if not self.redis_client or not keys:
+                return [None] * len(keys)
+            
+            # 批量获取数据
+            values = self.redis_client.mget(keys)
+            
+            # 解析JSON数据
+            result = []
+            for value in values:
+                if value is None:
+                    result.append(None)
+                    continue
+                try:
+                    result.append(json.loads(value))
+                except json.JSONDecodeError:
+                    result.append(value.decode('utf-8') if isinstance(value, bytes) else value)
+            
+            # 返回解析后的数据
+            return result
+            
+        except Exception as e:
+            # 记录异常，但不抛出（缓存失败不应该影响主流程）
+            logger.warning(f"缓存批量获取异常 - 键数量: {len(keys)}, 错误: {str(e)}")
+            return [None] * len(keys)
+    
+    async def zrevrange(self, key: str, start: int, end: int) -> Optional[List[str]]:
+        """
+        按分数从高到低获取有序集合成员
+        
+        Args:
+            key: 有序集合键
+            start: 起始位置
+            end: 结束位置（包含）
+            
+        Returns:
+            成员列表，Redis不可用时返回None
+        """
+        try:
+            # 检查Redis客户端是否可用
+            if not self.redis_client:
+                return None
+            
+            # 获取有序集合成员
+            members = self.redis_client.zrevrange(key, start, end)
+            return [member.decode('utf-8') if isinstance(member, bytes) else member for member in members]
+            
+        except Exception as e:
+            # 记录异常，但不抛出（缓存失败不应该影响主流程）
+            logger.warning(f"有序集合获取异常 - 键: {key}, 错误: {str(e)}")
+            return None
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         缓存健康检查
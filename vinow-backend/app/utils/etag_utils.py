@@ -0,0 +1,164 @@
+"""
+HTTP缓存校验工具模块
+
+本模块为只读接口提供ETag和Cache-Control支持，包括：
+1. 商户数据版本号的读取与递增（保存在Redis中，多个worker共享）
+2. 基于商户版本号和时间窗口生成ETag
+3. 基于响应内容的版本字段（如updated_at）生成ETag
+4. 条件请求（If-None-Match）命中判断
+5. 为响应设置缓存相关的响应头
+
+版本号在评价回复、状态变更、统计刷新时递增；ETag同时包含时间窗口，
+即使数据由其他途径变化（如用户新增评价），客户端缓存也最多在一个窗口后失效。
+"""
+
+import hashlib
+import time
+from typing import Any, Optional
+from fastapi import Request, Response
+from app.utils.cache_utils import cache_manager
+
+__all__ = [
+    'HTTP_CACHE_MAX_AGE',
+    'bump_merchant_version',
+    'build_merchant_etag',
+    'build_etag',
+    'cache_control_value',
+    'is_not_modified',
+    'not_modified_response',
+    'with_cache_headers'
+]
+
+# 客户端缓存有效期（秒）
+HTTP_CACHE_MAX_AGE = 60
+
+
+def _version_key(merchant_id: int) -> str:
+    """生成商户数据版本号的缓存键"""
+    return f"merchant:{merchant_id}:data_version"
+
+
+async def bump_merchant_version(merchant_id: int) -> None:
+    """
+    递增商户数据版本号，使该商户已发出的ETag全部失效
+
+    Args:
+        merchant_id: 商户ID
+    """
+    await cache_manager.increment(_version_key(merchant_id))
+
+
+async def build_merchant_etag(scope: str, merchant_id: int, *parts: Any, window: int = HTTP_CACHE_MAX_AGE) -> str:
+    """
+    生成商户只读接口的ETag
+
+    Args:
+        scope: 接口标识（不同接口的ETag互不相同）
+        merchant_id: 商户ID
+        *parts: 影响响应内容的其他参数
+        window: 时间窗口（秒），ETag最多在一个窗口内保持不变
+
+    Returns:
+        带引号的强校验ETag
+    """
+    # Redis不可用时版本号视为0，仅依靠时间窗口失效
+    version = await cache_manager.get(_version_key(merchant_id)) or 0
+    bucket = int(time.time() // window)
+    raw = ":".join(str(part) for part in (scope, merchant_id, version, bucket, *parts))
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()}"'
+
+
+def build_etag(*parts: Any) -> str:
+    """
+    根据响应内容的版本字段生成ETag
+
+    Args:
+        *parts: 决定响应内容的字段（如资源ID、updated_at）
+
+    Returns:
+        带引号的强校验ETag
+    """
+    raw = ":".join(str(part) for part in parts)
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()}"'
+
+
+def cache_control_value(max_age: int = HTTP_CACHE_MAX_AGE, public: bool = False, stale_while_revalidate: int = 0) -> str:
+    """
+    生成Cache-Control响应头的值
+
+    Args:
+        max_age: 缓存有效期（秒）
+        public: 是否允许CDN等共享缓存保存，否则仅客户端可缓存
+        stale_while_revalidate: 过期后可先返回旧内容并在后台重新校验的时长（秒）
+
+    Returns:
+        Cache-Control响应头的值
+    """
+    value = f"{'public' if public else 'private'}, max-age={max_age}"
+    if stale_while_revalidate:
+        value += f", stale-while-revalidate={stale_while_revalidate}"
+    return value
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    判断条件请求是否命中
+
+    Args:
+        request: 请求对象
+        etag: 当前ETag
+
+    Returns:
+        客户端持有的版本与当前一致时返回True
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str, max_age: int = HTTP_CACHE_MAX_AGE, cache_control: Optional[str] = None) -> Response:
+    """
+    构建304响应
+
+    Args:
+        etag: 当前ETag
+        max_age: 客户端缓存有效期（秒）
+        cache_control: 完整的Cache-Control值，默认仅允许客户端缓存max_age秒
+
+    Returns:
+        不含响应体的304响应
+    """
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": cache_control or cache_control_value(max_age)}
+    )
+
+
+def with_cache_headers(
+    result: Any,
+    response: Response,
+    etag: str,
+    max_age: int = HTTP_CACHE_MAX_AGE,
+    cache_control: Optional[str] = None
+) -> Any:
+    """
+    为接口返回值设置ETag和Cache-Control响应头
+
+    路由直接返回Response对象时，FastAPI不会合并注入的response参数上的响应头，
+    因此响应头需要设置在实际返回的对象上。
+
+    Args:
+        result: 路由返回值（Response对象或待序列化的数据）
+        response: FastAPI注入的响应对象
+        etag: 当前ETag
+        max_age: 客户端缓存有效期（秒）
+        cache_control: 完整的Cache-Control值，默认仅允许客户端缓存max_age秒
+
+    Returns:
+        原样返回result
+    """
+    target = result if isinstance(result, Response) else response
+    target.headers["ETag"] = etag
+    target.headers["Cache-Control"] = cache_control or cache_control_value(max_age)
+    return result
@@ -32,11 +32,15 @@ import logging
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 视频存储键允许使用的扩展名，其余一律按默认扩展名存储
+VIDEO_FILE_EXTENSIONS = frozenset({"mp4", "mov", "mkv", "webm", "avi"})
+
 __all__ = [
     'generate_file_hash',
     'validate_file_type',
     'validate_file_size',
     'get_file_extension',
+    'get_video_extension',
     'sanitize_filename',
     'generate_unique_filename',
     'get_image_dimensions',
@@ -164,6 +168,23 @@ def get_file_extension(filename: str) -> str:
         return ""
 
 
+def get_video_extension(filename: str, default: str = "mp4") -> str:
+    """
+    获取视频文件的存储扩展名
+    
+    Args:
+        filename: 原始文件名
+        default: 无扩展名或扩展名不在白名单内时使用的扩展名
+        
+    Returns:
+        视频扩展名（小写，不带点）
+    """
+    # rpartition只扫描一次文件名
+    _, sep, extension = filename.rpartition('.')
+    extension = extension.lower()
+    return extension if sep and extension in VIDEO_FILE_EXTENSIONS else default
+
+
 def sanitize_filename(filename: str) -> str:
     """
     清理文件名（移除不安全字符）
@@ -0,0 +1,63 @@
+"""
+模型JSON响应工具模块
+
+本模块提供直接由Pydantic模型生成JSON响应体的响应类。
+
+路由返回普通数据时，FastAPI先按response_model校验并转换为字典，再由响应类编码为JSON；
+高频只读接口在路由内构造好响应模型后，可直接用pydantic-core的序列化器输出JSON字节，
+省去中间字典的分配和二次编码。
+"""
+
+from typing import Any, Mapping, Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+__all__ = ['ModelJSONResponse']
+
+
+class ModelJSONResponse(ORJSONResponse):
+    """
+    Pydantic模型JSON响应
+
+    内容为Pydantic模型时直接序列化为JSON字节，其他内容沿用orjson序列化。
+    直接返回响应对象时FastAPI不再应用response_model，调用方需自行构造对应的响应模型。
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        exclude_none: bool = False
+    ) -> None:
+        """
+        初始化响应
+
+        Args:
+            content: 响应内容（Pydantic模型或可JSON序列化的数据）
+            status_code: HTTP状态码
+            headers: 响应头
+            media_type: 媒体类型
+            background: 响应发送后执行的后台任务
+            exclude_none: 是否省略值为None的字段（对应response_model_exclude_none）
+        """
+        # 父类初始化时即调用render，需先保存序列化选项
+        self.exclude_none = exclude_none
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        """
+        序列化响应内容
+
+        Args:
+            content: 响应内容
+
+        Returns:
+            JSON字节
+        """
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, exclude_none=self.exclude_none)
+        return super().render(content)
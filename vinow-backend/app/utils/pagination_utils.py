@@ -279,12 +279,14 @@ T = TypeVar('T')
 
 
 class Page(BaseModel, Generic[T]):
-    """分页结果模型"""
+    """分页结果模型（total/pages为空表示未统计总数）"""
     items: List[T]
     page: int
     page_size: int
-    total: int
-    pages: int
+    total: Optional[int] = None
+    pages: Optional[int] = None
+    has_next: bool = False
+    next_cursor: Optional[str] = None
     
     class Config:
         arbitrary_types_allowed = True
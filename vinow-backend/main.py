@@ -1204,10 +1204,14 @@ if __name__ == "__main__":
         log_level="info"
     )
     商家系统7评价管理
-    from fastapi import FastAPI
+    import logging
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.routers import reviews, statistics
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="商户评价管理系统",
     description="基于FastAPI和Supabase的商户评价管理后端系统",
@@ -1227,6 +1231,20 @@ app.add_middleware(
 app.include_router(reviews.router)
 app.include_router(statistics.router)
 
+# 业务参数异常处理（评价服务以ValueError表示业务校验失败）
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """业务参数异常处理，返回400"""
+    logger.warning(f"业务参数错误: {str(exc)} - URL: {request.url.path}")
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+# 全局异常处理
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    """未处理异常记录堆栈，对客户端只返回通用错误信息"""
+    logger.error(f"未处理异常: {str(exc)} - URL: {request.url.path}", exc_info=True)
+    return JSONResponse(status_code=500, content={"detail": "服务器内部错误"})
+
 @app.get("/")
 async def root():
     return {
@@ -1379,6 +1397,7 @@ from app.database.connection import DatabaseManager, supabase  # 导入数据库
 from app.routes import content_routes, review_routes, media_routes  # 导入路由模块
 from app.utils.cache import initialize_cache, cache_manager  # 导入缓存工具
 from app.utils.logger import setup_logging  # 导入日志配置
+from app.middleware.upload_limit import UploadSizeLimitMiddleware  # 导入上传大小限制中间件
 import uvicorn  # 导入UVicorn服务器
 
 # 设置日志配置
@@ -1453,6 +1472,9 @@ app.add_middleware(
     allow_headers=["*"],  # 允许所有头
 )
 
+# 添加上传大小限制中间件（在读取请求体之前拒绝超大上传）
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # 自定义异常处理器
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -1871,6 +1893,7 @@ from app.core.middleware import setup_middlewares, LoggingMiddleware, SecurityHe
 from app.core.exceptions import VideoContentException
 from app.utils.logger import logger
 from app.api.v1.endpoints import users, content, recommendations, moderation, upload
+from app.services.interaction_buffer import interaction_buffer
 
 # 应用生命周期管理
 @asynccontextmanager
@@ -1884,11 +1907,15 @@ async def lifespan(app: FastAPI):
     
     # 执行启动任务
     await startup_tasks()
+    # 启动视频互动记录批量写入任务
+    await interaction_buffer.start()
     
     yield  # 应用运行期间
     
     # 关闭时执行的操作
     logger.info("🛑 视频内容系统关闭中...")
+    # 写入队列中剩余的互动记录
+    await interaction_buffer.stop()
     await shutdown_tasks()
 
 async def startup_tasks():
@@ -9,6 +9,13 @@ import uvicorn
 from app.config import settings
 from app.utils.logger import logger
 
+# uvloop不支持Windows，未安装时使用标准asyncio事件循环
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 def main():
     """主启动函数"""
     try:
@@ -22,6 +29,8 @@ def main():
             reload=settings.debug,
             log_level=settings.log_level.lower(),
             access_log=True,
+            loop=EVENT_LOOP,  # 优先使用uvloop事件循环
+            http="httptools",  # 使用httptools解析HTTP
             workers=1 if settings.debug else 4,  # 生产环境使用多个worker
         )
         
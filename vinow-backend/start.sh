@@ -110,10 +110,14 @@ start_application() {
         exec python run.py
     else
         info "🚀 生产模式启动..."
+        # 关闭asyncio调试模式（该变量只要非空即开启调试，设为0同样生效，因此直接移除）
+        unset PYTHONASYNCIODEBUG
         exec uvicorn app.main:app \
             --host "$HOST" \
             --port "$PORT" \
             --workers "$WORKERS" \
+            --loop uvloop \
+            --http httptools \
             --log-level "$LOG_LEVEL" \
             --access-log \
             --no-server-header
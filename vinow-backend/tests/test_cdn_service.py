@@ -0,0 +1,46 @@
+"""
+CDN分发服务测试模块
+
+包含预签名URL缓存的测试用例
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.services import cdn_service as cdn_module
+from app.services.cdn_service import CDNService
+
+
+def _create_service() -> CDNService:
+    """创建不连接存储服务的CDN服务实例"""
+    with patch.object(CDNService, "_initialize_s3_client"):
+        service = CDNService()
+    service.s3_client = Mock()
+    service.s3_client.generate_presigned_url.return_value = "https://storage.example.com/signed"
+    return service
+
+
+def test_cached_presigned_url_called_through_instance():
+    """测试通过服务实例调用时生成并缓存预签名URL"""
+    service = _create_service()
+    cache = Mock(get=AsyncMock(return_value=None), set=AsyncMock(return_value=True))
+
+    with patch.object(cdn_module, "cache_manager", cache):
+        result = asyncio.run(service.get_cached_presigned_url("videos/a.mp4", "put_object", 3600))
+
+    assert result["url"] == "https://storage.example.com/signed"
+    service.s3_client.generate_presigned_url.assert_called_once()
+    cache.set.assert_awaited_once()
+
+
+def test_cached_presigned_url_returns_cache_hit():
+    """测试缓存命中时不再重新签名"""
+    service = _create_service()
+    cached = {"url": "https://storage.example.com/cached", "expires_at": "2030-01-01T00:00:00"}
+    cache = Mock(get=AsyncMock(return_value=cached), set=AsyncMock(return_value=True))
+
+    with patch.object(cdn_module, "cache_manager", cache):
+        result = asyncio.run(service.get_cached_presigned_url("videos/a.mp4", "put_object", 3600))
+
+    assert result["url"] == "https://storage.example.com/cached"
+    service.s3_client.generate_presigned_url.assert_not_called()
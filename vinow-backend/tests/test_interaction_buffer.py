@@ -0,0 +1,38 @@
+"""
+视频互动写入缓冲测试模块
+
+包含互动记录入队和批量写入的测试用例
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.services.interaction_buffer import InteractionBuffer
+
+
+def test_enqueued_records_flushed_on_stop():
+    """测试停止时写入队列中剩余的互动记录"""
+    buffer = InteractionBuffer()
+    write_batch = AsyncMock()
+
+    async def run():
+        await buffer.start()
+        assert buffer.enqueue("video-1", "user-1", {"interaction_type": "like"})
+        assert buffer.enqueue("video-1", "user-2", {"interaction_type": "share"})
+        await buffer.stop()
+
+    with patch.object(InteractionBuffer, "_write_batch", write_batch):
+        asyncio.run(run())
+
+    written = [record for call in write_batch.await_args_list for record in call.args[0]]
+    assert [(record[1], record[2], record[3]) for record in written] == [
+        ("video-1", "user-1", "like"),
+        ("video-1", "user-2", "share"),
+    ]
+
+
+def test_enqueue_before_start_rejected():
+    """测试未启动时入队失败，由调用方直接写入数据库"""
+    buffer = InteractionBuffer()
+
+    assert buffer.enqueue("video-1", "user-1", {"interaction_type": "like"}) is False
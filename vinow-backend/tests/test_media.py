@@ -0,0 +1,79 @@
+"""
+媒体上传测试模块
+
+包含上传大小限制中间件和预签名URL缓存的测试用例
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.upload_limit import UploadSizeLimitMiddleware
+from app.services import storage_services as storage_module
+
+
+def _create_app() -> FastAPI:
+    """创建挂载上传大小限制中间件的测试应用"""
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, limits={"/media/upload": 10})
+
+    @app.post("/api/v1/media/upload")
+    async def upload():
+        return {"success": True}
+
+    @app.post("/api/v1/other")
+    async def other():
+        return {"success": True}
+
+    return app
+
+
+def test_upload_within_limit_passes():
+    """测试未超过限制的上传请求正常处理"""
+    client = TestClient(_create_app())
+    response = client.post("/api/v1/media/upload", content=b"x" * 10)
+    assert response.status_code == 200
+
+
+def test_upload_over_limit_rejected_with_413():
+    """测试超过限制的上传请求直接返回413"""
+    client = TestClient(_create_app())
+    response = client.post("/api/v1/media/upload", content=b"x" * 11)
+    assert response.status_code == 413
+    assert response.json()["error"]["code"] == "PAYLOAD_TOO_LARGE"
+
+
+def test_unlimited_path_not_checked():
+    """测试未配置限制的路径不受影响"""
+    client = TestClient(_create_app())
+    response = client.post("/api/v1/other", content=b"x" * 100)
+    assert response.status_code == 200
+
+
+def test_presigned_url_default_call_served_from_cache():
+    """测试默认过期时间的预签名URL第二次请求直接复用缓存"""
+    cache: dict = {}
+
+    async def cache_get(key):
+        return cache.get(key)
+
+    async def cache_set(key, value, expire=None):
+        cache[key] = value
+        return True
+
+    bucket = Mock()
+    bucket.create_signed_url.return_value = {"signedURL": "https://storage.example.com/signed"}
+    supabase = Mock()
+    supabase.storage.from_.return_value = bucket
+    service = storage_module.StorageService.__new__(storage_module.StorageService)
+    service.bucket_name = "media"
+
+    with patch.object(storage_module, "cache_manager", Mock(get=cache_get, set=cache_set)), \
+            patch.object(storage_module, "supabase", supabase):
+        first = asyncio.run(service.generate_presigned_url("users/a.jpg"))
+        second = asyncio.run(service.generate_presigned_url("users/a.jpg"))
+
+    assert first == second == "https://storage.example.com/signed"
+    bucket.create_signed_url.assert_called_once()